@@ -0,0 +1,68 @@
+"""Benchmark the shared SynthLang normalizer against the old per-module loop.
+
+Usage:
+    python benchmarks/bench_normalize.py [--outputs 20000] [--repeat 5]
+"""
+import argparse
+import random
+import timeit
+from typing import List
+
+from synthlang.core.formatter import normalize_many
+from synthlang.core.types import SynthLangSymbols
+
+def legacy_normalize(text: str) -> str:
+    """Cleanup loop previously duplicated in translator, generator and optimizer."""
+    lines = []
+    for line in text.strip().split('\n'):
+        if not line.strip():
+            continue
+        line = line.replace('->', '=>')
+        line = line.replace('"', '').replace("'", '')
+        if not any(sym in line for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT]):
+            continue
+        if len(line) > 30:
+            parts = line.split(f' {SynthLangSymbols.TRANSFORM} ')
+            if len(parts) > 1:
+                for i, part in enumerate(parts):
+                    if i == 0:
+                        lines.append(f"{part} {SynthLangSymbols.TRANSFORM}")
+                    else:
+                        lines.append(f"  {part}")
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+SAMPLE_LINES = [
+    "↹ data•source",
+    "⊕ sentiment>0 -> pos",
+    '⊕ "filter" => subset',
+    "Σ report + trends",
+    "⊕ analyze customer feedback => summarize findings",
+    "Here is the translation:",
+    "",
+    "Σ insights + trends + recommendations for the team",
+]
+
+def make_outputs(n: int, seed: int = 0) -> List[str]:
+    """Build synthetic model outputs of 4-12 lines each."""
+    rng = random.Random(seed)
+    return ['\n'.join(rng.choice(SAMPLE_LINES) for _ in range(rng.randint(4, 12))) for _ in range(n)]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", type=int, default=20000, help="Number of model outputs")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    outputs = make_outputs(args.outputs)
+    legacy = min(timeit.repeat(lambda: [legacy_normalize(t) for t in outputs], number=1, repeat=args.repeat))
+    shared = min(timeit.repeat(lambda: normalize_many(outputs), number=1, repeat=args.repeat))
+
+    print(f"outputs:         {args.outputs}")
+    print(f"legacy loop:     {legacy * 1000:.1f} ms")
+    print(f"normalize_many:  {shared * 1000:.1f} ms")
+    print(f"speedup:         {legacy / shared:.2f}x")
+
+if __name__ == "__main__":
+    main()
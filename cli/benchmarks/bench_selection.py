@@ -0,0 +1,61 @@
+"""Benchmark indexed selection strategies against the old per-slot tournament.
+
+Usage:
+    python benchmarks/bench_selection.py [--population 5000] [--picks 5000] [--repeat 5]
+"""
+import argparse
+import random
+import timeit
+from typing import Dict, List
+
+from synthlang.core.population import Population
+from synthlang.core.selection import create_selection
+
+def legacy_tournament(population: List[Dict], rng: random.Random, size: int) -> Dict:
+    """Selection previously done for every slot: sample the list, then a linear max."""
+    tournament = rng.sample(population, min(size, len(population)))
+    return max(tournament, key=lambda x: x['fitness']['overall'])
+
+def make_population(n: int, seed: int = 0) -> Population:
+    """Build a population of distinct prompts with random fitness."""
+    rng = random.Random(seed)
+    population = Population()
+    for i in range(n):
+        population.add(f"↹ input{i}\nΣ output{i}", {'overall': rng.random()})
+    return population
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--population", type=int, default=5000, help="Distinct individuals")
+    parser.add_argument("--picks", type=int, default=5000, help="Parents selected per generation")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    population = make_population(args.population)
+    # The old evolver kept one list entry per copy
+    individuals = population.expand()
+
+    def run_legacy():
+        rng = random.Random(0)
+        for _ in range(args.picks):
+            legacy_tournament(individuals, rng, 3)
+
+    print(f"population:      {args.population}")
+    print(f"picks:           {args.picks}")
+    legacy = min(timeit.repeat(run_legacy, number=1, repeat=args.repeat))
+    print(f"legacy:          {legacy * 1000:.1f} ms")
+
+    for name in ('tournament', 'rank', 'proportional', 'elitism'):
+        strategy = create_selection(name)
+
+        def run():
+            rng = random.Random(0)
+            strategy.prepare(population)
+            for _ in range(args.picks):
+                strategy.select(rng)
+
+        elapsed = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{name + ':':<17}{elapsed * 1000:.1f} ms ({legacy / elapsed:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,7 @@ setup(
     install_requires=[
         "click>=8.1.7",
         "dspy-ai>=2.0.0",
+        "numpy>=1.20",
         "python-dotenv>=1.0.0",
         "pydantic>=2.5.2",
         "rich>=13.7.0"
@@ -1,10 +1,7 @@
 """SynthLang CLI package."""
+from typing import TYPE_CHECKING, Any
+
 from synthlang.config import Config, ConfigManager
-from synthlang.core import (
-    SynthLangModule,
-    FrameworkTranslator,
-    SystemPromptGenerator
-)
 
 __version__ = "0.1.2"
 
@@ -16,3 +13,17 @@ __all__ = [
     "SystemPromptGenerator",
     "__version__"
 ]
+
+def __getattr__(name: str) -> Any:
+    # Core modules load DSPy, so only import them when first used
+    if name in ("SynthLangModule", "FrameworkTranslator", "SystemPromptGenerator"):
+        from synthlang import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+if TYPE_CHECKING:
+    from synthlang.core import (
+        SynthLangModule,
+        FrameworkTranslator,
+        SystemPromptGenerator
+    )
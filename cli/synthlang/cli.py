@@ -1,24 +1,22 @@
 """Command-line interface for SynthLang."""
+import functools
 import json
 import os
 import sys
+import time
+import textwrap
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
-import dspy
 
 from synthlang import __version__
 from synthlang.config import Config, ConfigManager
-from synthlang.core import (
-    FrameworkTranslator, 
-    SystemPromptGenerator, 
-    PromptOptimizer,
-    PromptEvolver,
-    PromptManager,
-    PromptClassifier
-)
+
+if TYPE_CHECKING:
+    from synthlang.core import FrameworkTranslator, ResponseCache
+    from synthlang.server import DaemonClient
 
 def load_config() -> Config:
     """Load configuration from environment."""
@@ -47,39 +45,52 @@ def get_api_key() -> str:
         "OPENAI_API_KEY not found in environment or .env file"
     )
 
-@click.group()
-@click.version_option(version=__version__, prog_name="SynthLang CLI")
-def main():
-    """SynthLang CLI - Framework translation and prompt engineering tool."""
-    pass
-
-@main.command()
-@click.option("--source", required=True, help="Natural language prompt to translate")
-@click.option("--framework", required=True, help="Target framework for translation (use 'synthlang' for SynthLang format)")
-@click.option("--show-metrics", is_flag=True, help="Show token and cost metrics")
-def translate(source: str, framework: str, show_metrics: bool):
-    """Translate natural language prompts to SynthLang format.
+def create_lm(config_data: Config, api_key: str) -> Any:
+    """Create the DSPy language model and make it the default.
     
-    Example:
-        synthlang translate \\
-            --source "analyze customer feedback and generate summary" \\
-            --framework synthlang \\
-            --show-metrics
+    DSPy is imported here rather than at module level so that commands which
+    never call a model don't pay for loading the ML stack.
     """
-    if framework.lower() != "synthlang":
-        raise click.ClickException(
-            "Only 'synthlang' is supported as target framework"
-        )
+    import dspy
     
-    config_data = load_config()
-    api_key = get_api_key()
-    
-    # Create language model
     lm = dspy.LM(model=config_data.model, api_key=api_key)
     dspy.configure(lm=lm)
+    return lm
 
-    # Set up translation instructions
-    instructions = """SYNTHLANG TRANSLATION FORMAT:
+def get_response_cache(config_data: Config) -> Optional["ResponseCache"]:
+    """Get the shared LM response cache unless caching is disabled."""
+    from synthlang.core import ResponseCache
+    
+    ctx = click.get_current_context(silent=True)
+    options = ctx.find_object(dict) if ctx else None
+    if (options or {}).get("no_cache") or os.getenv("SYNTHLANG_NO_CACHE"):
+        return None
+    return ResponseCache(
+        path=config_data.cache_path,
+        ttl=config_data.cache_ttl,
+        max_entries=config_data.cache_max_entries
+    )
+
+def get_daemon_client() -> Optional["DaemonClient"]:
+    """Get a client for the running daemon, if one was configured.
+    
+    Commands that can be served by `synthlang serve` forward to the daemon
+    when --daemon or SYNTHLANG_DAEMON_URL is set, skipping config loading
+    and model setup in this process.
+    """
+    ctx = click.get_current_context(silent=True)
+    options = ctx.find_object(dict) if ctx else None
+    url = (options or {}).get("daemon")
+    if not url:
+        return None
+    from synthlang.server import DaemonClient
+    
+    try:
+        return DaemonClient(url)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+TRANSLATION_INSTRUCTIONS = """SYNTHLANG TRANSLATION FORMAT:
 
 RULES:
 1. Use ONLY these symbols: ↹ (input), ⊕ (process), Σ (output)
@@ -112,9 +123,79 @@ BAD EXAMPLES (TOO VERBOSE):
 
 Convert input to concise SynthLang format using minimal symbols."""
 
-    translator = FrameworkTranslator(lm=lm)
+@click.group()
+@click.version_option(version=__version__, prog_name="SynthLang CLI")
+@click.option("--no-cache", is_flag=True, help="Always call the model instead of replaying cached responses")
+@click.option("--daemon", envvar="SYNTHLANG_DAEMON_URL",
+              help="Forward requests to a running 'synthlang serve' daemon "
+                   "(e.g. http://127.0.0.1:8765 or unix:///tmp/synthlang.sock)")
+@click.pass_context
+def main(ctx: click.Context, no_cache: bool, daemon: Optional[str]):
+    """SynthLang CLI - Framework translation and prompt engineering tool."""
+    ctx.ensure_object(dict)
+    ctx.obj["no_cache"] = no_cache
+    ctx.obj["daemon"] = daemon
+
+@main.command()
+@click.option("--source", help="Natural language prompt to translate")
+@click.option("--framework", required=True, help="Target framework for translation (use 'synthlang' for SynthLang format)")
+@click.option("--show-metrics", is_flag=True, help="Show token and cost metrics")
+@click.option("--input-file", type=click.Path(allow_dash=True),
+              help="Translate every record of a JSONL, CSV or plain-text file ('-' for stdin)")
+@click.option("--format", "input_format", type=click.Choice(["jsonl", "csv", "text"]),
+              help="Record format of --input-file (default: from the file suffix; text for stdin)")
+@click.option("--output", type=click.Path(), help="Write batch results as JSONL to this file (default: stdout)")
+@click.option("--workers", default=4, help="Maximum number of concurrent translations in batch mode")
+@click.option("--offset", default=0, help="Skip this many input records in batch mode")
+@click.option("--resume", is_flag=True, help="Skip records already translated in the --output file")
+def translate(source: Optional[str], framework: str, show_metrics: bool, input_file: Optional[str],
+              input_format: Optional[str], output: Optional[str], workers: int, offset: int, resume: bool):
+    """Translate natural language prompts to SynthLang format.
+    
+    Example:
+        synthlang translate \\
+            --source "analyze customer feedback and generate summary" \\
+            --framework synthlang \\
+            --show-metrics
+    
+    Batch example:
+        synthlang translate \\
+            --framework synthlang \\
+            --input-file prompts.jsonl \\
+            --output translated.jsonl \\
+            --workers 16 \\
+            --resume
+    
+    JSONL from stdin:
+        cat prompts.jsonl | synthlang translate --framework synthlang --input-file - --format jsonl
+    """
+    if framework.lower() != "synthlang":
+        raise click.ClickException(
+            "Only 'synthlang' is supported as target framework"
+        )
+    if bool(source) == bool(input_file):
+        raise click.ClickException("Provide exactly one of --source or --input-file")
+    if input_format and not input_file:
+        raise click.ClickException("--format requires --input-file")
+    
+    translator = get_daemon_client()
+    if translator is None:
+        from synthlang.core import FrameworkTranslator
+        
+        config_data = load_config()
+        api_key = get_api_key()
+        
+        # Create language model
+        lm = create_lm(config_data, api_key)
+        
+        translator = FrameworkTranslator(lm=lm, cache=get_response_cache(config_data))
+    
+    if input_file:
+        translate_batch(translator, input_file, output, workers, offset, resume, input_format)
+        return
+        
     try:
-        result = translator.translate(source, instructions)
+        result = translator.translate(source, TRANSLATION_INSTRUCTIONS)
         
         # Calculate metrics if requested
         if show_metrics:
@@ -150,19 +231,98 @@ Convert input to concise SynthLang format using minimal symbols."""
     except Exception as e:
         raise click.ClickException(f"Translation failed: {str(e)}")
 
+def translate_batch(translator: "FrameworkTranslator", input_file: str, output: Optional[str],
+                    workers: int, offset: int, resume: bool, input_format: Optional[str] = None) -> None:
+    """Translate records from a file concurrently, streaming JSONL results.
+    
+    Each result is written as soon as it finishes and carries the index of its
+    input record, so an interrupted run can be resumed with --resume.
+    """
+    from synthlang.core import BatchRunner
+    from synthlang.utils.records import InvalidRecord, read_records
+    
+    # Builtin set() is shadowed by the `config set` command in this module
+    completed = []
+    if resume:
+        if not output:
+            raise click.ClickException("--resume requires --output")
+        if Path(output).exists():
+            with open(output) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Partially written line from a crash
+                    if "error" not in record:
+                        completed.append(record["index"])
+    done = frozenset(completed)
+    
+    invalid = 0
+    
+    def pending():
+        nonlocal invalid
+        for index, text in enumerate(read_records(input_file, input_format)):
+            if index < offset or index in done:
+                continue
+            if isinstance(text, InvalidRecord):
+                # Retrying can't fix a malformed line; record it and move on
+                out.write(json.dumps({"index": index, "error": str(text)}, ensure_ascii=False) + "\n")
+                out.flush()
+                invalid += 1
+                continue
+            yield index, text
+    
+    def run(item):
+        index, text = item
+        return translator.translate(text, TRANSLATION_INSTRUCTIONS)
+    
+    runner = BatchRunner(workers=workers)
+    out = open(output, "a" if resume else "w", encoding="utf-8") if output else sys.stdout
+    if resume and out.tell() > 0:
+        out.write("\n")  # Terminate a line cut short by a crash; blank lines are skipped
+    translated = failed = 0
+    start = time.perf_counter()
+    try:
+        for item in runner.imap(run, pending()):
+            index, text = item['input']
+            record = {"index": index, "source": text}
+            if item['error'] is None:
+                record["target"] = item['result']["target"]
+                record["explanation"] = item['result']["explanation"]
+                translated += 1
+            else:
+                record["error"] = item['error']
+                failed += 1
+            record["latency"] = round(item['latency'], 4)
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+    except Exception as e:
+        raise click.ClickException(f"Translation failed: {str(e)}")
+    finally:
+        if output:
+            out.close()
+    
+    elapsed = time.perf_counter() - start
+    failed += invalid
+    click.echo(f"Translated {translated} records ({failed} failed, {len(done)} resumed) "
+               f"in {elapsed:.2f}s", err=True)
+
 @main.command()
 @click.option("--task", required=True, help="Task description")
 def generate(task: str):
     """Generate system prompts."""
-    config_data = load_config()
-    api_key = get_api_key()
-    
-    # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
-    
-    # Initialize generator with language model
-    generator = SystemPromptGenerator(lm=lm)
+    generator = get_daemon_client()
+    if generator is None:
+        from synthlang.core import SystemPromptGenerator
+        
+        config_data = load_config()
+        api_key = get_api_key()
+        
+        # Create language model
+        lm = create_lm(config_data, api_key)
+        
+        # Initialize generator with language model
+        generator = SystemPromptGenerator(lm=lm, cache=get_response_cache(config_data))
     try:
         result = generator.generate(task)
         click.echo("System prompt generated")
@@ -176,19 +336,65 @@ def generate(task: str):
         raise click.ClickException(f"Generation failed: {str(e)}")
 
 @main.command()
-@click.option("--seed", required=True, help="Initial prompt to evolve")
+@click.option("--seed", help="Initial prompt to evolve")
 @click.option("--generations", default=10, help="Number of evolutionary generations")
 @click.option("--population", default=5, help="Population size per generation")
 @click.option("--mutation-rate", default=0.3, help="Rate of mutation between generations (0-1)")
 @click.option("--tournament-size", default=3, help="Number of prompts competing in each tournament")
+@click.option("--selection", type=click.Choice(['tournament', 'rank', 'proportional', 'elitism']),
+              default='tournament', help="Parent selection strategy")
+@click.option("--elite", default=1, help="Best prompts carried over unchanged with --selection elitism")
+@click.option("--crossover-rate", type=click.FloatRange(0, 1), default=0.0,
+              help="Share of variations made by recombining two parents instead of an LM call (0-1)")
 @click.option("--fitness", type=click.Choice(['clarity', 'specificity', 'task', 'hybrid']), default='hybrid', 
               help="Fitness function for evolution (clarity, specificity, task completion, or hybrid)")
-@click.option("--save-lineage", is_flag=True, help="Save the evolutionary history of prompts")
+@click.option("--save-lineage", is_flag=True, help="Stream the evolutionary history of prompts to a JSONL file")
+@click.option("--lineage-file", type=click.Path(),
+              help="File to stream lineage to (implies --save-lineage; a .gz suffix compresses it)")
 @click.option("--test-cases", type=click.Path(exists=True), help="JSON file with test cases for task-based fitness")
 @click.option("--save-prompt", help="Save the best prompt under this name")
-def evolve(seed: str, generations: int, population: int, mutation_rate: float, 
-           tournament_size: int, fitness: str, save_lineage: bool, test_cases: Optional[str],
-           save_prompt: Optional[str]):
+@click.option("--concurrency", default=8, help="Maximum number of test cases evaluated concurrently")
+@click.option("--fitness-cache", type=click.Path(), help="SQLite file to persist fitness scores across runs")
+@click.option("--workers", default=4, help="Maximum number of mutation calls made concurrently per generation")
+@click.option("--random-seed", type=int, help="Seed for selection and mutation decisions, for reproducible runs")
+@click.option("--checkpoint", type=click.Path(), help="Checkpoint the run to this file (see --checkpoint-every)")
+@click.option("--checkpoint-every", type=click.IntRange(min=1), default=1, help="Write a checkpoint every N generations")
+@click.option("--resume", type=click.Path(exists=True), help="Continue a run from a checkpoint file")
+@click.option("--islands", default=1, help="Evolve this many sub-populations in parallel processes")
+@click.option("--migration-interval", default=5, help="Generations between migrations of the best prompts across islands")
+@click.option("--migration-size", default=1, help="Best prompts each island sends to its neighbour per migration")
+@click.option("--patience", type=int, help="Stop after N generations without improving the best fitness")
+@click.option("--min-diversity", type=click.FloatRange(0, 1),
+              help="Stop once the share of distinct prompts in the population drops below this")
+@click.option("--max-lm-calls", type=int, help="Stop once mutation and evaluation calls reach this budget")
+@click.option("--max-cost", type=float, help="Stop once the reported LM cost reaches this budget")
+@click.option("--surrogate", is_flag=True,
+              help="Skip test-case evaluation of variants a learned model predicts can't beat their parent")
+@click.option("--surrogate-margin", default=0.2,
+              help="Predicted shortfall from the task score needed to beat the parent that skips an evaluation")
+@click.option("--racing", is_flag=True,
+              help="Evaluate variants on growing subsets of test cases and drop ones that can't beat their parent")
+@click.option("--racing-min-cases", default=8, help="Test cases in the first racing round (doubles each round)")
+@click.option("--racing-confidence", type=click.FloatRange(0, 1, max_open=True), default=0.95,
+              help="Confidence required to drop a variant early")
+@click.option("--dedupe-threshold", type=click.FloatRange(0, 1), default=0.9,
+              help="Skip scoring variants at least this similar to another prompt, "
+                   "not counting their own parents (estimated n-gram similarity)")
+@click.option("--pareto", is_flag=True,
+              help="Evolve a front of prompts trading task score against prompt length (NSGA-II)")
+@click.option("--pareto-latency", is_flag=True,
+              help="With --pareto, also minimize the measured test-case latency")
+@click.pass_context
+def evolve(ctx: click.Context, seed: Optional[str], generations: int, population: int, mutation_rate: float, 
+           tournament_size: int, selection: str, elite: int, crossover_rate: float, fitness: str, save_lineage: bool, lineage_file: Optional[str],
+           test_cases: Optional[str],
+           save_prompt: Optional[str], concurrency: int, fitness_cache: Optional[str],
+           workers: int, random_seed: Optional[int], checkpoint: Optional[str],
+           checkpoint_every: int, resume: Optional[str], islands: int,
+           migration_interval: int, migration_size: int, patience: Optional[int],
+           min_diversity: Optional[float], max_lm_calls: Optional[int], max_cost: Optional[float],
+           surrogate: bool, surrogate_margin: float, racing: bool, racing_min_cases: int,
+           racing_confidence: float, dedupe_threshold: float, pareto: bool, pareto_latency: bool):
     """Evolve prompts using genetic algorithms and self-play tournaments.
     
     Example:
@@ -199,15 +405,66 @@ def evolve(seed: str, generations: int, population: int, mutation_rate: float,
             --mutation-rate 0.4 \\
             --tournament-size 4 \\
             --fitness hybrid \\
-            --save-lineage
+            --save-lineage \\
+            --checkpoint run.ckpt
+    
+    Resume after a crash or Ctrl-C (pass the same --test-cases):
+        synthlang evolve --resume run.ckpt
+    
+    Stop early once the best prompt hasn't improved for 3 generations:
+        synthlang evolve --seed "analyze data" --generations 50 --patience 3
+    
+    Island model, 4 sub-populations in separate processes:
+        synthlang evolve --seed "analyze data" --islands 4 --migration-interval 5
+    
+    Pareto front of task score versus prompt length:
+        synthlang evolve --seed "analyze data" --test-cases tests.json --pareto
     """
+    from synthlang.core import FitnessCache, IslandEvolver, ParetoEvolver, PromptEvolver, PromptManager
+    from synthlang.core.islands import dspy_lm
+    from synthlang.core.selection import create_selection
+    from synthlang.core.checkpoint import load_checkpoint
+    from synthlang.core.lineage import LineageWriter
+    
+    resume_state = None
+    if resume:
+        try:
+            resume_state = load_checkpoint(resume)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        # The checkpoint's settings win so the run continues unchanged
+        settings = resume_state['settings']
+        seed = resume_state['seed_prompt']
+        population = settings['population_size']
+        mutation_rate = settings['mutation_rate']
+        tournament_size = settings['tournament_size']
+        selection = settings.get('selection', 'tournament')
+        crossover_rate = settings.get('crossover_rate', 0.0)
+        fitness = settings['fitness_type']
+        if ctx.get_parameter_source("generations") != click.core.ParameterSource.COMMANDLINE:
+            generations = resume_state['n_generations']
+        checkpoint = checkpoint or resume
+    elif not seed:
+        raise click.ClickException("Provide --seed, or --resume to continue from a checkpoint")
+    if islands > 1 and (resume or checkpoint):
+        raise click.ClickException("--checkpoint and --resume are not supported with --islands")
+    if pareto and (islands > 1 or resume or checkpoint):
+        raise click.ClickException("--pareto can't be combined with --islands, --checkpoint or --resume")
+    if pareto_latency and not pareto:
+        raise click.ClickException("--pareto-latency requires --pareto")
+    
+    # Lineage is streamed as the run goes; a resumed run continues its file
+    lineage = None
+    if resume_state and 'lineage_offset' in resume_state['stats']:
+        lineage_file = resume_state['stats']['lineage_path']
+        lineage = LineageWriter(lineage_file, offset=resume_state['stats']['lineage_offset'])
+    elif save_lineage or lineage_file:
+        lineage_file = lineage_file or f"prompt_evolution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        lineage = LineageWriter(lineage_file)
+    
     config_data = load_config()
     api_key = get_api_key()
     
-    # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
-    
     # Load test cases if provided
     test_suite = None
     if test_cases:
@@ -215,15 +472,71 @@ def evolve(seed: str, generations: int, population: int, mutation_rate: float,
             data = json.load(f)
             test_suite = data.get('test_cases', [])
     
+    evolver_options = {
+        'patience': patience,
+        'min_diversity': min_diversity,
+        'max_lm_calls': max_lm_calls,
+        'max_cost': max_cost,
+        'dedupe_threshold': dedupe_threshold,
+        'selection': create_selection(selection, tournament_size, elite),
+        'crossover_rate': crossover_rate,
+        'surrogate': surrogate,
+        'surrogate_margin': surrogate_margin,
+        'racing': racing,
+        'racing_min_cases': racing_min_cases,
+        'racing_confidence': racing_confidence
+    }
+    
     # Initialize evolutionary optimizer
-    optimizer = PromptEvolver(
-        lm=lm,
-        population_size=population,
-        mutation_rate=mutation_rate,
-        tournament_size=tournament_size,
-        fitness_type=fitness,
-        test_cases=test_suite
-    )
+    if islands > 1:
+        # Each worker process creates its own model; fitness is shared through SQLite
+        optimizer = IslandEvolver(
+            lm_factory=functools.partial(dspy_lm, config_data.model, api_key),
+            n_islands=islands,
+            migration_interval=migration_interval,
+            migration_size=migration_size,
+            fitness_cache=fitness_cache,
+            random_seed=random_seed,
+            population_size=population,
+            mutation_rate=mutation_rate,
+            tournament_size=tournament_size,
+            fitness_type=fitness,
+            test_cases=test_suite,
+            max_concurrency=concurrency,
+            workers=workers,
+            **evolver_options
+        )
+    elif pareto:
+        optimizer = ParetoEvolver(
+            lm=create_lm(config_data, api_key),
+            objectives=('quality', 'tokens', 'latency') if pareto_latency else ('quality', 'tokens'),
+            population_size=population,
+            mutation_rate=mutation_rate,
+            tournament_size=tournament_size,
+            fitness_type=fitness,
+            test_cases=test_suite,
+            max_concurrency=concurrency,
+            fitness_cache=FitnessCache(path=fitness_cache),
+            cache=get_response_cache(config_data),
+            workers=workers,
+            random_seed=random_seed,
+            **evolver_options
+        )
+    else:
+        optimizer = PromptEvolver(
+            lm=create_lm(config_data, api_key),
+            population_size=population,
+            mutation_rate=mutation_rate,
+            tournament_size=tournament_size,
+            fitness_type=fitness,
+            test_cases=test_suite,
+            max_concurrency=concurrency,
+            fitness_cache=FitnessCache(path=fitness_cache),
+            cache=get_response_cache(config_data),
+            workers=workers,
+            random_seed=random_seed,
+            **evolver_options
+        )
     
     try:
         # Run evolution
@@ -232,13 +545,31 @@ def evolve(seed: str, generations: int, population: int, mutation_rate: float,
         click.echo(f"- Generations: {generations}")
         click.echo(f"- Population: {population}")
         click.echo(f"- Mutation rate: {mutation_rate}")
-        click.echo(f"- Tournament size: {tournament_size}")
+        if crossover_rate:
+            click.echo(f"- Crossover rate: {crossover_rate}")
+        if pareto:
+            click.echo(f"- Objectives: {', '.join(optimizer.objectives)}")
+        else:
+            click.echo(f"- Selection: {selection}")
+            click.echo(f"- Tournament size: {tournament_size}")
         click.echo(f"- Fitness function: {fitness}")
-        
-        result = optimizer.evolve(
-            seed_prompt=seed,
-            n_generations=generations
-        )
+        if resume_state:
+            click.echo(f"- Resuming after generation {resume_state['generation']}")
+        if islands > 1:
+            click.echo(f"- Islands: {islands} (migration every {migration_interval} generations)")
+            result = optimizer.evolve(seed_prompt=seed, n_generations=generations)
+            if lineage:
+                for record in result['lineage']:
+                    lineage.write_generation(record['generation'], record['population'])
+        else:
+            result = optimizer.evolve(
+                seed_prompt=seed,
+                n_generations=generations,
+                checkpoint_path=checkpoint,
+                checkpoint_every=checkpoint_every,
+                resume_state=resume_state,
+                lineage=lineage
+            )
         
         # Display results
         click.echo("\nEvolution complete!")
@@ -250,17 +581,42 @@ def evolve(seed: str, generations: int, population: int, mutation_rate: float,
         click.echo(f"- Task completion: {float(result['fitness']['task_score']):.2f}")
         click.echo(f"- Overall fitness: {float(result['fitness']['overall']):.2f}")
         
+        if pareto:
+            click.echo(f"\nPareto front ({len(result['front'])} prompts, fewest tokens first):")
+            for entry in result['front']:
+                line = (f"- {entry['tokens']} tokens, task {entry['fitness']['task_score']:.2f}, "
+                        f"overall {entry['fitness']['overall']:.2f}")
+                if 'latency' in entry:
+                    line += f", {entry['latency']:.2f}s"
+                click.echo(line)
+                click.echo(textwrap.indent(entry['prompt'], '    '))
+        
         click.echo("\nEvolution metrics:")
         click.echo(f"- Generations completed: {result['generations']}")
+        click.echo(f"- Stop reason: {result['stop_reason']}")
         click.echo(f"- Total variants created: {result['total_variants']}")
+        click.echo(f"- Near-duplicates skipped: {result['near_duplicates']}")
+        click.echo(f"- Mutation calls: {result['mutation_calls']}")
+        click.echo(f"- Crossovers: {result['crossovers']}")
+        click.echo(f"- Evaluation calls: {result['eval_calls']}")
+        if racing:
+            click.echo(f"- Variants dropped by racing: {result['racing_dropped']}")
+        if surrogate:
+            click.echo(f"- Evaluations skipped by surrogate: {result['surrogate_skipped']}")
+            if result['surrogate_mae'] is not None:
+                click.echo(f"- Surrogate mean absolute error: {result['surrogate_mae']:.3f}")
+        if result['lm_cost']:
+            click.echo(f"- LM cost: ${result['lm_cost']:.4f}")
         click.echo(f"- Successful mutations: {result['successful_mutations']}")
         click.echo(f"- Tournament winners: {result['tournament_winners']}")
+        click.echo(f"- Fitness cache hits: {result['cache_hits']}")
+        click.echo(f"- Fitness cache misses: {result['cache_misses']}")
+        if islands > 1:
+            click.echo(f"- Migrated prompts: {result['migrations']}")
+        if checkpoint:
+            click.echo(f"- Checkpoint: {checkpoint}")
         
-        # Save evolutionary history if requested
-        if save_lineage:
-            lineage_file = f"prompt_evolution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(lineage_file, 'w') as f:
-                json.dump(result['lineage'], f, indent=2)
+        if lineage:
             click.echo(f"\nEvolutionary history saved to: {lineage_file}")
             
         # Save best prompt if requested
@@ -271,7 +627,7 @@ def evolve(seed: str, generations: int, population: int, mutation_rate: float,
                 result["best_prompt"],
                 {
                     'fitness': result['fitness'],
-                    'generations': generations,
+                    'generations': result['generations'],
                     'evolution_metrics': {
                         'total_variants': result['total_variants'],
                         'successful_mutations': result['successful_mutations'],
@@ -283,20 +639,67 @@ def evolve(seed: str, generations: int, population: int, mutation_rate: float,
             
     except Exception as e:
         raise click.ClickException(f"Evolution failed: {str(e)}")
+    finally:
+        if lineage:
+            lineage.close()
 
 @main.command()
-@click.option("--prompt", required=True, help="Prompt to optimize")
-def optimize(prompt: str):
-    """Optimize prompts using DSPy techniques."""
+@click.option("--host", default="127.0.0.1", help="Host to listen on")
+@click.option("--port", default=8765, help="Port to listen on")
+@click.option("--socket", "socket_path", type=click.Path(), help="Listen on this Unix socket instead of TCP")
+@click.option("--max-concurrency", default=8, help="Maximum number of model calls in flight across all requests")
+def serve(host: str, port: int, socket_path: Optional[str], max_concurrency: int):
+    """Run a long-lived daemon with warm SynthLang modules.
+    
+    Other CLI invocations forward to it with --daemon or SYNTHLANG_DAEMON_URL.
+    
+    Example:
+        synthlang serve --socket /tmp/synthlang.sock &
+        SYNTHLANG_DAEMON_URL=unix:///tmp/synthlang.sock \\
+            synthlang translate --source "..." --framework synthlang
+    """
+    from synthlang.server import SynthLangService, create_server
+    
     config_data = load_config()
     api_key = get_api_key()
+    lm = create_lm(config_data, api_key)
+    service = SynthLangService(
+        lm=lm,
+        cache=get_response_cache(config_data),
+        max_concurrency=max_concurrency
+    )
+    try:
+        server = create_server(service, host=host, port=port, socket_path=socket_path)
+    except OSError as e:
+        raise click.ClickException(f"Could not start daemon: {str(e)}")
     
-    # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
-    
-    # Initialize optimizer with language model
-    optimizer = PromptOptimizer(lm=lm)
+    address = f"unix://{socket_path}" if socket_path else f"http://{host}:{server.server_address[1]}"
+    click.echo(f"SynthLang daemon listening on {address}", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+@main.command()
+@click.option("--prompt", required=True, help="Prompt to optimize")
+def optimize(prompt: str):
+    """Optimize prompts using DSPy techniques."""
+    optimizer = get_daemon_client()
+    if optimizer is None:
+        from synthlang.core import PromptOptimizer
+        
+        config_data = load_config()
+        api_key = get_api_key()
+        
+        # Create language model
+        lm = create_lm(config_data, api_key)
+        
+        # Initialize optimizer with language model
+        optimizer = PromptOptimizer(lm=lm, cache=get_response_cache(config_data))
     try:
         result = optimizer.optimize(prompt)
         click.echo("Prompt optimized")
@@ -314,6 +717,51 @@ def optimize(prompt: str):
     except Exception as e:
         raise click.ClickException(f"Optimization failed: {str(e)}")
 
+@main.command()
+@click.option("--input-file", required=True, type=click.Path(allow_dash=True),
+              help="JSONL, CSV or plain-text file of prompts, one per line ('-' for stdin)")
+@click.option("--fitness", type=click.Choice(['clarity', 'specificity', 'hybrid']), default='hybrid',
+              help="Heuristic used to rank prompts")
+@click.option("--top", default=10, help="Number of top-ranked prompts to show")
+@click.option("--output", type=click.Path(), help="Write every ranked prompt with its scores as JSONL")
+def score(input_file: str, fitness: str, top: int, output: Optional[str]):
+    """Rank prompts by heuristic fitness without calling a model.
+    
+    Example:
+        synthlang score --input-file library.jsonl --top 20 --output ranked.jsonl
+    """
+    from synthlang.core.scoring import rank_prompts
+    from synthlang.utils.records import InvalidRecord, read_records
+    
+    prompts = []
+    try:
+        for text in read_records(input_file):
+            if isinstance(text, InvalidRecord):
+                click.echo(f"Skipping {text}", err=True)
+            else:
+                prompts.append(text)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(f"Failed to read prompts: {str(e)}")
+    if not prompts:
+        raise click.ClickException("No prompts found in input")
+    
+    start = time.perf_counter()
+    ranked = rank_prompts(prompts, fitness_type=fitness)
+    elapsed = time.perf_counter() - start
+    
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            for rank, item in enumerate(ranked, 1):
+                f.write(json.dumps({"rank": rank, "prompt": prompts[item["index"]], **item},
+                                   ensure_ascii=False) + "\n")
+    
+    click.echo(f"Scored {len(prompts)} prompts in {elapsed:.3f}s")
+    for rank, item in enumerate(ranked[:top], 1):
+        first_line = prompts[item["index"]].strip().split("\n")[0]
+        click.echo(f"\n{rank}. {first_line}")
+        click.echo(f"   Overall: {item['overall']:.2f}  Clarity: {item['clarity']:.2f}  "
+                   f"Specificity: {item['specificity']:.2f}")
+
 @main.group()
 def prompt():
     """Manage evolved prompts."""
@@ -325,6 +773,8 @@ def prompt():
 @click.option("--metadata", help="Optional JSON metadata")
 def save(name: str, prompt: str, metadata: Optional[str] = None):
     """Save a prompt with metadata."""
+    from synthlang.core import PromptManager
+    
     try:
         manager = PromptManager()
         meta_dict = json.loads(metadata) if metadata else None
@@ -337,6 +787,8 @@ def save(name: str, prompt: str, metadata: Optional[str] = None):
 @click.option("--name", required=True, help="Name of prompt to load")
 def load(name: str):
     """Load a saved prompt."""
+    from synthlang.core import PromptManager
+    
     try:
         manager = PromptManager()
         data = manager.load(name)
@@ -350,11 +802,29 @@ def load(name: str):
         raise click.ClickException(f"Failed to load prompt: {str(e)}")
 
 @prompt.command()
-def list():
-    """List all saved prompts."""
+@click.option("--limit", default=50, help="Maximum number of prompts to show")
+@click.option("--offset", default=0, help="Number of prompts to skip")
+@click.option("--sort", type=click.Choice(["name", "created", "fitness"]), default="name",
+              help="Sort order (created and fitness list newest/best first)")
+@click.option("--min-fitness", type=float, help="Only show prompts with at least this overall fitness")
+@click.option("--since", type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"]),
+              help="Only show prompts created on or after this date")
+@click.option("--tag", help="Only show prompts with this tag")
+def list(limit: int, offset: int, sort: str, min_fitness: Optional[float],
+         since: Optional[datetime], tag: Optional[str]):
+    """List saved prompts."""
+    from synthlang.core import PromptManager
+    
     try:
         manager = PromptManager()
-        prompts = manager.list()
+        prompts = manager.list_metadata(
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            min_fitness=min_fitness,
+            since=since.isoformat() if since else None,
+            tag=tag
+        )
         if not prompts:
             click.echo("No saved prompts found")
             return
@@ -362,9 +832,13 @@ def list():
         click.echo("\nSaved prompts:")
         for p in prompts:
             click.echo(f"\nName: {p['name']}")
-            click.echo(f"Created: {p['metadata'].get('created', 'unknown')}")
-            if 'fitness' in p['metadata']:
-                click.echo(f"Fitness: {p['metadata']['fitness']:.2f}")
+            click.echo(f"Created: {p['created'] or 'unknown'}")
+            if p['fitness'] is not None:
+                click.echo(f"Fitness: {p['fitness']:.2f}")
+            if p['tags']:
+                click.echo(f"Tags: {', '.join(p['tags'])}")
+        if len(prompts) == limit:
+            click.echo(f"\nShowing {limit} prompts; use --offset {offset + limit} for more")
     except Exception as e:
         raise click.ClickException(f"Failed to list prompts: {str(e)}")
 
@@ -372,6 +846,8 @@ def list():
 @click.option("--name", required=True, help="Name of prompt to delete")
 def delete(name: str):
     """Delete a saved prompt."""
+    from synthlang.core import PromptManager
+    
     try:
         manager = PromptManager()
         manager.delete(name)
@@ -384,6 +860,8 @@ def delete(name: str):
 @click.option("--prompt2", required=True, help="Second prompt name")
 def compare(prompt1: str, prompt2: str):
     """Compare two saved prompts."""
+    from synthlang.core import PromptManager
+    
     try:
         manager = PromptManager()
         result = manager.compare(prompt1, prompt2)
@@ -420,6 +898,18 @@ def compare(prompt1: str, prompt2: str):
     except Exception as e:
         raise click.ClickException(f"Failed to compare prompts: {str(e)}")
 
+@prompt.command()
+def migrate():
+    """Migrate saved prompts from JSON files to the indexed SQLite backend."""
+    from synthlang.core import PromptManager
+    
+    try:
+        manager = PromptManager(backend="json")
+        count = manager.migrate()
+        click.echo(f"Migrated {count} prompts to: {manager.store.db_path}")
+    except Exception as e:
+        raise click.ClickException(f"Failed to migrate prompts: {str(e)}")
+
 @main.group()
 def classify():
     """Classify and finetune prompts."""
@@ -431,42 +921,122 @@ def classify():
 @click.option("--model", type=click.Path(exists=True), help="Path to saved classifier model")
 def predict(text: str, labels: str, model: Optional[str] = None):
     """Classify a piece of text."""
+    label_list = [l.strip() for l in labels.split(",")]
+    client = get_daemon_client()
+    if client is not None and not model:
+        try:
+            print_classification(client.classify(text, label_list))
+        except Exception as e:
+            raise click.ClickException(f"Classification failed: {str(e)}")
+        return
+    
+    from synthlang.core import PromptClassifier
+    
     config_data = load_config()
     api_key = get_api_key()
     
     # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
+    lm = create_lm(config_data, api_key)
     
     # Initialize classifier
-    label_list = [l.strip() for l in labels.split(",")]
-    classifier = PromptClassifier(lm=lm, labels=label_list)
+    classifier = PromptClassifier(lm=lm, labels=label_list, cache=get_response_cache(config_data))
     
     # Load saved model if provided
     if model:
         classifier.load(model)
         
     try:
-        result = classifier.classify(text)
-        click.echo("\nClassification result:")
-        click.echo(f"Input: {result['input']}")
-        click.echo(f"Label: {result['label']}")
-        click.echo(f"Explanation: {result['explanation']}")
+        print_classification(classifier.classify(text))
     except Exception as e:
         raise click.ClickException(f"Classification failed: {str(e)}")
 
+def print_classification(result: dict) -> None:
+    """Print a single classification result."""
+    click.echo("\nClassification result:")
+    click.echo(f"Input: {result['input']}")
+    click.echo(f"Label: {result['label']}")
+    click.echo(f"Explanation: {result['explanation']}")
+
+@classify.command()
+@click.option("--input-file", required=True, type=click.Path(exists=True),
+              help="JSON file with texts/examples, or a plain-text file with one text per line")
+@click.option("--labels", required=True, help="Comma-separated list of possible labels")
+@click.option("--model", type=click.Path(exists=True), help="Path to saved classifier model")
+@click.option("--workers", default=4, help="Maximum number of concurrent classification calls")
+@click.option("--retries", default=2, help="Retries per text before it is recorded as failed")
+@click.option("--output", type=click.Path(), help="Write results as JSON to this file")
+def batch(input_file: str, labels: str, model: Optional[str], workers: int, retries: int,
+          output: Optional[str]):
+    """Classify many texts concurrently.
+    
+    Example:
+        synthlang classify batch \\
+            --input-file prompts.txt \\
+            --labels "analysis,generation,translation" \\
+            --workers 16 \\
+            --output labels.json
+    """
+    from synthlang.core import PromptClassifier
+    
+    config_data = load_config()
+    api_key = get_api_key()
+    
+    # Create language model
+    lm = create_lm(config_data, api_key)
+    
+    # Load texts
+    with open(input_file) as f:
+        if input_file.endswith(".json"):
+            data = json.load(f)
+            texts = data.get("texts") or [e["input"] for e in data.get("examples", [])]
+        else:
+            texts = [line.strip() for line in f if line.strip()]
+    
+    # Initialize classifier
+    label_list = [l.strip() for l in labels.split(",")]
+    classifier = PromptClassifier(lm=lm, labels=label_list, cache=get_response_cache(config_data))
+    
+    # Load saved model if provided
+    if model:
+        classifier.load(model)
+        
+    try:
+        start = time.perf_counter()
+        results = classifier.batch_classify(texts, workers=workers, max_retries=retries)
+        elapsed = time.perf_counter() - start
+        failed = sum(1 for result in results if "error" in result)
+        
+        if output:
+            with open(output, 'w') as f:
+                json.dump(results, f, indent=2)
+        else:
+            for result in results:
+                click.echo(f"{result['label']}\t{result['input']}")
+        
+        click.echo("\nBatch classification complete!")
+        click.echo(f"Texts classified: {len(results) - failed}")
+        click.echo(f"Failed: {failed}")
+        click.echo(f"Elapsed: {elapsed:.2f}s")
+        click.echo(f"Throughput: {len(results) / elapsed if elapsed > 0 else 0.0:.2f} texts/s")
+        click.echo(f"Mean latency: {sum(r['latency'] for r in results) / len(results) if results else 0.0:.2f}s")
+        if output:
+            click.echo(f"\nResults saved to: {output}")
+    except Exception as e:
+        raise click.ClickException(f"Batch classification failed: {str(e)}")
+
 @classify.command()
 @click.option("--train-data", required=True, type=click.Path(exists=True), help="JSON file with training data")
 @click.option("--labels", required=True, help="Comma-separated list of possible labels")
 @click.option("--save-model", help="Path to save trained model")
 def train(train_data: str, labels: str, save_model: Optional[str] = None):
     """Train a classifier on examples."""
+    from synthlang.core import PromptClassifier
+    
     config_data = load_config()
     api_key = get_api_key()
     
     # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
+    lm = create_lm(config_data, api_key)
     
     # Load training data
     with open(train_data) as f:
@@ -497,12 +1067,13 @@ def train(train_data: str, labels: str, save_model: Optional[str] = None):
 @click.option("--model", required=True, type=click.Path(exists=True), help="Path to saved classifier model")
 def evaluate(test_data: str, model: str):
     """Evaluate a trained classifier."""
+    from synthlang.core import PromptClassifier
+    
     config_data = load_config()
     api_key = get_api_key()
     
     # Create language model
-    lm = dspy.LM(model=config_data.model, api_key=api_key)
-    dspy.configure(lm=lm)
+    lm = create_lm(config_data, api_key)
     
     # Load test data
     with open(test_data) as f:
@@ -510,7 +1081,7 @@ def evaluate(test_data: str, model: str):
         examples = data.get("examples", [])
         
     # Load classifier
-    classifier = PromptClassifier(lm=lm, labels=[])  # Labels will be loaded from model
+    classifier = PromptClassifier(lm=lm, labels=[], cache=get_response_cache(config_data))  # Labels will be loaded from model
     classifier.load(model)
     
     try:
@@ -548,5 +1119,46 @@ def set(key: str, value: str):
     except Exception as e:
         raise click.ClickException(f"Failed to update configuration: {str(e)}")
 
+@main.group()
+def cache():
+    """Manage the LM response cache."""
+    pass
+
+@cache.command()
+def stats():
+    """Show response cache statistics."""
+    from synthlang.core import ResponseCache
+    
+    config_data = load_config()
+    try:
+        response_cache = ResponseCache(
+            path=config_data.cache_path,
+            ttl=config_data.cache_ttl,
+            max_entries=config_data.cache_max_entries
+        )
+        cache_stats = response_cache.stats()
+        click.echo("Response cache:")
+        click.echo(f"- Path: {cache_stats['path']}")
+        click.echo(f"- Entries: {cache_stats['entries']} (max {config_data.cache_max_entries})")
+        click.echo(f"- Expired: {cache_stats['expired']}")
+        click.echo(f"- Hits: {cache_stats['hits']}")
+        click.echo(f"- Misses: {cache_stats['misses']}")
+        click.echo(f"- Size: {cache_stats['size_bytes'] / 1024:.1f} KiB")
+    except Exception as e:
+        raise click.ClickException(f"Failed to read cache: {str(e)}")
+
+@cache.command()
+def clear():
+    """Remove all cached responses."""
+    from synthlang.core import ResponseCache
+    
+    config_data = load_config()
+    try:
+        response_cache = ResponseCache(path=config_data.cache_path)
+        removed = response_cache.clear()
+        click.echo(f"Cleared {removed} cached responses")
+    except Exception as e:
+        raise click.ClickException(f"Failed to clear cache: {str(e)}")
+
 if __name__ == "__main__":
     main()
@@ -12,6 +12,10 @@ class Config(BaseModel):
     model: str = Field(default_factory=lambda: os.getenv("SYNTHLANG_MODEL", "gpt-4o-mini"))
     environment: str = Field(default_factory=lambda: os.getenv("SYNTHLANG_ENVIRONMENT", "production"))
     log_level: str = Field(default_factory=lambda: os.getenv("SYNTHLANG_LOG_LEVEL", "INFO"))
+    cache_path: str = Field(default_factory=lambda: os.getenv("SYNTHLANG_CACHE_PATH", "~/.synthlang/cache/responses.db"))
+    cache_ttl: int = Field(default_factory=lambda: int(os.getenv("SYNTHLANG_CACHE_TTL", str(7 * 24 * 3600))))
+    cache_max_entries: int = Field(default_factory=lambda: int(os.getenv("SYNTHLANG_CACHE_MAX_ENTRIES", "10000")))
+    prompt_backend: str = Field(default_factory=lambda: os.getenv("SYNTHLANG_PROMPT_BACKEND", "auto"))
 
     class Config:
         env_file = ".env"
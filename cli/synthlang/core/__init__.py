@@ -1,30 +1,74 @@
-"""Core module exports for SynthLang."""
-from .base import SynthLangModule
-from .translator import FrameworkTranslator
-from .generator import SystemPromptGenerator
-from .optimizer import PromptOptimizer
-from .evolver import PromptEvolver
-from .prompt_manager import PromptManager
-from .classifier import PromptClassifier
-from .types import (
-    TranslationResult,
-    GenerationResult,
-    OptimizationResult,
-    SynthLangSymbols,
-    FormatRules
-)
+"""Core module exports for SynthLang.
 
-__all__ = [
-    'SynthLangModule',
-    'FrameworkTranslator',
-    'SystemPromptGenerator',
-    'PromptOptimizer',
-    'PromptEvolver',
-    'PromptManager',
-    'PromptClassifier',
-    'TranslationResult',
-    'GenerationResult',
-    'OptimizationResult',
-    'SynthLangSymbols',
-    'FormatRules'
-]
+Modules are imported on first attribute access so that importing the
+package (and commands that never call a model) doesn't load DSPy.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'SynthLangModule': '.base',
+    'FrameworkTranslator': '.translator',
+    'SystemPromptGenerator': '.generator',
+    'PromptOptimizer': '.optimizer',
+    'PromptEvolver': '.evolver',
+    'IslandEvolver': '.islands',
+    'ParetoEvolver': '.pareto',
+    'Population': '.population',
+    'MinHashIndex': '.population',
+    'PromptManager': '.prompt_manager',
+    'PromptStore': '.prompt_store',
+    'JSONPromptStore': '.prompt_store',
+    'SQLitePromptStore': '.prompt_store',
+    'PromptClassifier': '.classifier',
+    'BatchRunner': '.batch',
+    'FitnessCache': '.cache',
+    'ResponseCache': '.cache',
+    'normalize_many': '.formatter',
+    'parse': '.parser',
+    'validate': '.parser',
+    'TranslationResult': '.types',
+    'GenerationResult': '.types',
+    'OptimizationResult': '.types',
+    'BatchReport': '.types',
+    'SynthLangSymbols': '.types',
+    'FormatRules': '.types'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
+if TYPE_CHECKING:
+    from .base import SynthLangModule
+    from .translator import FrameworkTranslator
+    from .generator import SystemPromptGenerator
+    from .optimizer import PromptOptimizer
+    from .evolver import PromptEvolver
+    from .islands import IslandEvolver
+    from .pareto import ParetoEvolver
+    from .population import MinHashIndex, Population
+    from .prompt_manager import PromptManager
+    from .prompt_store import PromptStore, JSONPromptStore, SQLitePromptStore
+    from .classifier import PromptClassifier
+    from .batch import BatchRunner
+    from .cache import FitnessCache, ResponseCache
+    from .formatter import normalize_many
+    from .parser import parse, validate
+    from .types import (
+        TranslationResult,
+        GenerationResult,
+        OptimizationResult,
+        BatchReport,
+        SynthLangSymbols,
+        FormatRules
+    )
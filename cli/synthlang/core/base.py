@@ -1,16 +1,133 @@
 """Base module for SynthLang DSPy implementations."""
-from typing import Any
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
 import dspy
 
+from .cache import ResponseCache, data_digest
+
+# Threads shared by the async API of all modules
+ASYNC_WORKERS = 32
+
+_async_executor: Optional[ThreadPoolExecutor] = None
+_async_executor_lock = threading.Lock()
+
+def get_async_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs blocking LM calls for the async API."""
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=ASYNC_WORKERS, thread_name_prefix="synthlang-async"
+            )
+        return _async_executor
+
 class SynthLangModule(dspy.Module):
     """Base module for SynthLang DSPy implementations."""
-    
-    def __init__(self, lm: Any):
+
+    def __init__(self, lm: Any, cache: Optional[ResponseCache] = None, configure: bool = True):
         """Initialize module with language model.
-        
+
         Args:
             lm: DSPy language model instance
+            cache: Optional response cache shared between modules
+            configure: Make lm DSPy's global default. DSPy only lets the
+                thread that first configured it do so, so modules built on
+                other threads (e.g. in the daemon) pass False; their own
+                calls run under dspy.context either way.
         """
         super().__init__()
         self.lm = lm
-        dspy.configure(lm=self.lm)
+        self.cache = cache
+        if configure:
+            dspy.configure(lm=self.lm)
+
+    def _cached_call(self, signature: str, inputs: Dict[str, Any],
+                     call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run an LM call through the response cache.
+
+        Args:
+            signature: Identifier of the signature and instructions used
+            inputs: Rendered inputs sent to the model
+            call: Callable performing the LM call and returning output fields
+
+        Returns:
+            Output fields, replayed from the cache when available
+        """
+        if self.cache is None:
+            return call()
+
+        key = ResponseCache.make_key(
+            model=str(getattr(self.lm, 'model', '')),
+            signature=signature,
+            inputs=inputs,
+            temperature=getattr(self.lm, 'kwargs', {}).get('temperature')
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        outputs = call()
+        self.cache.put(key, outputs)
+        return outputs
+
+    def _predict(self, predictor: Any, **inputs: Any) -> Any:
+        """Call a DSPy predictor, replaying cached responses when available.
+
+        Args:
+            predictor: DSPy predictor to call
+            **inputs: Predictor inputs
+
+        Returns:
+            Prediction from the model or the cache
+        """
+        if self.cache is None:
+            with dspy.context(lm=self.lm):
+                return predictor(**inputs)
+
+        signature = getattr(predictor, 'signature', predictor)
+        signature_id = (
+            f"{getattr(signature, '__name__', type(signature).__name__)}:"
+            f"{data_digest(str(getattr(signature, 'instructions', '')))}"
+        )
+
+        def call() -> Dict[str, Any]:
+            with dspy.context(lm=self.lm):
+                result = predictor(**inputs)
+            return {k: str(v) for k, v in result.items()}
+
+        return dspy.Prediction(**self._cached_call(signature_id, inputs, call))
+
+    async def _arun(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None,
+                    cancel_event: Optional[threading.Event] = None) -> Any:
+        """Run a blocking method without blocking the event loop.
+        
+        The call runs on the shared async executor, so any number of
+        coroutines can wait on it while at most ASYNC_WORKERS LM calls are
+        in flight.
+        
+        Args:
+            fn: Blocking method to run
+            *args: Arguments for fn
+            timeout: Optional timeout in seconds, including time spent queued
+            cancel_event: Optional event set when the caller is cancelled or
+                times out, for long-running methods that check it
+            
+        Returns:
+            Result of fn
+            
+        Raises:
+            asyncio.TimeoutError: If the call does not finish within timeout
+            asyncio.CancelledError: If the awaiting task is cancelled
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(get_async_executor(), functools.partial(fn, *args))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            # A call already running can't be interrupted; let it know to stop
+            if cancel_event is not None:
+                cancel_event.set()
+            raise
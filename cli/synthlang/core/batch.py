@@ -0,0 +1,129 @@
+"""Bounded-concurrency batch execution for SynthLang modules."""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, List
+
+from .types import BatchItemResult, BatchReport
+
+class BatchRunner:
+    """Runs a callable over many items with a bounded worker pool.
+
+    LM calls are I/O bound, so a thread pool lets many requests be in flight
+    at once while the number of concurrent calls stays capped at ``workers``.
+    Failing items are retried with exponential backoff and recorded as errors
+    instead of aborting the batch.
+    """
+
+    def __init__(self, workers: int = 4, max_retries: int = 2, retry_delay: float = 0.5):
+        """Initialize batch runner.
+
+        Args:
+            workers: Maximum number of items processed concurrently
+            max_retries: Retries per item after the first failed attempt
+            retry_delay: Base delay in seconds between retries (doubled each retry)
+
+        Raises:
+            ValueError: If workers or max_retries are out of range
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    def _call(self, fn: Callable[[Any], Any], index: int, item: Any) -> BatchItemResult:
+        """Run fn on a single item, retrying on failure."""
+        start = time.perf_counter()
+        attempts = 0
+        result = None
+        error = None
+        while True:
+            attempts += 1
+            try:
+                result = fn(item)
+                error = None
+                break
+            except Exception as e:
+                error = f"{type(e).__name__}: {str(e)}"
+                if attempts > self.max_retries:
+                    break
+                if self.retry_delay > 0:
+                    time.sleep(self.retry_delay * 2 ** (attempts - 1))
+
+        return {
+            'index': index,
+            'input': item,
+            'result': result,
+            'error': error,
+            'attempts': attempts,
+            'latency': time.perf_counter() - start
+        }
+
+    def imap(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[BatchItemResult]:
+        """Yield item outcomes as soon as each one finishes.
+
+        Items are pulled from the iterable lazily so that at most a small
+        multiple of ``workers`` items is held in memory at any time.
+
+        Args:
+            fn: Callable applied to each item
+            items: Items to process
+
+        Yields:
+            Item outcomes in completion order
+        """
+        iterator = enumerate(items)
+        max_pending = self.workers * 2
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    try:
+                        index, item = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.add(executor.submit(self._call, fn, index, item))
+
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    def run(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> BatchReport:
+        """Run fn over all items and collect an ordered report.
+
+        Args:
+            fn: Callable applied to each item
+            items: Items to process
+
+        Returns:
+            Dictionary containing:
+                - items: Per-item outcomes in input order
+                - succeeded: Number of items that produced a result
+                - failed: Number of items that failed after all retries
+                - elapsed: Wall-clock seconds for the whole batch
+                - throughput: Items processed per second
+                - mean_latency: Mean per-item latency in seconds
+        """
+        start = time.perf_counter()
+        outcomes: List[BatchItemResult] = sorted(self.imap(fn, items), key=lambda x: x['index'])
+        elapsed = time.perf_counter() - start
+
+        failed = sum(1 for o in outcomes if o['error'] is not None)
+        total = len(outcomes)
+
+        return {
+            'items': outcomes,
+            'succeeded': total - failed,
+            'failed': failed,
+            'elapsed': elapsed,
+            'throughput': total / elapsed if elapsed > 0 else 0.0,
+            'mean_latency': sum(o['latency'] for o in outcomes) / total if total else 0.0
+        }
@@ -0,0 +1,374 @@
+"""Caching utilities for SynthLang modules."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so trivially different strings share a cache key.
+
+    Collapses runs of whitespace within each line and drops blank lines.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Normalized prompt text
+    """
+    lines = (' '.join(line.split()) for line in prompt.strip().split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+def prompt_digest(prompt: str) -> str:
+    """Get a content hash of a normalized prompt."""
+    return hashlib.sha256(normalize_prompt(prompt).encode('utf-8')).hexdigest()
+
+def data_digest(data: Any) -> str:
+    """Get a stable content hash of JSON-serializable data."""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a SQLite database shared between worker threads and processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Island workers write the same file concurrently; wait on locks rather than fail
+    return sqlite3.connect(str(path), check_same_thread=False, timeout=30.0)
+
+class LRUCache:
+    """Thread-safe in-memory least-recently-used cache."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value and mark it as recently used."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class FitnessCache:
+    """Content-addressed memo of prompt fitness scores.
+
+    Entries are keyed by a namespace describing the fitness configuration
+    plus the hash of the normalized prompt. Lookups go to an in-memory LRU
+    first and fall back to an optional SQLite file that persists across runs.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None):
+        """Initialize fitness cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+            path: Optional SQLite file for persistent storage
+        """
+        self.memory = LRUCache(maxsize)
+        self.path = Path(path).expanduser() if path else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        if self.path:
+            self._conn = _connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fitness ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def namespace(fitness_type: str, test_cases: Optional[List[Dict]], model: str) -> str:
+        """Build the namespace for a fitness configuration.
+
+        Args:
+            fitness_type: Type of fitness function
+            test_cases: Test cases used for task fitness
+            model: Model used for task evaluation
+
+        Returns:
+            Namespace string to pass to get() and put()
+        """
+        return data_digest({
+            'fitness_type': fitness_type,
+            'test_cases': data_digest(test_cases or []),
+            'model': model
+        })[:16]
+
+    def _key(self, namespace: str, prompt: str) -> str:
+        return f"{namespace}:{prompt_digest(prompt)}"
+
+    def get(self, namespace: str, prompt: str) -> Optional[Dict[str, float]]:
+        """Look up cached fitness for a prompt.
+
+        Args:
+            namespace: Fitness configuration namespace
+            prompt: Prompt text
+
+        Returns:
+            Copy of the cached fitness scores, or None on a miss
+        """
+        key = self._key(namespace, prompt)
+        value = self.memory.get(key)
+        if value is None and self._conn is not None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM fitness WHERE key = ?", (key,)
+                ).fetchone()
+            if row:
+                value = json.loads(row[0])
+                self.memory.put(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return dict(value)
+
+    def put(self, namespace: str, prompt: str, fitness: Dict[str, float]) -> None:
+        """Store fitness scores for a prompt.
+
+        Args:
+            namespace: Fitness configuration namespace
+            prompt: Prompt text
+            fitness: Fitness scores to cache
+        """
+        key = self._key(namespace, prompt)
+        self.memory.put(key, dict(fitness))
+        if self._conn is not None:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO fitness (key, value, created) VALUES (?, ?, ?)",
+                    (key, json.dumps(fitness), time.time())
+                )
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache hit/miss counts."""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.memory)}
+
+    def close(self) -> None:
+        """Close the persistent store."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+def _flush_usage(conn: sqlite3.Connection, lock: threading.Lock, usage: Dict[str, Any]) -> None:
+    """Write deferred access times and hit/miss counts of a ResponseCache."""
+    with lock:
+        if not (usage['accessed'] or usage['hits'] or usage['misses']):
+            return
+        conn.executemany(
+            "UPDATE responses SET accessed = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in usage['accessed'].items()]
+        )
+        conn.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            [(name, usage[name]) for name in ('hits', 'misses') if usage[name]]
+        )
+        conn.commit()
+        usage['accessed'].clear()
+        usage['hits'] = usage['misses'] = 0
+
+class ResponseCache:
+    """Persistent on-disk cache of LM responses.
+
+    Responses are keyed on the model, the predictor signature, the rendered
+    inputs and the sampling temperature, so a byte-identical request replays
+    from disk without calling the model. Entries expire after ``ttl`` seconds
+    and the least recently used entries are evicted beyond ``max_entries``.
+
+    Lookups only read. Access times and hit/miss counts are kept in memory
+    and written in one transaction with the next put(), every
+    ``flush_every`` lookups, on stats() and when the cache is closed or the
+    process exits.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = 7 * 24 * 3600,
+                 max_entries: int = 10000, flush_every: int = 64):
+        """Initialize response cache.
+
+        Args:
+            path: SQLite file for the cache (defaults to Config.cache_path)
+            ttl: Seconds before an entry expires, or None to keep entries forever
+            max_entries: Maximum number of cached responses
+            flush_every: Lookups between writes of deferred usage data
+        """
+        if path is None:
+            from synthlang.config import Config
+            path = Config().cache_path
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);"
+            "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);"
+        )
+        self._conn.commit()
+        # Approximate when other processes share the file; recounted before evicting
+        self._entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        self._usage: Dict[str, Any] = {'accessed': {}, 'hits': 0, 'misses': 0}
+        self._flusher = weakref.finalize(self, _flush_usage, self._conn, self._lock, self._usage)
+
+    @staticmethod
+    def make_key(model: str, signature: str, inputs: Dict[str, Any],
+                 temperature: Optional[float] = None) -> str:
+        """Build the cache key for an LM request.
+
+        Args:
+            model: Model name
+            signature: Identifier of the predictor signature and instructions
+            inputs: Rendered predictor inputs
+            temperature: Sampling temperature
+
+        Returns:
+            Cache key
+        """
+        return data_digest({
+            'model': model,
+            'signature': signature,
+            'inputs': inputs,
+            'temperature': temperature
+        })
+
+    def flush(self) -> None:
+        """Write deferred access times and hit/miss counts."""
+        _flush_usage(self._conn, self._lock, self._usage)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response fields, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and self.ttl is not None and row[1] + self.ttl < now:
+                self._entries -= self._conn.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+                self._conn.commit()
+                row = None
+            if row:
+                self._usage['accessed'][key] = now
+                self._usage['hits'] += 1
+            else:
+                self._usage['misses'] += 1
+            lookups = self._usage['hits'] + self._usage['misses']
+        if lookups >= self.flush_every:
+            self.flush()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response, evicting least recently used entries if full.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable response fields
+        """
+        # Eviction orders by access time, so pending accesses go in first
+        self.flush()
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, default=str), now, now)
+            )
+            if not exists:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                excess = self._entries - self.max_entries
+                if excess > 0:
+                    self._entries -= self._conn.execute(
+                        "DELETE FROM responses WHERE key IN "
+                        "(SELECT key FROM responses ORDER BY accessed ASC LIMIT ?)",
+                        (excess,)
+                    ).rowcount
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary containing entry count, expired entries, lifetime
+            hits and misses, and the size of the cache file in bytes
+        """
+        self.flush()
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            expired = 0
+            if self.ttl is not None:
+                expired = self._conn.execute(
+                    "SELECT COUNT(*) FROM responses WHERE created < ?", (time.time() - self.ttl,)
+                ).fetchone()[0]
+            counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        return {
+            'path': str(self.path),
+            'entries': entries,
+            'expired': expired,
+            'hits': counters.get('hits', 0),
+            'misses': counters.get('misses', 0),
+            'size_bytes': self.path.stat().st_size if self.path.exists() else 0
+        }
+
+    def clear(self) -> int:
+        """Remove all cached responses.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM responses").rowcount
+            self._conn.execute("DELETE FROM counters")
+            self._usage['accessed'].clear()
+            self._usage['hits'] = self._usage['misses'] = 0
+            self._entries = 0
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+        return removed
+
+    def close(self) -> None:
+        """Write deferred usage data and close the cache file."""
+        self._flusher()
+        self._conn.close()
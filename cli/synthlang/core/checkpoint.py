@@ -0,0 +1,61 @@
+"""Checkpoints for resumable evolution runs."""
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+CHECKPOINT_VERSION = 1
+
+def rng_state_to_json(state: Tuple) -> list:
+    """Convert a random.Random state into JSON-serializable form."""
+    version, internal, gauss = state
+    return [version, list(internal), gauss]
+
+def rng_state_from_json(data: list) -> Tuple:
+    """Convert a stored RNG state back for random.Random.setstate()."""
+    version, internal, gauss = data
+    return (version, tuple(internal), gauss)
+
+def save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    """Atomically write a checkpoint.
+
+    The checkpoint is gzip-compressed JSON. It is written to a temporary
+    file and renamed into place, so an interrupted write never leaves a
+    truncated checkpoint behind.
+
+    Args:
+        path: Checkpoint file path
+        state: JSON-serializable run state
+    """
+    target = Path(path).expanduser()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    payload = json.dumps({'version': CHECKPOINT_VERSION, **state}, separators=(',', ':'))
+    with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+        f.write(payload)
+    os.replace(tmp, target)
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Read a checkpoint.
+
+    Args:
+        path: Checkpoint file path
+
+    Returns:
+        Stored run state
+
+    Raises:
+        FileNotFoundError: If the checkpoint doesn't exist
+        ValueError: If the file is not a supported checkpoint
+    """
+    try:
+        with gzip.open(Path(path).expanduser(), 'rt', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        if isinstance(e, FileNotFoundError):
+            raise
+        raise ValueError(f"Not a valid checkpoint: {path}")
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {state.get('version')}")
+    return state
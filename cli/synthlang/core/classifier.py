@@ -3,24 +3,31 @@ import json
 from typing import Any, Dict, List, Optional
 
 from .base import SynthLangModule
+from .cache import ResponseCache
 from .finetune import PromptFinetuner
+from .types import BatchReport
 
 class PromptClassifier(SynthLangModule):
     """Classifies prompts using DSPy."""
 
-    def __init__(self, lm: Any, labels: List[str], bootstrap_examples: Optional[List[Dict]] = None):
+    def __init__(self, lm: Any, labels: List[str], bootstrap_examples: Optional[List[Dict]] = None,
+                 cache: Optional[ResponseCache] = None, configure: bool = True):
         """Initialize classifier module.
         
         Args:
             lm: Language model instance
             labels: List of possible classification labels
             bootstrap_examples: Optional examples for bootstrapping
+            cache: Optional response cache
+            configure: Make lm DSPy's global default (see SynthLangModule)
         """
-        super().__init__(lm)
+        super().__init__(lm, cache, configure)
         self.finetuner = PromptFinetuner(
             lm=lm,
             labels=labels,
-            examples=bootstrap_examples
+            examples=bootstrap_examples,
+            cache=cache,
+            configure=configure
         )
         
     def train(self, train_data: List[Dict]) -> Dict[str, Any]:
@@ -44,17 +51,46 @@ class PromptClassifier(SynthLangModule):
             Dictionary containing classification result
         """
         return self.finetuner.classify(text)
+
+    async def aclassify(self, text: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Classify a piece of text without blocking the event loop.
+        
+        Args:
+            text: Text to classify
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Dictionary containing classification result
+        """
+        return await self.finetuner.aclassify(text, timeout=timeout)
+        
+    def batch_classify(self, texts: List[str], workers: int = 4,
+                       max_retries: int = 2) -> List[Dict[str, Any]]:
+        """Classify multiple texts concurrently.
+        
+        Args:
+            texts: List of texts to classify
+            workers: Maximum number of concurrent LM calls
+            max_retries: Retries per text before recording it as failed
+            
+        Returns:
+            List of classification results in input order
+        """
+        return self.finetuner.batch_classify(texts, workers=workers, max_retries=max_retries)
         
-    def batch_classify(self, texts: List[str]) -> List[Dict[str, Any]]:
-        """Classify multiple texts.
+    def batch_classify_report(self, texts: List[str], workers: int = 4,
+                              max_retries: int = 2) -> BatchReport:
+        """Classify multiple texts concurrently and report timings.
         
         Args:
             texts: List of texts to classify
+            workers: Maximum number of concurrent LM calls
+            max_retries: Retries per text before recording it as failed
             
         Returns:
-            List of classification results
+            Batch report with per-item results, latency and throughput
         """
-        return self.finetuner.batch_classify(texts)
+        return self.finetuner.batch_classify_report(texts, workers=workers, max_retries=max_retries)
         
     def evaluate(self, test_data: List[Dict]) -> Dict[str, float]:
         """Evaluate classifier on test data.
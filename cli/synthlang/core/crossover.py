@@ -0,0 +1,68 @@
+"""Crossover of SynthLang prompts without LM calls.
+
+Prompts are recombined on their statement structure: the child takes the
+union of both parents' ↹ inputs, a one-point crossover of their ⊕ process
+steps, and the Σ outputs of one parent. Continuation lines stay attached to
+the statement they continue, as in parser.parse(), and lines that aren't
+valid SynthLang are dropped. Only the first symbol of each line is looked
+at, which keeps a crossover to a few microseconds.
+"""
+import random
+from typing import Dict, List
+
+from .parser import SYMBOL_KINDS
+
+def sections(prompt: str) -> Dict[str, List[str]]:
+    """Split a prompt into its input, process and output statements.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Dictionary mapping 'input', 'process' and 'output' to statement
+        texts, each including its continuation lines
+    """
+    result: Dict[str, List[str]] = {'input': [], 'process': [], 'output': []}
+    current = None
+    for line in prompt.split('\n'):
+        text = line.strip()
+        if not text:
+            continue
+        kind = SYMBOL_KINDS.get(text[0])
+        if kind is not None:
+            current = result[kind]
+            current.append(line.rstrip())
+        elif line[0].isspace() and current is not None:
+            current[-1] += '\n' + line.rstrip()
+        else:
+            current = None
+    return result
+
+def crossover(first: str, second: str, rng: random.Random) -> str:
+    """Recombine two prompts.
+
+    Args:
+        first: Primary parent
+        second: Second parent
+        rng: Random generator of the run
+
+    Returns:
+        Child prompt with the merged inputs of both parents, the first
+        parent's process steps up to a random cut followed by the second
+        parent's steps from another random cut, and the outputs of one of
+        the two parents
+    """
+    a, b = sections(first), sections(second)
+
+    inputs = list(dict.fromkeys(a['input'] + b['input']))
+
+    cut_a = rng.randint(0, len(a['process']))
+    cut_b = rng.randint(0, len(b['process']))
+    steps = list(dict.fromkeys(a['process'][:cut_a] + b['process'][cut_b:]))
+    if not steps:
+        steps = a['process'] or b['process']
+
+    outputs = [o for o in (a['output'], b['output']) if o]
+    chosen = rng.choice(outputs) if outputs else []
+
+    return '\n'.join(inputs + steps + chosen)
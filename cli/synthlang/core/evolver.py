@@ -1,46 +1,42 @@
 """Prompt evolution module using genetic algorithms and self-play tournaments."""
+import math
 import random
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import dspy
 
 from .base import SynthLangModule
-from .types import SynthLangSymbols
+from .batch import BatchRunner
+from .cache import FitnessCache, ResponseCache, prompt_digest
+from .checkpoint import rng_state_from_json, rng_state_to_json, save_checkpoint
+from .crossover import crossover
+from .formatter import normalize
+from .lineage import LineageWriter, read_lineage
+from .population import MinHashIndex, Population
+from .scoring import heuristic_scores
+from .selection import SelectionStrategy, create_selection
+from .surrogate import SurrogateModel
 
-class PromptEvolver(SynthLangModule):
-    """Evolves prompts using genetic algorithms and self-play tournaments."""
+class EvalSignature(dspy.Signature):
+    """Signature for prompt evaluation."""
+    prompt = dspy.InputField()
+    test_input = dspy.InputField()
+    expected = dspy.InputField()
+    matches = dspy.OutputField(desc="Whether the prompt would produce the expected output (yes/no)")
 
-    def __init__(self, lm: Any, population_size: int = 5, mutation_rate: float = 0.3,
-                 tournament_size: int = 3, fitness_type: str = 'hybrid', test_cases: Optional[List[Dict]] = None):
-        """Initialize evolver module.
-        
-        Args:
-            lm: Language model instance
-            population_size: Size of population per generation
-            mutation_rate: Rate of mutation between generations (0-1)
-            tournament_size: Number of prompts competing in each tournament
-            fitness_type: Type of fitness function to use
-            test_cases: Optional test cases for task-based fitness
-        """
-        super().__init__(lm)
-        self.population_size = population_size
-        self.mutation_rate = mutation_rate
-        self.tournament_size = tournament_size
-        self.fitness_type = fitness_type
-        self.test_cases = test_cases
-        
-    def _generate_variant(self, prompt: str) -> str:
-        """Generate a variant of the prompt through mutation."""
-        class MutateSignature(dspy.Signature):
-            """Signature for prompt mutation."""
-            prompt = dspy.InputField()
-            mutated = dspy.OutputField(desc="Mutated version of the prompt following SynthLang format")
-            
-        mutator = dspy.Predict(MutateSignature)
-        
-        with dspy.context(lm=self.lm):
-            result = mutator(
-                prompt=f"""Modify this prompt into SynthLang format with ONE mutation:
+class MutateSignature(dspy.Signature):
+    """Signature for batched prompt mutation."""
+    prompt = dspy.InputField()
+    count = dspy.InputField(desc="Number of distinct variants to produce")
+    variants = dspy.OutputField(
+        desc="Distinct mutated versions of the prompt following SynthLang format, "
+             "separated by lines containing only ---"
+    )
+
+MUTATION_INSTRUCTIONS = """Modify this prompt into SynthLang format with ONE mutation per variant.
+Produce {count} distinct variants, each using a different mutation.
 
 Current prompt:
 {prompt}
@@ -59,6 +55,7 @@ Rules:
 6. Use +, >, <, ^ for operations
 7. Keep each line under 30 chars
 8. No quotes or descriptions
+9. Separate variants with a line containing only ---
 
 Example mutations:
 1. Add processing step:
@@ -77,52 +74,345 @@ Example mutations:
    ⊕ validate => clean
    ⊕ transform => final
    Σ result + stats"""
+
+_VARIANT_SEPARATOR = re.compile(r'^\s*-{3,}\s*$', re.MULTILINE)
+
+# Clarity, specificity and task score weights of hybrid fitness with test cases
+HYBRID_WEIGHTS = (0.3, 0.3, 0.4)
+
+class PromptEvolver(SynthLangModule):
+    """Evolves prompts using genetic algorithms and self-play tournaments."""
+
+    def __init__(self, lm: Any, population_size: int = 5, mutation_rate: float = 0.3,
+                 tournament_size: int = 3, fitness_type: str = 'hybrid', test_cases: Optional[List[Dict]] = None,
+                 max_concurrency: int = 8, fitness_cache: Optional[FitnessCache] = None,
+                 cache: Optional[ResponseCache] = None, workers: int = 4,
+                 random_seed: Optional[int] = None, patience: Optional[int] = None,
+                 min_diversity: Optional[float] = None, max_lm_calls: Optional[int] = None,
+                 max_cost: Optional[float] = None, dedupe_threshold: Optional[float] = 0.9,
+                 selection: Union[str, SelectionStrategy] = 'tournament',
+                 crossover_rate: float = 0.0, surrogate: bool = False,
+                 surrogate_margin: float = 0.2, racing: bool = False, racing_min_cases: int = 8,
+                 racing_confidence: float = 0.95):
+        """Initialize evolver module.
+        
+        Args:
+            lm: Language model instance
+            population_size: Size of population per generation
+            mutation_rate: Rate of mutation between generations (0-1)
+            tournament_size: Number of prompts competing in each tournament
+            fitness_type: Type of fitness function to use
+            test_cases: Optional test cases for task-based fitness
+            max_concurrency: Maximum number of test cases evaluated concurrently
+            fitness_cache: Optional shared fitness cache (defaults to an in-memory LRU)
+            cache: Optional response cache for test-case evaluations. Mutations
+                are never cached since they are meant to be stochastic.
+            workers: Maximum number of mutation calls made concurrently
+                within a generation
+            random_seed: Seed for parent selection and mutation decisions, so
+                runs are reproducible regardless of completion order
+            patience: Stop after this many generations without an
+                improvement of the best fitness
+            min_diversity: Stop once the share of distinct prompts in the
+                population drops below this value (0-1)
+            max_lm_calls: Stop once mutation and evaluation calls reach this budget
+            max_cost: Stop once the LM cost reported by the model reaches this budget
+            dedupe_threshold: Reject variants whose estimated n-gram
+                similarity to a population member other than their own
+                parents, or to another variant of the same generation,
+                reaches this value before scoring them. Variants that only
+                repeat a population member are always rejected; None skips
+                the similarity check.
+            selection: Parent selection strategy, or its name ('tournament',
+                'rank', 'proportional' or 'elitism'; see selection.py)
+            crossover_rate: Share of variations produced by recombining the
+                parent with a second selected parent instead of an LM
+                mutation call (0-1)
+            surrogate: Learn task scores from structural features during the
+                run and skip the test-case evaluation of variants whose
+                predicted task score clearly can't lift their overall
+                fitness above their parent's
+            surrogate_margin: How far below the task score a variant needs
+                to beat its parent a prediction must be for the evaluation
+                to be skipped
+            racing: Evaluate variants on a growing subset of test cases and
+                drop those whose task score can no longer lift their overall
+                fitness above their parent's before running the full suite
+            racing_min_cases: Test cases in the first racing round; each
+                round doubles it
+            racing_confidence: Confidence of each early rejection (0-1)
+            
+        Budgets are checked after each generation, so a run can overshoot
+        them by at most one generation.
+        """
+        super().__init__(lm, cache)
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.fitness_type = fitness_type
+        self.test_cases = test_cases
+        self.evaluator = dspy.Predict(EvalSignature)
+        self.mutator = dspy.Predict(MutateSignature)
+        self.eval_runner = BatchRunner(workers=max_concurrency, max_retries=1)
+        self.mutation_runner = BatchRunner(workers=workers, max_retries=1)
+        self.rng = random.Random(random_seed)
+        self.patience = patience
+        self.min_diversity = min_diversity
+        self.max_lm_calls = max_lm_calls
+        self.max_cost = max_cost
+        self.dedupe_threshold = dedupe_threshold
+        if isinstance(selection, str):
+            selection = create_selection(selection, tournament_size)
+        self.selection = selection
+        self.crossover_rate = crossover_rate
+        self.surrogate = SurrogateModel() if surrogate else None
+        self.surrogate_margin = surrogate_margin
+        self.racing = racing
+        self.racing_min_cases = racing_min_cases
+        self.racing_confidence = racing_confidence
+        # Racing rounds take test cases in a fixed shuffled order, so a
+        # sorted suite doesn't bias the early rounds
+        self._case_order = random.Random(random_seed).sample(
+            range(len(test_cases or [])), len(test_cases or [])
+        )
+        self.eval_calls = 0
+        self.surrogate_skips = 0
+        # Prompt -> [total seconds, evaluations] of test-case calls made by this evolver
+        self.eval_latency: Dict[str, List[float]] = {}
+        # Prompts with a test case that errored after its retry; their
+        # scores understate them and are kept out of the fitness cache
+        self._eval_errors: Set[str] = set()
+        self.racing_drops = 0
+        self.fitness_cache = fitness_cache or FitnessCache()
+        self.cache_namespace = FitnessCache.namespace(
+            fitness_type, test_cases, str(getattr(lm, 'model', ''))
+        )
+        
+    def _generate_variants(self, prompt: str, count: int) -> List[str]:
+        """Generate up to ``count`` distinct variants of a prompt in one LM call.
+        
+        Variants are normalized to SynthLang format and deduplicated; ones
+        identical to the parent are dropped.
+        """
+        with dspy.context(lm=self.lm):
+            result = self.mutator(
+                prompt=MUTATION_INSTRUCTIONS.format(prompt=prompt, count=count),
+                count=str(count)
             )
-            # Handle both string and object responses
-            if hasattr(result, 'mutated'):
-                return str(result.mutated).strip()
-            else:
-                return str(result).strip()
+        # Handle both string and object responses
+        text = str(result.variants if hasattr(result, 'variants') else result)
+        
+        seen = {prompt_digest(prompt)}
+        variants = []
+        for chunk in _VARIANT_SEPARATOR.split(text):
+            variant = normalize(chunk)
+            digest = prompt_digest(variant)
+            if variant and digest not in seen:
+                seen.add(digest)
+                variants.append(variant)
+        return variants[:count]
+        
+    def _mutate_many(self, requests: Dict[str, int]) -> Dict[str, List[str]]:
+        """Generate variants for several parents concurrently.
+        
+        Args:
+            requests: Number of variants wanted per parent prompt
             
-    def _calculate_fitness(self, prompt: str) -> Dict[str, float]:
-        """Calculate fitness scores for a prompt."""
-        # Clarity score based on symbol usage
-        clarity = sum(1 for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT] 
-                     if sym in prompt) / 3.0
-                     
-        # Specificity score based on operators and joins
-        specificity = (
-            prompt.count("•") * 0.2 +  # Joins
-            prompt.count("=>") * 0.2 +  # Transforms
-            sum(1 for op in ["+", "-", "*", "/", ">", "<", "^"] if op in prompt) * 0.1
+        Returns:
+            Variants per parent prompt; parents whose call failed get none
+        """
+        report = self.mutation_runner.run(
+            lambda item: self._generate_variants(*item), requests.items()
+        )
+        return {
+            item['input'][0]: item['result'] or []
+            for item in report['items']
+        }
+            
+    def _evaluate_case(self, prompt: str, test: Dict) -> bool:
+        """Check whether a prompt passes a single test case."""
+        result = self._predict(
+            self.evaluator,
+            prompt=prompt,
+            test_input=test['input'],
+            expected=test['expected']
         )
+        # Handle both string and object responses
+        matches = str(result.matches if hasattr(result, 'matches') else result).lower()
+        return "yes" in matches
+        
+    def _task_scores(self, prompts: List[str]) -> List[float]:
+        """Score prompts against all test cases concurrently.
+        
+        Every (prompt, test case) pair goes through one bounded batch, so
+        scoring a whole generation costs about as long as its slowest
+        evaluation. Test cases that still fail after a retry count as
+        misses rather than aborting the evolution run; such scores aren't
+        cached, so a later evaluation can correct them.
+        """
+        successes = self._count_successes(prompts, self.test_cases)
+        return [count / len(self.test_cases) for count in successes]
+        
+    def _count_successes(self, prompts: List[str], tests: List[Dict]) -> List[int]:
+        """Count the test cases each prompt passes, in one concurrent batch."""
+        pairs = [(prompt, test) for prompt in prompts for test in tests]
+        self.eval_calls += len(pairs)
+        report = self.eval_runner.run(lambda pair: self._evaluate_case(*pair), pairs)
+        successes = [0] * len(prompts)
+        for item in report['items']:
+            prompt = prompts[item['index'] // len(tests)]
+            timing = self.eval_latency.setdefault(prompt, [0.0, 0])
+            timing[0] += item['latency']
+            timing[1] += 1
+            if item['error'] is not None:
+                self._eval_errors.add(prompt)
+            if item['result']:
+                successes[item['index'] // len(tests)] += 1
+        return successes
         
-        # Task completion score if test cases provided
-        task_score = 0.0
+    def _race_task_scores(self, prompts: List[str], floors: Dict[str, float]) -> List[Optional[float]]:
+        """Score prompts by racing them against the task scores they need.
+        
+        Rounds evaluate every surviving prompt on the next test cases, with
+        racing_min_cases in the first round and the total doubling each
+        round. After each round, a prompt whose Hoeffding upper confidence
+        bound on its pass rate is below its floor is dropped. Survivors end
+        up evaluated on the whole suite.
+        
+        Returns:
+            Exact task score per prompt, or None for dropped prompts
+        """
+        n = len(self.test_cases)
+        successes = [0] * len(prompts)
+        alive = list(range(len(prompts)))
+        done = 0
+        size = min(max(self.racing_min_cases, 1), n)
+        while alive and done < n:
+            tests = [self.test_cases[i] for i in self._case_order[done:size]]
+            counts = self._count_successes([prompts[j] for j in alive], tests)
+            for j, count in zip(alive, counts):
+                successes[j] += count
+            done = size
+            if done < n:
+                bound = math.sqrt(math.log(1 / (1 - self.racing_confidence)) / (2 * done))
+                alive = [
+                    j for j in alive
+                    if successes[j] / done + bound >= floors.get(prompts[j], 0.0)
+                ]
+            size = min(size * 2, n)
+        survivors = set(alive)
+        self.racing_drops += len(prompts) - len(survivors)
+        return [successes[j] / n if j in survivors else None for j in range(len(prompts))]
+        
+    def _task_score(self, prompt: str) -> float:
+        """Score a prompt against all test cases concurrently."""
+        return self._task_scores([prompt])[0]
+        
+    def _calculate_fitness(self, prompt: str) -> Dict[str, float]:
+        """Calculate fitness scores for a prompt, reusing cached scores."""
+        return self._calculate_fitness_many([prompt])[0]
+        
+    def _calculate_fitness_many(self, prompts: List[str],
+                                floors: Optional[Dict[str, float]] = None) -> List[Optional[Dict[str, float]]]:
+        """Calculate fitness scores for a batch of prompts.
+        
+        Cached scores are reused. The heuristic scores of all remaining
+        prompts are computed from their parsed AST, which stays exact on
+        malformed model output, and their test cases are evaluated in one
+        concurrent batch.
+        
+        Args:
+            prompts: Prompts to score
+            floors: Parent overall fitness per prompt. Each prompt's floor
+                is turned into the task score it needs to beat its parent
+                (see _task_floors()). With a trained surrogate, prompts
+                predicted to fall more than surrogate_margin below that
+                score are not evaluated and get None. With racing, prompts
+                that fall below it on part of the test suite get None as
+                well.
+        """
+        results = [self.fitness_cache.get(self.cache_namespace, prompt) for prompt in prompts]
+        pending = list(dict.fromkeys(p for p, r in zip(prompts, results) if r is None))
+        if not pending:
+            return results
+            
+        scores = heuristic_scores(pending, exact=True)
+        evaluate = list(range(len(pending)))
+        task_scores = [0.0] * len(pending)
         if self.test_cases:
-            successes = 0
-            for test in self.test_cases:
-                class EvalSignature(dspy.Signature):
-                    """Signature for prompt evaluation."""
-                    prompt = dspy.InputField()
-                    test_input = dspy.InputField()
-                    expected = dspy.InputField()
-                    matches = dspy.OutputField(desc="Whether the prompt would produce the expected output (yes/no)")
-                    
-                evaluator = dspy.Predict(EvalSignature)
+            task_floors = self._task_floors(pending, scores, floors or {})
+            features = predicted = None
+            if self.surrogate is not None:
+                features = SurrogateModel.design(scores)
+                predicted = self.surrogate.predict(features)
+                if predicted is not None and task_floors:
+                    evaluate = [
+                        i for i in evaluate
+                        if pending[i] not in task_floors
+                        or predicted[i] >= task_floors[pending[i]] - self.surrogate_margin
+                    ]
+                    self.surrogate_skips += len(pending) - len(evaluate)
+            candidates = [pending[i] for i in evaluate]
+            if self.racing and task_floors:
+                raced = self._race_task_scores(candidates, task_floors)
+                evaluate = [i for i, score in zip(evaluate, raced) if score is not None]
+                evaluated = [score for score in raced if score is not None]
+            else:
+                evaluated = self._task_scores(candidates)
+            for i, task_score in zip(evaluate, evaluated):
+                task_scores[i] = task_score
+            if self.surrogate is not None and evaluate:
+                self.surrogate.update(
+                    features[evaluate], evaluated, None if predicted is None else predicted[evaluate]
+                )
                 
-                with dspy.context(lm=self.lm):
-                    result = evaluator(
-                        prompt=prompt,
-                        test_input=test['input'],
-                        expected=test['expected']
-                    )
-                    # Handle both string and object responses
-                    matches = str(result.matches if hasattr(result, 'matches') else result).lower()
-                    if "yes" in matches:
-                        successes += 1
-            task_score = successes / len(self.test_cases)
-            
+        computed = {}
+        for i in evaluate:
+            fitness = self._compute_fitness(
+                float(scores['clarity'][i]), float(scores['specificity'][i]), task_scores[i]
+            )
+            if pending[i] not in self._eval_errors:
+                self.fitness_cache.put(self.cache_namespace, pending[i], fitness)
+            computed[pending[i]] = fitness
+        self._eval_errors.difference_update(pending)
+        return [
+            r if r is not None else (dict(computed[p]) if p in computed else None)
+            for p, r in zip(prompts, results)
+        ]
+        
+    def _task_floors(self, prompts: List[str], scores: Dict[str, Any],
+                     floors: Dict[str, float]) -> Dict[str, float]:
+        """Task score each prompt needs for its overall fitness to reach its floor.
+        
+        Inverts _compute_fitness() using the prompt's own clarity and
+        specificity, so screening agrees with the acceptance rule of
+        evolve(). Empty when overall fitness doesn't depend on the task
+        score, since no evaluation result could change the outcome then.
+        
+        Args:
+            prompts: Prompts scored by heuristic_scores()
+            scores: Output of heuristic_scores() for prompts
+            floors: Parent overall fitness per prompt
+        """
+        if self.fitness_type in ('clarity', 'specificity'):
+            return {}
+        task_floors = {}
+        for i, prompt in enumerate(prompts):
+            if prompt not in floors:
+                continue
+            if self.fitness_type == 'task':
+                task_floors[prompt] = floors[prompt]
+            else:  # hybrid
+                clarity_weight, specificity_weight, task_weight = HYBRID_WEIGHTS
+                task_floors[prompt] = (
+                    floors[prompt]
+                    - clarity_weight * float(scores['clarity'][i])
+                    - specificity_weight * float(scores['specificity'][i])
+                ) / task_weight
+        return task_floors
+        
+    def _compute_fitness(self, clarity: float, specificity: float, task_score: float) -> Dict[str, float]:
+        """Combine heuristic and task scores into fitness scores."""
         # Calculate overall fitness based on type
         if self.fitness_type == 'clarity':
             overall = clarity
@@ -131,7 +421,7 @@ Example mutations:
         elif self.fitness_type == 'task':
             overall = task_score if self.test_cases else clarity
         else:  # hybrid
-            weights = [0.3, 0.3, 0.4] if self.test_cases else [0.5, 0.5, 0.0]
+            weights = HYBRID_WEIGHTS if self.test_cases else (0.5, 0.5, 0.0)
             overall = (clarity * weights[0] + 
                       specificity * weights[1] + 
                       task_score * weights[2])
@@ -143,80 +433,353 @@ Example mutations:
             'overall': overall
         }
         
-    def _tournament_select(self, population: List[Dict]) -> Dict:
-        """Select best prompt from a tournament."""
-        tournament = random.sample(population, min(self.tournament_size, len(population)))
-        return max(tournament, key=lambda x: x['fitness']['overall'])
+    def _reject_near_duplicates(self, variants: List[str], population: Population,
+                                parents: Dict[str, Set[str]]) -> List[str]:
+        """Drop copies of the population and near-duplicates of other prompts.
+
+        A variant is expected to resemble the prompts it was made from, so
+        it is only compared with the rest of the population and with the
+        variants kept before it.
+
+        Args:
+            variants: Distinct variants of one generation
+            population: Current population
+            parents: Parent prompts of each variant
+        """
+        variants = [v for v in variants if v not in population]
+        if self.dedupe_threshold is None:
+            return variants
+        index = MinHashIndex(threshold=self.dedupe_threshold)
+        for individual in population.individuals:
+            index.add(individual['prompt'], individual['prompt'])
+        kept = []
+        for variant in variants:
+            if index.query(variant, exclude=parents.get(variant, ())) is None:
+                index.add(variant, variant)
+                kept.append(variant)
+        return kept
+        
+    def _lm_cost(self) -> float:
+        """Get the total cost of the calls recorded in the model's history."""
+        history = getattr(self.lm, 'history', None)
+        if not isinstance(history, list):
+            return 0.0
+        return float(sum(entry.get('cost') or 0.0 for entry in history))
+        
+    def _draw_slot(self, select: Callable[[], Dict]) -> Tuple[Dict, bool, Optional[str], Optional[str]]:
+        """Draw a parent and decide whether and how it varies.
+        
+        Crossover children are made right away since they need no LM call.
+        
+        Returns:
+            Parent, whether it varies, its crossover child or None when it
+            varies by LM mutation, and the child's second parent prompt
+        """
+        parent = select()
+        vary = self.rng.random() < self.mutation_rate
+        child = mate = None
+        if vary and self.crossover_rate and self.rng.random() < self.crossover_rate:
+            mate = select()['prompt']
+            # Parents without valid statements fall back to mutation
+            child = crossover(parent['prompt'], mate, self.rng) or None
+        return parent, vary, child, mate if child else None
+        
+    def _vary(self, slots: List[Tuple[Dict, bool, Optional[str], Optional[str]]], population: Population,
+              stats: Dict[str, Any], screen: bool = True) -> Tuple[Dict[str, List[str]], Dict[str, Dict]]:
+        """Produce and score the variants of one generation.
+        
+        Args:
+            slots: Slots from _draw_slot()
+            population: Current population
+            stats: Run statistics to update
+            screen: Let the surrogate and racing drop variants that can't
+                beat their parent's overall fitness
+            
+        Returns:
+            Mutation variants per parent prompt, and fitness per scored
+            variant (mutations and crossover children)
+        """
+        children = [child for _, _, child, _ in slots if child is not None]
+        stats['crossovers'] += len(children)
+        
+        # One mutation call per distinct parent, asking for one variant per mutating slot
+        requests: Dict[str, int] = {}
+        for parent, vary, child, _ in slots:
+            if vary and child is None:
+                requests[parent['prompt']] = requests.get(parent['prompt'], 0) + 1
+        variants = self._mutate_many(requests) if requests else {}
+        stats['mutation_calls'] += len(requests)
         
-    def evolve(self, seed_prompt: str, n_generations: int = 10) -> Dict[str, Any]:
+        # Score every distinct, non-near-duplicate variant of the generation in one batch
+        unique = list(dict.fromkeys(
+            [v for group in variants.values() for v in group] + children
+        ))
+        stats['total_variants'] += len(unique)
+        parents: Dict[str, Set[str]] = {}
+        for parent, vary, child, mate in slots:
+            if vary:
+                for variant in [child] if child else variants.get(parent['prompt'], []):
+                    parents.setdefault(variant, set()).update({parent['prompt'], mate} - {None})
+        kept = self._reject_near_duplicates(unique, population, parents)
+        stats['near_duplicates'] += len(unique) - len(kept)
+        # Variants are kept when they beat their parent's overall fitness;
+        # one made by several parents only has to beat the weakest
+        floors: Dict[str, float] = {}
+        if screen:
+            for parent, vary, child, _ in slots:
+                if not vary:
+                    continue
+                for variant in [child] if child else variants.get(parent['prompt'], []):
+                    overall = parent['fitness']['overall']
+                    floors[variant] = min(floors.get(variant, overall), overall)
+        skips_before, drops_before = self.surrogate_skips, self.racing_drops
+        scored = self._calculate_fitness_many(kept, floors)
+        stats['surrogate_skipped'] += self.surrogate_skips - skips_before
+        stats['racing_dropped'] += self.racing_drops - drops_before
+        return variants, {v: f for v, f in zip(kept, scored) if f is not None}
+        
+    def _stop_reason(self, stats: Dict[str, Any], population: Population) -> Optional[str]:
+        """Check the convergence criteria after a generation."""
+        if self.patience is not None and stats['stale_generations'] >= self.patience:
+            return 'patience'
+        if self.min_diversity is not None and population.diversity < self.min_diversity:
+            return 'diversity'
+        if self.max_lm_calls is not None and stats['mutation_calls'] + stats['eval_calls'] >= self.max_lm_calls:
+            return 'max_lm_calls'
+        if self.max_cost is not None and stats['lm_cost'] >= self.max_cost:
+            return 'max_cost'
+        return None
+        
+    def _checkpoint_state(self, seed_prompt: str, n_generations: int, generation: int,
+                          population: Population, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect everything needed to continue a run after a generation."""
+        return {
+            'seed_prompt': seed_prompt,
+            'n_generations': n_generations,
+            'generation': generation,
+            'settings': {
+                'population_size': self.population_size,
+                'mutation_rate': self.mutation_rate,
+                'tournament_size': self.tournament_size,
+                'fitness_type': self.fitness_type,
+                'selection': self.selection.name,
+                'crossover_rate': self.crossover_rate,
+                'cache_namespace': self.cache_namespace
+            },
+            'population': population.to_records(),
+            'rng_state': rng_state_to_json(self.rng.getstate()),
+            'surrogate': self.surrogate.to_json() if self.surrogate is not None else None,
+            'stats': stats
+        }
+        
+    @staticmethod
+    def _new_stats(lineage: Optional[LineageWriter]) -> Dict[str, Any]:
+        """Statistics tracking for a new run."""
+        stats = {
+            'total_variants': 0,
+            'mutation_calls': 0,
+            'successful_mutations': 0,
+            'tournament_winners': 0,
+            'eval_calls': 0,
+            'lm_cost': 0.0,
+            'stale_generations': 0,
+            'near_duplicates': 0,
+            'crossovers': 0,
+            'surrogate_skipped': 0,
+            'racing_dropped': 0
+        }
+        if lineage is None:
+            stats['lineage'] = []
+        return stats
+        
+    def _record_generation(self, stats: Dict[str, Any], generation: int, population: Population,
+                           lineage: Optional[LineageWriter]) -> None:
+        """Record a generation in memory or stream it to the lineage file."""
+        if lineage is None:
+            stats['lineage'].append({'generation': generation, 'population': population.expand()})
+        else:
+            stats['lineage_path'] = str(lineage.path)
+            stats['lineage_offset'] = lineage.write_generation(generation, population.expand())
+        
+    def evolve(self, seed_prompt: str, n_generations: int = 10,
+               cancel_event: Optional[threading.Event] = None,
+               checkpoint_path: Optional[str] = None, checkpoint_every: int = 1,
+               resume_state: Optional[Dict[str, Any]] = None,
+               lineage: Optional[LineageWriter] = None) -> Dict[str, Any]:
         """Evolve prompts through multiple generations.
         
         Args:
             seed_prompt: Initial prompt to evolve from
             n_generations: Number of generations to evolve
+            cancel_event: Optional event that stops evolution after the
+                current generation once set
+            checkpoint_path: Optional file to checkpoint the run to
+            checkpoint_every: Write a checkpoint every this many generations
+                (the final generation is always checkpointed)
+            resume_state: State from load_checkpoint() to continue from; the
+                run picks up after the last completed generation
+            lineage: Optional writer to stream lineage to instead of keeping
+                it in memory. When resuming, open it at the checkpoint's
+                'lineage_offset' stat.
             
         Returns:
             Dictionary containing:
                 - best_prompt: Best evolved prompt
                 - fitness: Fitness scores
                 - generations: Number of generations completed
-                - total_variants: Total variants created
+                - total_variants: Total distinct variants created
+                - near_duplicates: Variants rejected as near-duplicates without scoring
+                - crossovers: Variants produced by crossover instead of an LM call
+                - surrogate_skipped: Variant evaluations skipped on the
+                  surrogate's prediction
+                - surrogate_mae: Mean absolute error of the surrogate's
+                  predictions against real evaluations, or None
+                - racing_dropped: Variants dropped after part of the test suite
+                - mutation_calls: Number of LM calls made for mutation
                 - successful_mutations: Count of successful mutations
-                - tournament_winners: Count of tournament winners
-                - lineage: Full evolutionary history
+                - tournament_winners: Count of parents selected
+                - cache_hits: Fitness evaluations served from the cache
+                - cache_misses: Fitness evaluations that had to be computed
+                - eval_calls: Exact number of test-case evaluations (LM calls) made
+                - lm_cost: Cost of all LM calls, if the model reports it
+                - stale_generations: Generations since the best fitness last improved
+                - diversity: Share of distinct prompts in the final population
+                - stop_reason: 'completed', 'cancelled', 'patience',
+                  'diversity', 'max_lm_calls' or 'max_cost'
+                - lineage: Full evolutionary history, or a lazy iterator
+                  over the lineage file when streaming
+                
+        Raises:
+            ValueError: If resume_state was created with different settings
         """
-        # Initialize population with seed prompt
-        population = [{'prompt': seed_prompt, 'fitness': self._calculate_fitness(seed_prompt)}]
+        hits_before = self.fitness_cache.hits
+        misses_before = self.fitness_cache.misses
+        # Spend is tracked relative to this call, on top of a resumed run's totals
+        evals_start = self.eval_calls
+        cost_start = self._lm_cost()
         
-        # Statistics tracking
-        stats = {
-            'total_variants': 0,
-            'successful_mutations': 0,
-            'tournament_winners': 0,
-            'lineage': [{
-                'generation': 0,
-                'population': [{'prompt': p['prompt'], 'fitness': p['fitness']} for p in population]
-            }]
-        }
+        if resume_state is not None:
+            expected = self._checkpoint_state(seed_prompt, n_generations, 0, Population(), {})['settings']
+            # Older checkpoints predate selection strategies and crossover
+            defaults = {'selection': 'tournament', 'crossover_rate': 0.0}
+            if {**defaults, **resume_state['settings']} != expected:
+                raise ValueError("Checkpoint was created with different evolution settings")
+            if ('lineage_offset' in resume_state['stats']) != (lineage is not None):
+                raise ValueError("Checkpoint and resumed run must both stream lineage to a file, or neither")
+            seed_prompt = resume_state['seed_prompt']
+            population = Population(resume_state['population'])
+            stats = resume_state['stats']
+            completed = resume_state['generation']
+            self.rng.setstate(rng_state_from_json(resume_state['rng_state']))
+            for key in ('eval_calls', 'lm_cost', 'stale_generations', 'near_duplicates',
+                        'crossovers', 'surrogate_skipped', 'racing_dropped'):
+                stats.setdefault(key, 0)
+            if self.surrogate is not None:
+                self.surrogate = SurrogateModel()
+                if resume_state.get('surrogate'):
+                    self.surrogate.load(resume_state['surrogate'])
+        else:
+            if self.surrogate is not None:
+                self.surrogate = SurrogateModel()
+            # Initialize population with seed prompt
+            population = Population()
+            population.add(seed_prompt, self._calculate_fitness(seed_prompt))
+            
+            stats = self._new_stats(lineage)
+            self._record_generation(stats, 0, population, lineage)
+            completed = 0
+        
+        evals_base = stats['eval_calls']
+        cost_base = stats['lm_cost']
         
         # Evolution loop
-        for gen in range(n_generations):
-            # Generate variants
-            new_population = []
-            while len(new_population) < self.population_size:
-                parent = self._tournament_select(population)
-                stats['tournament_winners'] += 1
+        stop_reason = 'completed'
+        for gen in range(completed, n_generations):
+            if cancel_event is not None and cancel_event.is_set():
+                stop_reason = 'cancelled'
+                break
+            best_before = population.best()['fitness']['overall']
                 
-                # Try mutation
-                if random.random() < self.mutation_rate:
-                    variant = self._generate_variant(parent['prompt'])
-                    stats['total_variants'] += 1
-                    
-                    # Calculate fitness and add if better
-                    variant_fitness = self._calculate_fitness(variant)
-                    if variant_fitness['overall'] > parent['fitness']['overall']:
-                        new_population.append({'prompt': variant, 'fitness': variant_fitness})
+            # Select a parent for every slot and decide which slots vary and
+            # how. All random draws happen here, before any concurrent work,
+            # so the outcome doesn't depend on which LM call finishes first.
+            # Elites are carried over unchanged.
+            self.selection.prepare(population)
+            slots = [(elite, False, None, None) for elite in self.selection.elites()][:self.population_size]
+            while len(slots) < self.population_size:
+                slots.append(self._draw_slot(lambda: self.selection.select(self.rng)))
+            stats['tournament_winners'] += len(slots)
+            variants, fitness = self._vary(slots, population, stats)
+            
+            # Keep variants that beat their parent; copies only raise multiplicity
+            new_population = Population()
+            for parent, vary, child, _ in slots:
+                variant = child
+                if vary and child is None and variants.get(parent['prompt']):
+                    variant = variants[parent['prompt']].pop(0)
+                if variant is not None:
+                    if variant in fitness and fitness[variant]['overall'] > parent['fitness']['overall']:
+                        new_population.add(variant, fitness[variant])
                         stats['successful_mutations'] += 1
-                    else:
-                        new_population.append(parent)
-                else:
-                    new_population.append(parent)
+                        continue
+                new_population.add(parent['prompt'], parent['fitness'])
                     
             # Update population
             population = new_population
             
-            # Record lineage
-            stats['lineage'].append({
-                'generation': gen + 1,
-                'population': [{'prompt': p['prompt'], 'fitness': p['fitness']} for p in population]
-            })
+            improved = population.best()['fitness']['overall'] > best_before
+            stats['stale_generations'] = 0 if improved else stats['stale_generations'] + 1
+            stats['eval_calls'] = evals_base + self.eval_calls - evals_start
+            stats['lm_cost'] = cost_base + self._lm_cost() - cost_start
+            
+            self._record_generation(stats, gen + 1, population, lineage)
+            completed = gen + 1
+            early_stop = self._stop_reason(stats, population)
+            
+            if checkpoint_path and (completed % checkpoint_every == 0 or completed == n_generations or early_stop):
+                save_checkpoint(
+                    checkpoint_path,
+                    self._checkpoint_state(seed_prompt, n_generations, completed, population, stats)
+                )
+            if early_stop:
+                stop_reason = early_stop
+                break
             
         # Find best prompt
-        best = max(population, key=lambda x: x['fitness']['overall'])
+        best = population.best()
+        
+        stats['cache_hits'] = self.fitness_cache.hits - hits_before
+        stats['cache_misses'] = self.fitness_cache.misses - misses_before
+        if lineage is not None:
+            stats['lineage'] = read_lineage(stats['lineage_path'])
         
         return {
             'best_prompt': best['prompt'],
             'fitness': best['fitness'],
-            'generations': n_generations,
-            **stats
+            'generations': completed,
+            **stats,
+            'diversity': population.diversity,
+            'surrogate_mae': self.surrogate.mean_absolute_error if self.surrogate is not None else None,
+            'stop_reason': stop_reason
         }
+
+    async def aevolve(self, seed_prompt: str, n_generations: int = 10,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Evolve prompts without blocking the event loop.
+        
+        On cancellation or timeout the evolution thread stops after the
+        generation it is working on instead of running to completion.
+        
+        Args:
+            seed_prompt: Initial prompt to evolve from
+            n_generations: Number of generations to evolve
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Same result as evolve()
+        """
+        cancel_event = threading.Event()
+        return await self._arun(
+            self.evolve, seed_prompt, n_generations, cancel_event,
+            timeout=timeout, cancel_event=cancel_event
+        )
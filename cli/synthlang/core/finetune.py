@@ -6,6 +6,9 @@ import dspy
 from dspy.signatures import Signature
 
 from .base import SynthLangModule
+from .batch import BatchRunner
+from .cache import ResponseCache
+from .types import BatchReport
 
 class ClassifySignature(Signature):
     """Signature for classification with reasoning."""
@@ -54,15 +57,18 @@ class Classifier(dspy.Module):
 class PromptFinetuner(SynthLangModule):
     """Finetunes prompts using DSPy."""
 
-    def __init__(self, lm: Any, labels: List[str], examples: Optional[List[Dict]] = None):
+    def __init__(self, lm: Any, labels: List[str], examples: Optional[List[Dict]] = None,
+                 cache: Optional[ResponseCache] = None, configure: bool = True):
         """Initialize finetuner.
         
         Args:
             lm: Language model instance
             labels: List of possible classification labels
             examples: Optional examples for training
+            cache: Optional response cache
+            configure: Make lm DSPy's global default (see SynthLangModule)
         """
-        super().__init__(lm)
+        super().__init__(lm, cache, configure)
         self.labels = labels
         self.examples = examples or []
         self.classifier = None
@@ -109,23 +115,70 @@ class PromptFinetuner(SynthLangModule):
         """
         self._prepare_classifier()
         
-        with dspy.context(lm=self.lm):
-            result = self.classifier(input=text)
+        def call() -> Dict[str, Any]:
+            with dspy.context(lm=self.lm):
+                return self.classifier(input=text)
+            
+        return self._cached_call(f"Classifier:{','.join(self.labels)}", {"input": text}, call)
+
+    async def aclassify(self, text: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Classify a piece of text without blocking the event loop.
+        
+        Args:
+            text: Text to classify
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Same result as classify()
+        """
+        return await self._arun(self.classify, text, timeout=timeout)
+        
+    def batch_classify_report(self, texts: List[str], workers: int = 4,
+                              max_retries: int = 2) -> BatchReport:
+        """Classify multiple texts concurrently and report timings.
+        
+        Args:
+            texts: List of texts to classify
+            workers: Maximum number of concurrent LM calls
+            max_retries: Retries per text before recording it as failed
             
-        return result
+        Returns:
+            Batch report with per-item results, latency and throughput
+        """
+        # Build the classifier up front so workers don't race to create it
+        self._prepare_classifier()
+        runner = BatchRunner(workers=workers, max_retries=max_retries)
+        return runner.run(self.classify, texts)
         
-    def batch_classify(self, texts: List[str]) -> List[Dict[str, Any]]:
+    def batch_classify(self, texts: List[str], workers: int = 4,
+                       max_retries: int = 2) -> List[Dict[str, Any]]:
         """Classify multiple texts.
         
         Args:
             texts: List of texts to classify
+            workers: Maximum number of concurrent LM calls
+            max_retries: Retries per text before recording it as failed
             
         Returns:
-            List of classification results
+            List of classification results in input order. Each result
+            carries its latency; texts that failed after all retries get
+            a None label and an error message instead of aborting the batch.
         """
+        report = self.batch_classify_report(texts, workers=workers, max_retries=max_retries)
         results = []
-        for text in texts:
-            results.append(self.classify(text))
+        for item in report['items']:
+            if item['error'] is None:
+                result = dict(item['result'])
+            else:
+                result = {
+                    "input": item['input'],
+                    "label": None,
+                    "reasoning": "",
+                    "explanation": "",
+                    "error": item['error']
+                }
+            result["latency"] = item['latency']
+            results.append(result)
         return results
         
     def evaluate(self, test_data: List[Dict]) -> Dict[str, float]:
@@ -0,0 +1,85 @@
+"""Post-processing of model output into SynthLang format."""
+from typing import Iterable, List
+
+from .types import FormatRules, SynthLangSymbols
+
+# A line must contain one of these symbols to be kept
+_INPUT = SynthLangSymbols.INPUT
+_PROCESS = SynthLangSymbols.PROCESS
+_OUTPUT = SynthLangSymbols.OUTPUT
+
+_TRANSFORM_SPLIT = f' {SynthLangSymbols.TRANSFORM} '
+_CONTINUATION = '  '
+
+def _split_long_line(line: str) -> List[str]:
+    """Break a line over the length limit into continuation lines.
+
+    Lines are broken after each transformation arrow. Lines without an
+    arrow are wrapped on whitespace instead of being dropped.
+    """
+    parts = line.split(_TRANSFORM_SPLIT)
+    if len(parts) > 1:
+        return [f"{parts[0]} {SynthLangSymbols.TRANSFORM}"] + [_CONTINUATION + part for part in parts[1:]]
+
+    max_length = FormatRules.MAX_LINE_LENGTH
+    words = line.split()
+    lines: List[str] = []
+    current = words[0]
+    for word in words[1:]:
+        if len(current) + 1 + len(word) > max_length:
+            lines.append(current)
+            current = _CONTINUATION + word
+        else:
+            current += ' ' + word
+    lines.append(current)
+    return lines
+
+def normalize_lines(text: str) -> List[str]:
+    """Clean model output into SynthLang lines.
+
+    Converts '->' to '=>', removes quotes, drops lines without an input,
+    process or output symbol, and breaks lines longer than
+    FormatRules.MAX_LINE_LENGTH.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Cleaned lines
+    """
+    max_length = FormatRules.MAX_LINE_LENGTH
+    # Replacements run once over the whole text rather than per line
+    text = text.strip().replace('->', SynthLangSymbols.TRANSFORM).replace('"', '').replace("'", '')
+    kept = [line for line in text.split('\n') if _INPUT in line or _PROCESS in line or _OUTPUT in line]
+    if not kept or max(map(len, kept)) <= max_length:
+        return kept
+
+    lines: List[str] = []
+    for line in kept:
+        if len(line) <= max_length:
+            lines.append(line)
+        else:
+            lines.extend(_split_long_line(line))
+    return lines
+
+def normalize(text: str) -> str:
+    """Clean model output into SynthLang format.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Cleaned prompt text
+    """
+    return '\n'.join(normalize_lines(text))
+
+def normalize_many(texts: Iterable[str]) -> List[str]:
+    """Clean a batch of model outputs into SynthLang format.
+
+    Args:
+        texts: Raw model outputs
+
+    Returns:
+        Cleaned prompt texts in input order
+    """
+    return ['\n'.join(normalize_lines(text)) for text in texts]
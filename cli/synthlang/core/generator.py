@@ -1,22 +1,25 @@
 """System prompt generator module implementation."""
 import dspy
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 from .base import SynthLangModule
+from .cache import ResponseCache
+from .formatter import normalize_lines
 from .signatures import GenerateSignature
 from .types import GenerationResult, SynthLangSymbols
 
 class SystemPromptGenerator(SynthLangModule):
     """Generates system prompts from task descriptions."""
 
-    def __init__(self, lm: Any):
+    def __init__(self, lm: Any, cache: Optional[ResponseCache] = None):
         """Initialize generator module.
         
         Args:
             lm: Language model instance
+            cache: Optional response cache
         """
-        super().__init__(lm)
+        super().__init__(lm, cache)
         self.predictor = dspy.Predict(GenerateSignature)
 
     def forward(self, task_description: str) -> GenerationResult:
@@ -38,46 +41,22 @@ class SystemPromptGenerator(SynthLangModule):
             raise ValueError("Task description cannot be empty or whitespace")
 
         # Generate prompt with SynthLang format instructions
-        with dspy.context(lm=self.lm):
-            result = self.predictor(
-                task=(
-                    "Convert this task into a SynthLang format system prompt following these rules:\n"
-                    f"1. Use ONLY {SynthLangSymbols.INPUT} (input), {SynthLangSymbols.PROCESS} (process), {SynthLangSymbols.OUTPUT} (output)\n"
-                    f"2. Use {SynthLangSymbols.JOIN} to join related items\n"
-                    f"3. Use {SynthLangSymbols.TRANSFORM} for transformations\n"
-                    "4. Use mathematical operators (+, >, <, ^)\n"
-                    "5. Maximum 30 characters per line\n"
-                    "6. Break complex tasks into steps\n\n"
-                    "Task: " + task_description
-                )
+        result = self._predict(
+            self.predictor,
+            task=(
+                "Convert this task into a SynthLang format system prompt following these rules:\n"
+                f"1. Use ONLY {SynthLangSymbols.INPUT} (input), {SynthLangSymbols.PROCESS} (process), {SynthLangSymbols.OUTPUT} (output)\n"
+                f"2. Use {SynthLangSymbols.JOIN} to join related items\n"
+                f"3. Use {SynthLangSymbols.TRANSFORM} for transformations\n"
+                "4. Use mathematical operators (+, >, <, ^)\n"
+                "5. Maximum 30 characters per line\n"
+                "6. Break complex tasks into steps\n\n"
+                "Task: " + task_description
             )
+        )
 
         # Post-process to ensure format compliance
-        prompt_lines = []
-        for line in str(result.prompt).strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Remove any function calls, quotes, or arrows
-            line = line.replace('->', '=>')
-            line = line.replace('"', '').replace("'", '')
-            
-            # Ensure proper symbol usage
-            if not any(sym in line for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT]):
-                continue
-                
-            # Enforce line length limit
-            if len(line) > 30:
-                parts = line.split(f' {SynthLangSymbols.TRANSFORM} ')
-                if len(parts) > 1:
-                    for i, part in enumerate(parts):
-                        if i == 0:
-                            prompt_lines.append(f"{part} {SynthLangSymbols.TRANSFORM}")
-                        else:
-                            prompt_lines.append(f"  {part}")
-                continue
-                
-            prompt_lines.append(line)
+        prompt_lines = normalize_lines(str(result.prompt))
 
         # Ensure metadata is a dictionary with required fields
         metadata = {
@@ -96,3 +75,15 @@ class SystemPromptGenerator(SynthLangModule):
     def generate(self, task_description: str) -> GenerationResult:
         """Generate prompt using forward method."""
         return self.forward(task_description)
+
+    async def agenerate(self, task_description: str, timeout: Optional[float] = None) -> GenerationResult:
+        """Generate prompt without blocking the event loop.
+        
+        Args:
+            task_description: Description of the task
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Same result as generate()
+        """
+        return await self._arun(self.forward, task_description, timeout=timeout)
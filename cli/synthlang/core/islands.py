@@ -0,0 +1,234 @@
+"""Island-model evolution across processes.
+
+Several sub-populations ("islands") evolve independently in a process pool.
+Every ``migration_interval`` generations each island sends copies of its
+best prompts to the next island in a ring, where they replace the worst
+ones. All islands share one SQLite fitness cache, so a prompt scored on one
+island is never re-scored on another.
+
+Islands are advanced with PromptEvolver's own checkpoint/resume mechanism:
+an epoch runs ``PromptEvolver.evolve`` in a worker process and hands the
+checkpoint state back to the parent for migration.
+"""
+import math
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .cache import FitnessCache
+from .checkpoint import load_checkpoint
+from .evolver import PromptEvolver
+from .population import Population
+
+def dspy_lm(model: str, api_key: Optional[str] = None, **kwargs: Any) -> Any:
+    """Create and configure a DSPy language model inside a worker process.
+
+    Use with functools.partial as a picklable ``lm_factory``.
+    """
+    import dspy
+
+    lm = dspy.LM(model=model, api_key=api_key, **kwargs)
+    dspy.configure(lm=lm)
+    return lm
+
+def _run_island(lm_factory: Callable[[], Any], evolver_kwargs: Dict[str, Any], fitness_cache: str,
+                random_seed: Optional[int], seed_prompt: str, n_generations: int,
+                state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Advance one island to ``n_generations`` in a worker process."""
+    evolver = PromptEvolver(
+        lm=lm_factory(),
+        fitness_cache=FitnessCache(path=fitness_cache),
+        random_seed=random_seed,
+        **evolver_kwargs
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "island.ckpt")
+        result = evolver.evolve(
+            seed_prompt,
+            n_generations=n_generations,
+            checkpoint_path=path,
+            checkpoint_every=n_generations,
+            resume_state=state
+        )
+        state = load_checkpoint(path)
+    evolver.fitness_cache.close()
+    return {
+        'state': state,
+        'cache_hits': result['cache_hits'],
+        'cache_misses': result['cache_misses'],
+        'stop_reason': result['stop_reason']
+    }
+
+class IslandEvolver:
+    """Evolves several sub-populations in parallel with periodic migration."""
+
+    def __init__(self, lm_factory: Callable[[], Any], n_islands: int = 4, migration_interval: int = 5,
+                 migration_size: int = 1, processes: Optional[int] = None,
+                 fitness_cache: Optional[str] = None, random_seed: Optional[int] = None,
+                 **evolver_kwargs: Any):
+        """Initialize island evolver.
+
+        Args:
+            lm_factory: Picklable callable creating the language model in each
+                worker, e.g. functools.partial(dspy_lm, model, api_key)
+            n_islands: Number of sub-populations
+            migration_interval: Generations between migrations
+            migration_size: Best prompts sent to the neighbouring island per migration
+            processes: Worker processes (defaults to one per island, capped at the CPU count)
+            fitness_cache: SQLite file shared by all islands (defaults to a
+                temporary file for the run)
+            random_seed: Base seed; island i uses random_seed + i
+            **evolver_kwargs: Passed to PromptEvolver, e.g. population_size,
+                mutation_rate, fitness_type, test_cases. Stopping criteria
+                such as patience and max_lm_calls apply to each island.
+
+        Raises:
+            ValueError: If n_islands, migration_interval or migration_size is out of range
+        """
+        if n_islands < 1:
+            raise ValueError("n_islands must be at least 1")
+        if migration_interval < 1:
+            raise ValueError("migration_interval must be at least 1")
+        if migration_size < 0:
+            raise ValueError("migration_size cannot be negative")
+        self.lm_factory = lm_factory
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.processes = processes or min(n_islands, os.cpu_count() or 1)
+        self.fitness_cache = fitness_cache
+        self.random_seed = random_seed
+        self.evolver_kwargs = evolver_kwargs
+
+    def _migrate(self, states: List[Dict[str, Any]]) -> int:
+        """Move copies of each island's best prompts to the next island in the ring.
+
+        Returns:
+            Number of prompts migrated
+        """
+        if self.n_islands < 2 or self.migration_size == 0:
+            return 0
+        by_fitness = lambda p: p['fitness']['overall']
+        emigrants = [
+            [
+                {'prompt': p['prompt'], 'fitness': p['fitness']}
+                for p in sorted(state['population'], key=by_fitness, reverse=True)[:self.migration_size]
+            ]
+            for state in states
+        ]
+        migrated = 0
+        for i, state in enumerate(states):
+            incoming = emigrants[i - 1]
+            # Migrants replace the worst copies, counting multiplicity
+            population = sorted(Population(state['population']).expand(), key=by_fitness, reverse=True)
+            keep = max(len(population) - len(incoming), 0)
+            state['population'] = Population(population[:keep] + incoming).to_records()
+            migrated += len(incoming)
+        return migrated
+
+    def evolve(self, seed_prompt: str, n_generations: int = 10) -> Dict[str, Any]:
+        """Evolve all islands from a seed prompt.
+
+        Args:
+            seed_prompt: Initial prompt to evolve from
+            n_generations: Number of generations each island evolves
+
+        Returns:
+            Same shape as PromptEvolver.evolve(), with stats summed over
+            islands, lineage individuals tagged with their 'island', plus:
+                - islands: Best prompt, fitness, generations and
+                  stop_reason per island
+                - migrations: Number of prompts migrated
+            An island that stops early keeps taking part in migration, and
+            the run stops once every island has stopped.
+        """
+        cache_dir = None
+        cache_path = self.fitness_cache
+        if cache_path is None:
+            cache_dir = tempfile.TemporaryDirectory()
+            cache_path = os.path.join(cache_dir.name, "fitness.db")
+
+        states: List[Optional[Dict[str, Any]]] = [None] * self.n_islands
+        stop_reasons: List[Optional[str]] = [None] * self.n_islands
+        cache_hits = cache_misses = migrations = 0
+        try:
+            with ProcessPoolExecutor(max_workers=self.processes) as pool:
+                for epoch in range(math.ceil(n_generations / self.migration_interval)):
+                    target = min((epoch + 1) * self.migration_interval, n_generations)
+                    futures = {
+                        i: pool.submit(
+                            _run_island, self.lm_factory, self.evolver_kwargs, cache_path,
+                            None if self.random_seed is None else self.random_seed + i,
+                            seed_prompt, target, states[i]
+                        )
+                        for i in range(self.n_islands)
+                        if stop_reasons[i] in (None, 'completed')
+                    }
+                    if not futures:
+                        break
+                    for i, future in futures.items():
+                        outcome = future.result()
+                        states[i] = outcome['state']
+                        stop_reasons[i] = outcome['stop_reason']
+                        cache_hits += outcome['cache_hits']
+                        cache_misses += outcome['cache_misses']
+                    if target < n_generations:
+                        migrations += self._migrate(states)
+        finally:
+            if cache_dir is not None:
+                cache_dir.cleanup()
+
+        return self._result(states, stop_reasons, cache_hits, cache_misses, migrations)
+
+    def _result(self, states: List[Dict[str, Any]], stop_reasons: List[str], cache_hits: int,
+                cache_misses: int, migrations: int) -> Dict[str, Any]:
+        """Merge island states into a single evolve() result."""
+        by_fitness = lambda p: p['fitness']['overall']
+        island_best = [max(state['population'], key=by_fitness) for state in states]
+        best = max(island_best, key=by_fitness)
+        totals = {
+            key: sum(state['stats'][key] for state in states)
+            for key in ('total_variants', 'mutation_calls', 'successful_mutations',
+                        'tournament_winners', 'eval_calls', 'lm_cost', 'near_duplicates', 'crossovers',
+                        'surrogate_skipped', 'racing_dropped')
+        }
+        generations = max(state['generation'] for state in states)
+        lineage = [
+            {
+                'generation': generation,
+                'population': [
+                    {**p, 'island': i}
+                    for i, state in enumerate(states)
+                    if generation <= state['generation']
+                    for p in state['stats']['lineage'][generation]['population']
+                ]
+            }
+            for generation in range(generations + 1)
+        ]
+        population = Population(p for state in states for p in state['population'])
+        early = [reason for reason in stop_reasons if reason != 'completed']
+        surrogates = [state['surrogate'] for state in states if state.get('surrogate')]
+        predictions = sum(s['predictions'] for s in surrogates)
+        return {
+            'best_prompt': best['prompt'],
+            'fitness': best['fitness'],
+            'generations': generations,
+            **totals,
+            'cache_hits': cache_hits,
+            'cache_misses': cache_misses,
+            'diversity': population.diversity,
+            'surrogate_mae': sum(s['absolute_error'] for s in surrogates) / predictions if predictions else None,
+            'stop_reason': early[-1] if len(early) == len(stop_reasons) else 'completed',
+            'migrations': migrations,
+            'islands': [
+                {
+                    'best_prompt': best_island['prompt'],
+                    'fitness': best_island['fitness'],
+                    'generations': state['generation'],
+                    'stop_reason': reason
+                }
+                for best_island, state, reason in zip(island_best, states, stop_reasons)
+            ],
+            'lineage': lineage
+        }
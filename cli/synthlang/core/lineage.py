@@ -0,0 +1,127 @@
+"""Streaming storage of evolutionary lineage.
+
+Lineage is written as append-only JSONL, one generation at a time, instead
+of being kept in memory. Each distinct prompt is written once, together
+with its fitness, under a short content hash; generation records only list
+the hashes of their population::
+
+    {"type": "prompt", "id": "3f2a...", "prompt": "↹ data...", "fitness": {...}}
+    {"type": "generation", "generation": 1, "population": ["3f2a...", "3f2a...", "91bc..."]}
+
+Files ending in .gz are compressed. Each generation is appended as its own
+gzip member so the file stays valid, and can be truncated back to any
+generation boundary, after a crash.
+"""
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+def prompt_id(prompt: str) -> str:
+    """Get the interned id of a prompt."""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:16]
+
+def _is_compressed(path: Path) -> bool:
+    return path.suffix == '.gz'
+
+def _iter_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Lazily yield raw records from a lineage file."""
+    opener = gzip.open if _is_compressed(path) else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+class LineageWriter:
+    """Append-only writer of evolutionary lineage."""
+
+    def __init__(self, path: str, offset: Optional[int] = None):
+        """Open a lineage file.
+
+        Args:
+            path: Lineage file; a .gz suffix enables compression
+            offset: Byte offset to resume from, as returned by write_generation().
+                Anything after it (generations written after the last
+                checkpoint of a crashed run) is discarded. None starts a new file.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compressed = _is_compressed(self.path)
+        self._seen: Set[str] = set()
+
+        if offset is None:
+            self._file = open(self.path, 'wb')
+        else:
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+            if offset:
+                self._seen = {
+                    record['id'] for record in _iter_records(self.path) if record['type'] == 'prompt'
+                }
+            self._file = open(self.path, 'ab')
+
+    def write_generation(self, generation: int, population: List[Dict[str, Any]]) -> int:
+        """Append one generation.
+
+        Args:
+            generation: Generation number
+            population: Individuals with 'prompt' and 'fitness'
+
+        Returns:
+            Byte offset of the end of the file, for resuming
+        """
+        lines = []
+        ids = []
+        for individual in population:
+            pid = prompt_id(individual['prompt'])
+            if pid not in self._seen:
+                self._seen.add(pid)
+                lines.append({
+                    'type': 'prompt',
+                    'id': pid,
+                    'prompt': individual['prompt'],
+                    'fitness': individual['fitness']
+                })
+            ids.append(pid)
+        lines.append({'type': 'generation', 'generation': generation, 'population': ids})
+
+        data = ''.join(json.dumps(line, ensure_ascii=False) + '\n' for line in lines).encode('utf-8')
+        if self.compressed:
+            data = gzip.compress(data)
+        self._file.write(data)
+        self._file.flush()
+        return self._file.tell()
+
+    def close(self) -> None:
+        """Close the lineage file."""
+        self._file.close()
+
+    def __enter__(self) -> "LineageWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+def read_lineage(path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily iterate over the generations of a lineage file.
+
+    Only the table of distinct prompts is held in memory, never the full
+    history.
+
+    Args:
+        path: Lineage file written by LineageWriter
+
+    Yields:
+        Dictionaries with 'generation' and 'population', where population
+        lists {'prompt', 'fitness'} for every individual
+    """
+    prompts: Dict[str, Dict[str, Any]] = {}
+    for record in _iter_records(Path(path).expanduser()):
+        if record['type'] == 'prompt':
+            prompts[record['id']] = {'prompt': record['prompt'], 'fitness': record['fitness']}
+        else:
+            yield {
+                'generation': record['generation'],
+                'population': [dict(prompts[pid]) for pid in record['population']]
+            }
@@ -0,0 +1,292 @@
+"""Multi-objective (Pareto) prompt evolution.
+
+NSGA-II over prompt quality and size: parents are picked by crowded binary
+tournaments, and each generation keeps the best non-dominated fronts of
+parents and offspring, breaking ties in the last front by crowding
+distance. The run returns the whole first front, so callers can pick the
+cheapest prompt that meets their quality bar.
+
+Objectives (all minimized internally):
+    - quality: task_score with test cases, otherwise the heuristic
+      overall fitness, maximized
+    - tokens: estimated prompt tokens (whitespace-separated words, as in
+      the translate metrics)
+    - latency: mean seconds per test-case evaluation measured in this run;
+      prompts scored from a persistent fitness cache count as 0
+"""
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .evolver import PromptEvolver
+from .lineage import LineageWriter, read_lineage
+from .population import Population
+
+OBJECTIVES = ('quality', 'tokens', 'latency')
+
+def token_count(prompt: str) -> int:
+    """Estimate the number of tokens in a prompt."""
+    return len(prompt.split())
+
+def _sort_two(points: List[Tuple[float, float]]) -> List[List[int]]:
+    """Non-dominated sort of two objectives in O(n log n).
+
+    Points are swept in order of the first objective. Each front keeps the
+    key (second, first) of its point with the smallest second objective;
+    these keys increase from front to front, and a point is dominated by a
+    front exactly when that key is smaller than its own.
+    """
+    order = sorted(range(len(points)), key=lambda i: points[i])
+    keys: List[Tuple[float, float]] = []
+    fronts: List[List[int]] = []
+    for i in order:
+        key = (points[i][1], points[i][0])
+        front = bisect_left(keys, key)
+        if front == len(keys):
+            keys.append(key)
+            fronts.append([i])
+        else:
+            keys[front] = key
+            fronts[front].append(i)
+    return fronts
+
+def non_dominated_sort(points: np.ndarray) -> List[List[int]]:
+    """Sort points into Pareto fronts.
+
+    Args:
+        points: Array of shape (n, objectives), all objectives minimized
+
+    Returns:
+        Indices of the points in each front, best front first
+    """
+    n = len(points)
+    if n == 0:
+        return []
+    if points.shape[1] == 2:
+        return _sort_two([tuple(p) for p in points.tolist()])
+
+    # dominates[i, j]: i is no worse than j everywhere and better somewhere
+    dominates = ((points[:, None, :] <= points[None, :, :]).all(axis=2) &
+                 (points[:, None, :] < points[None, :, :]).any(axis=2))
+    counts = dominates.sum(axis=0)
+    assigned = np.zeros(n, dtype=bool)
+    fronts = []
+    while not assigned.all():
+        front = np.flatnonzero((counts == 0) & ~assigned)
+        fronts.append(front.tolist())
+        assigned[front] = True
+        counts = counts - dominates[front].sum(axis=0)
+    return fronts
+
+def crowding_distance(points: np.ndarray) -> np.ndarray:
+    """Crowding distance of each point within one front.
+
+    Args:
+        points: Array of shape (n, objectives) for the points of a front
+
+    Returns:
+        Distance per point; boundary points are infinite
+    """
+    n, m = points.shape
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+    for k in range(m):
+        order = np.argsort(points[:, k], kind='stable')
+        values = points[order, k]
+        distance[order[0]] = distance[order[-1]] = np.inf
+        span = values[-1] - values[0]
+        if span > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+class ParetoEvolver(PromptEvolver):
+    """Evolves a front of prompts trading quality against size."""
+
+    def __init__(self, lm: Any, objectives: Sequence[str] = ('quality', 'tokens'), **kwargs: Any):
+        """Initialize Pareto evolver.
+
+        Args:
+            lm: Language model instance
+            objectives: Two or more of OBJECTIVES
+            **kwargs: Passed to PromptEvolver. population_size is the number
+                of distinct prompts kept per generation; selection,
+                surrogate and racing don't apply since a weaker but
+                shorter variant can still join the front.
+
+        Raises:
+            ValueError: If the objectives are unknown or fewer than two
+        """
+        super().__init__(lm, **kwargs)
+        unknown = [o for o in objectives if o not in OBJECTIVES]
+        if unknown or len(set(objectives)) < 2:
+            raise ValueError(f"Objectives must be two or more of {', '.join(OBJECTIVES)}")
+        self.objectives = tuple(dict.fromkeys(objectives))
+
+    def _latency(self, prompt: str) -> float:
+        total, count = self.eval_latency.get(prompt, (0.0, 0))
+        return total / count if count else 0.0
+
+    def _points(self, individuals: List[Dict[str, Any]]) -> np.ndarray:
+        """Objective values to minimize, one row per individual."""
+        columns = []
+        for objective in self.objectives:
+            if objective == 'quality':
+                key = 'task_score' if self.test_cases else 'overall'
+                columns.append([-p['fitness'][key] for p in individuals])
+            elif objective == 'tokens':
+                columns.append([token_count(p['prompt']) for p in individuals])
+            else:
+                columns.append([self._latency(p['prompt']) for p in individuals])
+        return np.array(columns, dtype=np.float64).T
+
+    def _rank(self, individuals: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, List[List[int]]]:
+        """Front index and crowding distance of every individual."""
+        points = self._points(individuals)
+        fronts = non_dominated_sort(points)
+        rank = np.zeros(len(individuals), dtype=np.int64)
+        crowding = np.zeros(len(individuals))
+        for i, front in enumerate(fronts):
+            rank[front] = i
+            crowding[front] = crowding_distance(points[front])
+        return rank, crowding, fronts
+
+    def _truncate(self, individuals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the population_size best individuals by front, then crowding."""
+        if len(individuals) <= self.population_size:
+            return individuals
+        rank, crowding, fronts = self._rank(individuals)
+        kept: List[int] = []
+        for front in fronts:
+            if len(kept) + len(front) <= self.population_size:
+                kept.extend(front)
+            else:
+                by_crowding = sorted(front, key=lambda i: -crowding[i])
+                kept.extend(by_crowding[:self.population_size - len(kept)])
+                break
+        return [individuals[i] for i in sorted(kept)]
+
+    def _front(self, individuals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """First front, fewest tokens first."""
+        points = self._points(individuals)
+        entries = []
+        for i in non_dominated_sort(points)[0]:
+            entry = {
+                'prompt': individuals[i]['prompt'],
+                'fitness': individuals[i]['fitness'],
+                'tokens': token_count(individuals[i]['prompt'])
+            }
+            if 'latency' in self.objectives:
+                entry['latency'] = self._latency(individuals[i]['prompt'])
+            entries.append(entry)
+        return sorted(entries, key=lambda e: (e['tokens'], -e['fitness']['overall']))
+
+    def evolve(self, seed_prompt: str, n_generations: int = 10,
+               cancel_event: Optional[threading.Event] = None,
+               checkpoint_path: Optional[str] = None, checkpoint_every: int = 1,
+               resume_state: Optional[Dict[str, Any]] = None,
+               lineage: Optional[LineageWriter] = None) -> Dict[str, Any]:
+        """Evolve a Pareto front of prompts.
+
+        Args:
+            seed_prompt: Initial prompt to evolve from
+            n_generations: Number of generations to evolve
+            cancel_event: Optional event that stops evolution after the
+                current generation once set
+            checkpoint_path: Not supported in Pareto mode
+            checkpoint_every: Not supported in Pareto mode
+            resume_state: Not supported in Pareto mode
+            lineage: Optional writer to stream lineage to
+
+        Returns:
+            Same keys as PromptEvolver.evolve(), where best_prompt and
+            fitness are the highest-quality prompt of the front, plus:
+                - front: Non-dominated prompts, fewest tokens first, with
+                  'prompt', 'fitness', 'tokens' and, when it is an
+                  objective, 'latency'
+                - objectives: Objectives optimized
+
+        Raises:
+            ValueError: If checkpointing is requested, which Pareto mode
+                doesn't support
+        """
+        if checkpoint_path or resume_state:
+            raise ValueError("Checkpoints are not supported in Pareto mode")
+        hits_before = self.fitness_cache.hits
+        misses_before = self.fitness_cache.misses
+        evals_start = self.eval_calls
+        cost_start = self._lm_cost()
+
+        population = Population()
+        population.add(seed_prompt, self._calculate_fitness(seed_prompt))
+        stats = self._new_stats(lineage)
+        self._record_generation(stats, 0, population, lineage)
+        completed = 0
+
+        stop_reason = 'completed'
+        for gen in range(n_generations):
+            if cancel_event is not None and cancel_event.is_set():
+                stop_reason = 'cancelled'
+                break
+            individuals = population.individuals
+            rank, crowding, fronts = self._rank(individuals)
+            front_before = {individuals[i]['prompt'] for i in fronts[0]}
+
+            def crowded_tournament() -> Dict[str, Any]:
+                i = self.rng.randrange(len(individuals))
+                j = self.rng.randrange(len(individuals))
+                if (rank[j], -crowding[j]) < (rank[i], -crowding[i]):
+                    i = j
+                return individuals[i]
+
+            # All random draws happen before any concurrent work, as in PromptEvolver
+            slots = [self._draw_slot(crowded_tournament) for _ in range(self.population_size)]
+            stats['tournament_winners'] += len(slots)
+            _, fitness = self._vary(slots, population, stats, screen=False)
+
+            # Parents and offspring compete for the next generation
+            combined = Population()
+            for individual in individuals:
+                combined.add(individual['prompt'], individual['fitness'])
+            offspring = {v for v in fitness if v not in combined}
+            for variant in offspring:
+                combined.add(variant, fitness[variant])
+            survivors = self._truncate(combined.individuals)
+            stats['successful_mutations'] += sum(p['prompt'] in offspring for p in survivors)
+            population = Population({'prompt': p['prompt'], 'fitness': p['fitness']} for p in survivors)
+
+            front_after = {p['prompt'] for p in self._front(population.individuals)}
+            stats['stale_generations'] = 0 if front_after - front_before else stats['stale_generations'] + 1
+            stats['eval_calls'] = self.eval_calls - evals_start
+            stats['lm_cost'] = self._lm_cost() - cost_start
+
+            self._record_generation(stats, gen + 1, population, lineage)
+            completed = gen + 1
+            early_stop = self._stop_reason(stats, population)
+            if early_stop:
+                stop_reason = early_stop
+                break
+
+        front = self._front(population.individuals)
+        quality = 'task_score' if self.test_cases else 'overall'
+        best = max(front, key=lambda e: (e['fitness'][quality], -e['tokens']))
+
+        stats['cache_hits'] = self.fitness_cache.hits - hits_before
+        stats['cache_misses'] = self.fitness_cache.misses - misses_before
+        if lineage is not None:
+            stats['lineage'] = read_lineage(stats['lineage_path'])
+
+        return {
+            'best_prompt': best['prompt'],
+            'fitness': best['fitness'],
+            'generations': completed,
+            **stats,
+            'diversity': population.diversity,
+            'surrogate_mae': self.surrogate.mean_absolute_error if self.surrogate is not None else None,
+            'stop_reason': stop_reason,
+            'objectives': list(self.objectives),
+            'front': front
+        }
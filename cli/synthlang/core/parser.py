@@ -0,0 +1,269 @@
+"""Parser for SynthLang prompts.
+
+Grammar, one statement per line::
+
+    statement    := symbol+ expr (TRANSFORM expr)*
+    continuation := INDENT expr (TRANSFORM expr)*
+    expr         := term (operator? term)*
+    term         := word (JOIN word)*
+
+where symbol is one of ↹ (input), ⊕ (process) or Σ (output). An indented
+line without a symbol continues the previous statement, as produced when
+long lines are broken after '=>'. Terms may also be separated by commas.
+
+The parser never raises on malformed input. Problems are collected on
+Program.errors so callers can score imperfect model output as well as
+validate it.
+"""
+import re
+from typing import Dict, List, Optional
+
+from .types import FormatRules, SynthLangSymbols
+
+class Node:
+    """Base AST node with a source span."""
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+
+    def __repr__(self) -> str:
+        fields = ', '.join(
+            f"{name}={getattr(self, name)!r}" for cls in type(self).__mro__
+            for name in getattr(cls, '__slots__', ())
+        )
+        return f"{type(self).__name__}({fields})"
+
+class Term(Node):
+    """Word or joined group of words, e.g. data•source."""
+    __slots__ = ('parts',)
+
+    def __init__(self, parts: List[str], start: int, end: int):
+        super().__init__(start, end)
+        self.parts = parts
+
+class Operator(Node):
+    """Mathematical operator between terms."""
+    __slots__ = ('op',)
+
+    def __init__(self, op: str, start: int, end: int):
+        super().__init__(start, end)
+        self.op = op
+
+class Expr(Node):
+    """Terms and the operators between them."""
+    __slots__ = ('terms', 'operators')
+
+    def __init__(self, terms: List[Term], operators: List[Operator], start: int, end: int):
+        super().__init__(start, end)
+        self.terms = terms
+        self.operators = operators
+
+class Statement(Node):
+    """Single line of a prompt.
+
+    ``kind`` is 'input', 'process' or 'output' for the first symbol of the
+    line, 'continuation' for an indented line, or None for a line that is
+    not valid SynthLang. Consecutive stages are joined by '=>'.
+    """
+    __slots__ = ('kind', 'symbols', 'stages', 'line')
+
+    def __init__(self, kind: Optional[str], symbols: List[str], stages: List[Expr],
+                 line: int, start: int, end: int):
+        super().__init__(start, end)
+        self.kind = kind
+        self.symbols = symbols
+        self.stages = stages
+        self.line = line
+
+    @property
+    def transforms(self) -> int:
+        """Number of '=>' transformations in the statement."""
+        return max(len(self.stages) - 1, 0)
+
+class ParseError(Node):
+    """Problem found while parsing."""
+    __slots__ = ('message', 'line')
+
+    def __init__(self, message: str, line: int, start: int, end: int):
+        super().__init__(start, end)
+        self.message = message
+        self.line = line
+
+class Program(Node):
+    """Parsed prompt."""
+    __slots__ = ('statements', 'errors')
+
+    def __init__(self, statements: List[Statement], errors: List[ParseError], start: int, end: int):
+        super().__init__(start, end)
+        self.statements = statements
+        self.errors = errors
+
+SYMBOL_KINDS = {
+    SynthLangSymbols.INPUT: 'input',
+    SynthLangSymbols.PROCESS: 'process',
+    SynthLangSymbols.OUTPUT: 'output'
+}
+
+# Longest operators first so '=>' is never read as '>'
+_OPERATORS = '|'.join(re.escape(op) for op in sorted(FormatRules.VALID_OPERATORS, key=len, reverse=True))
+_SPECIAL = re.escape(''.join(SYMBOL_KINDS) + SynthLangSymbols.JOIN + ''.join(FormatRules.VALID_OPERATORS) + ',=')
+_TOKEN = re.compile(
+    rf"(?P<transform>{re.escape(SynthLangSymbols.TRANSFORM)})"
+    rf"|(?P<symbol>[{re.escape(''.join(SYMBOL_KINDS))}])"
+    rf"|(?P<join>{re.escape(SynthLangSymbols.JOIN)})"
+    rf"|(?P<op>{_OPERATORS})"
+    rf"|(?P<sep>,)"
+    rf"|(?P<word>[^\s{_SPECIAL}]+|=)"
+    rf"|(?P<space>\s+)"
+)
+
+def _parse_line(text: str, offset: int, line_no: int, previous: Optional[Statement],
+                errors: List[ParseError]) -> Statement:
+    """Parse one non-blank line into a statement."""
+    end = offset + len(text)
+    symbols: List[str] = []
+    stages: List[Expr] = []
+    terms: List[Term] = []
+    operators: List[Operator] = []
+    stage_start = stage_end = None
+    joining = False
+
+    def close_stage(pos: int) -> None:
+        nonlocal terms, operators, stage_start, stage_end
+        if not terms and not operators:
+            errors.append(ParseError("empty expression", line_no, pos, pos))
+            stage_start = stage_end = pos
+        stages.append(Expr(terms, operators, stage_start, stage_end))
+        terms, operators, stage_start, stage_end = [], [], None, None
+
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        start, stop = offset + match.start(), offset + match.end()
+        if kind == 'space':
+            continue
+        if kind == 'symbol':
+            if stages or terms or operators:
+                errors.append(ParseError(f"unexpected symbol {match.group()}", line_no, start, stop))
+            else:
+                symbols.append(match.group())
+            continue
+        if kind == 'transform':
+            close_stage(start)
+            joining = False
+            continue
+        if stage_start is None:
+            stage_start = start
+        stage_end = stop
+        if kind == 'join':
+            if not terms:
+                errors.append(ParseError("join without a left-hand term", line_no, start, stop))
+            elif joining:
+                errors.append(ParseError("join without a right-hand term", line_no, start, stop))
+            joining = bool(terms)
+            if terms:
+                terms[-1].end = stop
+        elif kind == 'op':
+            operators.append(Operator(match.group(), start, stop))
+            joining = False
+        elif kind == 'sep':
+            joining = False
+        else:  # word
+            if joining:
+                terms[-1].parts.append(match.group())
+                terms[-1].end = stop
+                joining = False
+            else:
+                terms.append(Term([match.group()], start, stop))
+
+    if joining:
+        errors.append(ParseError("join without a right-hand term", line_no, end, end))
+    if stage_start is not None:
+        close_stage(end)
+    elif stages:
+        # Trailing '=>' of a line broken for length; the next line continues it
+        stages.append(Expr([], [], end, end))
+
+    if symbols:
+        kind = SYMBOL_KINDS[symbols[0]]
+    elif text[:1].isspace() and previous is not None:
+        kind = 'continuation'
+    else:
+        kind = None
+        errors.append(ParseError("line does not start with a SynthLang symbol", line_no, offset, end))
+    return Statement(kind, symbols, stages, line_no, offset, end)
+
+def parse(prompt: str) -> Program:
+    """Parse a SynthLang prompt.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Program with one statement per non-blank line and any parse errors
+    """
+    statements: List[Statement] = []
+    errors: List[ParseError] = []
+    offset = 0
+    previous = None
+    for line_no, text in enumerate(prompt.split('\n'), 1):
+        if text.strip():
+            previous = _parse_line(text.rstrip(), offset, line_no, previous, errors)
+            statements.append(previous)
+        offset += len(text) + 1
+    return Program(statements, errors, 0, len(prompt))
+
+def features(program: Program) -> Dict[str, float]:
+    """Count the structural features used for heuristic scoring.
+
+    Args:
+        program: Parsed prompt
+
+    Returns:
+        Dictionary containing:
+            - input, process, output: 1.0 if any statement has that symbol
+            - joins: Number of '•' joins
+            - transforms: Number of '=>' transformations
+            - operators: Number of distinct operators used
+    """
+    symbols = {sym for statement in program.statements for sym in statement.symbols}
+    joins = transforms = 0
+    operators = set()
+    for statement in program.statements:
+        transforms += statement.transforms
+        for stage in statement.stages:
+            for term in stage.terms:
+                joins += len(term.parts) - 1
+            operators.update(op.op for op in stage.operators)
+    return {
+        'input': float(SynthLangSymbols.INPUT in symbols),
+        'process': float(SynthLangSymbols.PROCESS in symbols),
+        'output': float(SynthLangSymbols.OUTPUT in symbols),
+        'joins': float(joins),
+        'transforms': float(transforms),
+        'operators': float(len(operators))
+    }
+
+def validate(prompt: str) -> List[str]:
+    """Check a prompt against the SynthLang format rules.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Human-readable problems, empty if the prompt is valid
+    """
+    program = parse(prompt)
+    problems = [f"line {error.line}: {error.message}" for error in program.errors]
+    for statement in program.statements:
+        length = statement.end - statement.start
+        if length > FormatRules.MAX_LINE_LENGTH:
+            problems.append(
+                f"line {statement.line}: {length} characters exceeds {FormatRules.MAX_LINE_LENGTH}"
+            )
+    kinds = {statement.kind for statement in program.statements}
+    for kind in ('input', 'output'):
+        if kind not in kinds:
+            problems.append(f"missing {kind} statement")
+    return problems
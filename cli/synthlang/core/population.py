@@ -0,0 +1,177 @@
+"""Population structures for prompt evolution.
+
+A Population stores each distinct prompt once, keyed by its normalized
+digest, with a multiplicity instead of repeated copies. MinHashIndex finds
+near-duplicate prompts from character n-gram MinHash signatures, so
+variants that barely differ from a known prompt can be rejected before
+paying for their fitness evaluation.
+"""
+import zlib
+from typing import Any, Collection, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .cache import normalize_prompt, prompt_digest
+
+class Population:
+    """Distinct individuals with multiplicities."""
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        """Initialize population.
+
+        Args:
+            records: Individuals with 'prompt', 'fitness' and an optional
+                'count' (default 1), e.g. a checkpointed population
+        """
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            self.add(record['prompt'], record['fitness'], record.get('count', 1))
+
+    def add(self, prompt: str, fitness: Dict[str, float], count: int = 1) -> Dict[str, Any]:
+        """Add copies of an individual.
+
+        Prompts that normalize to an existing individual increase its
+        multiplicity; the first text and fitness seen are kept.
+
+        Args:
+            prompt: Prompt text
+            fitness: Fitness scores
+            count: Number of copies
+
+        Returns:
+            The stored individual
+        """
+        key = prompt_digest(prompt)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {'prompt': prompt, 'fitness': fitness, 'count': 0}
+        entry['count'] += count
+        return entry
+
+    def __contains__(self, prompt: str) -> bool:
+        return prompt_digest(prompt) in self._entries
+
+    def __len__(self) -> int:
+        """Number of distinct individuals."""
+        return len(self._entries)
+
+    @property
+    def individuals(self) -> List[Dict[str, Any]]:
+        """Distinct individuals, in order of first insertion."""
+        return list(self._entries.values())
+
+    @property
+    def size(self) -> int:
+        """Number of individuals counting multiplicity."""
+        return sum(entry['count'] for entry in self._entries.values())
+
+    @property
+    def diversity(self) -> float:
+        """Share of distinct prompts in the population."""
+        return len(self._entries) / self.size if self._entries else 0.0
+
+    def best(self) -> Dict[str, Any]:
+        """Get the fittest individual."""
+        return max(self._entries.values(), key=lambda x: x['fitness']['overall'])
+
+    def expand(self) -> List[Dict[str, Any]]:
+        """List individuals with one {'prompt', 'fitness'} per copy."""
+        return [
+            {'prompt': entry['prompt'], 'fitness': entry['fitness']}
+            for entry in self._entries.values()
+            for _ in range(entry['count'])
+        ]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get JSON-serializable records, for checkpoints."""
+        return [dict(entry) for entry in self._entries.values()]
+
+# Universal hashing modulo a Mersenne prime keeps products within uint64
+_PRIME = (1 << 31) - 1
+
+class MinHashIndex:
+    """Near-duplicate lookup over character n-gram MinHash signatures.
+
+    Signatures are split into bands for locality-sensitive hashing, so a
+    query only compares against prompts sharing at least one band.
+    """
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 64, bands: int = 16,
+                 ngram: int = 3, seed: int = 1):
+        """Initialize index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of n-gram sets
+                for two prompts to count as near-duplicates
+            num_perm: Number of hash functions per signature
+            bands: Number of LSH bands; must divide num_perm
+            ngram: Character n-gram length
+            seed: Seed for the hash functions
+
+        Raises:
+            ValueError: If bands doesn't divide num_perm
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        self.threshold = threshold
+        self.ngram = ngram
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+
+    def signature(self, text: str) -> np.ndarray:
+        """Compute the MinHash signature of a prompt."""
+        text = normalize_prompt(text)
+        n = self.ngram
+        shingles = {text[i:i + n] for i in range(max(len(text) - n + 1, 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) % _PRIME for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: str, text: str) -> None:
+        """Index a prompt.
+
+        Args:
+            key: Identifier returned by query()
+            text: Prompt text
+        """
+        signature = self.signature(text)
+        self._signatures[key] = signature
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band, []).append(key)
+
+    def query(self, text: str, exclude: Collection[str] = ()) -> Optional[str]:
+        """Find an indexed near-duplicate of a prompt.
+
+        Args:
+            text: Prompt text
+            exclude: Keys to leave out of the comparison
+
+        Returns:
+            Key of the most similar indexed prompt at or above the
+            threshold, or None
+        """
+        signature = self.signature(text)
+        candidates = {
+            key
+            for bucket, band in zip(self._buckets, self._band_keys(signature))
+            for key in bucket.get(band, ())
+        } - set(exclude)
+        best, best_similarity = None, self.threshold
+        for key in candidates:
+            similarity = float(np.mean(self._signatures[key] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = key, similarity
+        return best
+
+    def __len__(self) -> int:
+        return len(self._signatures)
@@ -1,29 +1,43 @@
 """Prompt management module for storing and retrieving evolved prompts."""
-import json
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .base import SynthLangModule
+from .prompt_store import JSONPromptStore, PromptStore, SQLitePromptStore, migrate_json_to_sqlite
 
-class PromptManager(SynthLangModule):
+# SQLite database used by the sqlite backend, inside the storage directory
+SQLITE_DB_NAME = "prompts.db"
+
+class PromptManager:
     """Manages storage and retrieval of evolved prompts."""
 
-    def __init__(self, storage_dir: Optional[str] = None):
+    def __init__(self, storage_dir: Optional[str] = None, backend: Optional[str] = None):
         """Initialize prompt manager.
         
         Args:
             storage_dir: Optional directory for prompt storage.
                        Defaults to ~/.synthlang/prompts/
+            backend: Storage backend, 'json' (one file per prompt) or 'sqlite'.
+                   Defaults to SYNTHLANG_PROMPT_BACKEND, or 'sqlite' once the
+                   directory has been migrated and 'json' otherwise.
         """
-        super().__init__(None)  # No LM needed for storage operations
         self.storage_dir = Path(storage_dir or os.path.expanduser("~/.synthlang/prompts"))
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        
-    def _get_prompt_path(self, name: str) -> Path:
-        """Get full path for a prompt file."""
-        return self.storage_dir / f"{name}.json"
+        self.backend = self._resolve_backend(backend)
+        self.store: PromptStore = (
+            SQLitePromptStore(self.storage_dir / SQLITE_DB_NAME)
+            if self.backend == "sqlite" else JSONPromptStore(self.storage_dir)
+        )
+        
+    def _resolve_backend(self, backend: Optional[str]) -> str:
+        """Pick the storage backend to use."""
+        backend = (backend or os.getenv("SYNTHLANG_PROMPT_BACKEND") or "auto").lower()
+        if backend == "auto":
+            backend = "sqlite" if (self.storage_dir / SQLITE_DB_NAME).exists() else "json"
+        if backend not in ("json", "sqlite"):
+            raise ValueError(f"Unknown prompt storage backend: {backend}")
+        return backend
         
     def save(self, name: str, prompt: str, metadata: Optional[Dict] = None) -> None:
         """Save a prompt with metadata.
@@ -33,10 +47,7 @@ class PromptManager(SynthLangModule):
             prompt: The prompt content
             metadata: Optional metadata about the prompt
         """
-        path = self._get_prompt_path(name)
-        
-        # Prepare prompt data
-        data = {
+        self.store.save({
             "name": name,
             "prompt": prompt,
             "metadata": {
@@ -44,11 +55,7 @@ class PromptManager(SynthLangModule):
                 "created": datetime.now().isoformat(),
                 "version": "1.0"
             }
-        }
-        
-        # Save to file
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
+        })
             
     def load(self, name: str) -> Dict[str, Any]:
         """Load a saved prompt.
@@ -62,13 +69,7 @@ class PromptManager(SynthLangModule):
         Raises:
             FileNotFoundError: If prompt doesn't exist
         """
-        path = self._get_prompt_path(name)
-        
-        if not path.exists():
-            raise FileNotFoundError(f"No prompt found with name: {name}")
-            
-        with open(path) as f:
-            return json.load(f)
+        return self.store.load(name)
             
     def list(self) -> List[Dict[str, Any]]:
         """List all saved prompts.
@@ -76,11 +77,28 @@ class PromptManager(SynthLangModule):
         Returns:
             List of prompt data dictionaries
         """
-        prompts = []
-        for path in self.storage_dir.glob("*.json"):
-            with open(path) as f:
-                prompts.append(json.load(f))
-        return prompts
+        return self.store.list()
+        
+    def list_metadata(self, limit: Optional[int] = None, offset: int = 0, sort: str = "name",
+                      min_fitness: Optional[float] = None, since: Optional[str] = None,
+                      tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List prompt summaries from the metadata index.
+        
+        Args:
+            limit: Maximum number of prompts to return
+            offset: Number of matching prompts to skip
+            sort: One of name, created or fitness (best/newest first)
+            min_fitness: Only include prompts with at least this overall fitness
+            since: Only include prompts created at or after this ISO timestamp
+            tag: Only include prompts with this tag
+            
+        Returns:
+            List of dictionaries with name, created, fitness and tags
+        """
+        return self.store.list_metadata(
+            limit=limit, offset=offset, sort=sort,
+            min_fitness=min_fitness, since=since, tag=tag
+        )
         
     def delete(self, name: str) -> None:
         """Delete a saved prompt.
@@ -91,12 +109,22 @@ class PromptManager(SynthLangModule):
         Raises:
             FileNotFoundError: If prompt doesn't exist
         """
-        path = self._get_prompt_path(name)
+        self.store.delete(name)
         
-        if not path.exists():
-            raise FileNotFoundError(f"No prompt found with name: {name}")
-            
-        path.unlink()
+    def migrate(self) -> int:
+        """Migrate prompts from the JSON directory into the SQLite backend.
+        
+        JSON files are left in place. After migration this manager, and new
+        managers on the same directory, use the SQLite backend.
+        
+        Returns:
+            Number of prompts migrated
+        """
+        db_path = self.storage_dir / SQLITE_DB_NAME
+        count = migrate_json_to_sqlite(self.storage_dir, db_path)
+        self.backend = "sqlite"
+        self.store = SQLitePromptStore(db_path)
+        return count
         
     def compare(self, name1: str, name2: str) -> Dict[str, Any]:
         """Compare two saved prompts.
@@ -0,0 +1,376 @@
+"""Storage backends for saved prompts."""
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Sort orders supported by list_metadata(); fitness and created sort newest/best first
+SORT_KEYS = ("name", "created", "fitness")
+
+def fitness_value(metadata: Dict[str, Any]) -> Optional[float]:
+    """Get the overall fitness from prompt metadata.
+
+    Fitness is stored either as a plain number or as the score dictionary
+    produced by the evolver, in which case its overall score is used.
+
+    Args:
+        metadata: Prompt metadata
+
+    Returns:
+        Overall fitness, or None if the prompt has no fitness
+    """
+    fitness = metadata.get("fitness")
+    if isinstance(fitness, dict):
+        fitness = fitness.get("overall")
+    try:
+        return float(fitness) if fitness is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def prompt_tags(metadata: Dict[str, Any]) -> List[str]:
+    """Get the tags from prompt metadata as a list."""
+    tags = metadata.get("tags") or []
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    return [str(tag).strip() for tag in tags if str(tag).strip()]
+
+def summarize(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the index entry for a prompt record."""
+    metadata = record.get("metadata", {})
+    return {
+        "name": record["name"],
+        "created": metadata.get("created"),
+        "fitness": fitness_value(metadata),
+        "tags": prompt_tags(metadata)
+    }
+
+def query_summaries(summaries: Iterable[Dict[str, Any]], limit: Optional[int] = None,
+                    offset: int = 0, sort: str = "name", min_fitness: Optional[float] = None,
+                    since: Optional[str] = None, tag: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Filter, sort and paginate prompt summaries in memory.
+
+    Args:
+        summaries: Index entries to query
+        limit: Maximum number of entries to return
+        offset: Number of matching entries to skip
+        sort: One of name, created or fitness
+        min_fitness: Only include prompts with at least this overall fitness
+        since: Only include prompts created at or after this ISO timestamp
+        tag: Only include prompts with this tag
+
+    Returns:
+        Matching summaries for the requested page
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort}")
+    matches = [
+        s for s in summaries
+        if (min_fitness is None or (s["fitness"] is not None and s["fitness"] >= min_fitness))
+        and (since is None or (s["created"] or "") >= since)
+        and (tag is None or tag in s["tags"])
+    ]
+    matches.sort(key=lambda s: s["name"])
+    if sort != "name":
+        # Best/newest first (stable, so ties stay in name order), missing values last
+        matches.sort(key=lambda s: (s[sort] is not None, s[sort] or 0), reverse=True)
+    end = None if limit is None else offset + limit
+    return matches[offset:end]
+
+class PromptStore:
+    """Interface for prompt storage backends.
+
+    Records are dictionaries with name, prompt and metadata keys, as
+    produced by PromptManager.save().
+    """
+
+    def save(self, record: Dict[str, Any]) -> None:
+        """Save or replace a prompt record."""
+        raise NotImplementedError
+
+    def load(self, name: str) -> Dict[str, Any]:
+        """Load a prompt record.
+
+        Raises:
+            FileNotFoundError: If prompt doesn't exist
+        """
+        raise NotImplementedError
+
+    def delete(self, name: str) -> None:
+        """Delete a prompt record.
+
+        Raises:
+            FileNotFoundError: If prompt doesn't exist
+        """
+        raise NotImplementedError
+
+    def list(self) -> List[Dict[str, Any]]:
+        """List all prompt records."""
+        raise NotImplementedError
+
+    def list_metadata(self, limit: Optional[int] = None, offset: int = 0, sort: str = "name",
+                      min_fitness: Optional[float] = None, since: Optional[str] = None,
+                      tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List prompt summaries without loading prompt bodies.
+
+        Returns entries with name, created, fitness and tags keys. See
+        query_summaries() for the filter and paging arguments.
+        """
+        return query_summaries(
+            (summarize(record) for record in self.list()),
+            limit=limit, offset=offset, sort=sort,
+            min_fitness=min_fitness, since=since, tag=tag
+        )
+
+class JSONPromptStore(PromptStore):
+    """Stores each prompt as a JSON file in a directory.
+
+    A metadata index next to the prompt files answers list_metadata()
+    without parsing every prompt. It is kept current on save and delete and
+    reconciled against the directory listing for files changed externally.
+    """
+
+    INDEX_NAME = ".prompt_index"
+
+    def __init__(self, storage_dir: Path):
+        """Initialize JSON directory store.
+
+        Args:
+            storage_dir: Directory holding one JSON file per prompt
+        """
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def _index_path(self) -> Path:
+        return self.storage_dir / self.INDEX_NAME
+
+    def _write_index(self) -> None:
+        """Atomically persist the metadata index."""
+        tmp_path = self._index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the metadata index, reconciling it with the directory."""
+        if self._index is None:
+            try:
+                with open(self._index_path) as f:
+                    self._index = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._index = {}
+
+        names = {path.stem for path in self.storage_dir.glob("*.json")}
+        stale = self._index.keys() - names
+        missing = names - self._index.keys()
+        for name in stale:
+            del self._index[name]
+        for name in missing:
+            self._index[name] = summarize(self.load(name))
+        if stale or missing:
+            self._write_index()
+        return self._index
+
+    def _get_prompt_path(self, name: str) -> Path:
+        """Get full path for a prompt file."""
+        return self.storage_dir / f"{name}.json"
+
+    def save(self, record: Dict[str, Any]) -> None:
+        with open(self._get_prompt_path(record["name"]), 'w') as f:
+            json.dump(record, f, indent=2)
+        index = self._load_index()
+        index[record["name"]] = summarize(record)
+        self._write_index()
+
+    def load(self, name: str) -> Dict[str, Any]:
+        path = self._get_prompt_path(name)
+        if not path.exists():
+            raise FileNotFoundError(f"No prompt found with name: {name}")
+        with open(path) as f:
+            return json.load(f)
+
+    def delete(self, name: str) -> None:
+        path = self._get_prompt_path(name)
+        if not path.exists():
+            raise FileNotFoundError(f"No prompt found with name: {name}")
+        path.unlink()
+        index = self._load_index()
+        index.pop(name, None)
+        self._write_index()
+
+    def list(self) -> List[Dict[str, Any]]:
+        prompts = []
+        for path in sorted(self.storage_dir.glob("*.json")):
+            with open(path) as f:
+                prompts.append(json.load(f))
+        return prompts
+
+    def list_metadata(self, limit: Optional[int] = None, offset: int = 0, sort: str = "name",
+                      min_fitness: Optional[float] = None, since: Optional[str] = None,
+                      tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        return query_summaries(
+            self._load_index().values(),
+            limit=limit, offset=offset, sort=sort,
+            min_fitness=min_fitness, since=since, tag=tag
+        )
+
+class SQLitePromptStore(PromptStore):
+    """Stores prompts in a SQLite database with indexed metadata columns."""
+
+    def __init__(self, db_path: Path):
+        """Initialize SQLite store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS prompts ("
+            "name TEXT PRIMARY KEY, prompt TEXT NOT NULL, metadata TEXT NOT NULL, "
+            "created TEXT, fitness REAL);"
+            "CREATE INDEX IF NOT EXISTS prompts_created ON prompts (created);"
+            "CREATE INDEX IF NOT EXISTS prompts_fitness ON prompts (fitness);"
+            "CREATE TABLE IF NOT EXISTS prompt_tags ("
+            "name TEXT NOT NULL REFERENCES prompts (name) ON DELETE CASCADE, "
+            "tag TEXT NOT NULL, PRIMARY KEY (name, tag));"
+            "CREATE INDEX IF NOT EXISTS prompt_tags_tag ON prompt_tags (tag);"
+        )
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.commit()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """Insert or replace a record without committing."""
+        metadata = record.get("metadata", {})
+        self._conn.execute(
+            "INSERT OR REPLACE INTO prompts (name, prompt, metadata, created, fitness) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                record["name"],
+                record["prompt"],
+                json.dumps(metadata),
+                metadata.get("created"),
+                fitness_value(metadata)
+            )
+        )
+        self._conn.execute("DELETE FROM prompt_tags WHERE name = ?", (record["name"],))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO prompt_tags (name, tag) VALUES (?, ?)",
+            [(record["name"], tag) for tag in prompt_tags(metadata)]
+        )
+
+    @staticmethod
+    def _record(row: tuple) -> Dict[str, Any]:
+        return {"name": row[0], "prompt": row[1], "metadata": json.loads(row[2])}
+
+    def save(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._write(record)
+            self._conn.commit()
+
+    def save_many(self, records: List[Dict[str, Any]]) -> int:
+        """Save many records in a single transaction.
+
+        Args:
+            records: Prompt records to save
+
+        Returns:
+            Number of records saved
+        """
+        count = 0
+        with self._lock:
+            for record in records:
+                self._write(record)
+                count += 1
+            self._conn.commit()
+        return count
+
+    def load(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, prompt, metadata FROM prompts WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No prompt found with name: {name}")
+        return self._record(row)
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM prompts WHERE name = ?", (name,)).rowcount
+            self._conn.commit()
+        if not deleted:
+            raise FileNotFoundError(f"No prompt found with name: {name}")
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, prompt, metadata FROM prompts ORDER BY name"
+            ).fetchall()
+        return [self._record(row) for row in rows]
+
+    def list_metadata(self, limit: Optional[int] = None, offset: int = 0, sort: str = "name",
+                      min_fitness: Optional[float] = None, since: Optional[str] = None,
+                      tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort}")
+        clauses, params = [], []
+        if min_fitness is not None:
+            clauses.append("fitness >= ?")
+            params.append(min_fitness)
+        if since is not None:
+            clauses.append("created >= ?")
+            params.append(since)
+        if tag is not None:
+            clauses.append("EXISTS (SELECT 1 FROM prompt_tags t WHERE t.name = prompts.name AND t.tag = ?)")
+            params.append(tag)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "name" if sort == "name" else f"{sort} IS NULL, {sort} DESC, name"
+        params.extend([-1 if limit is None else limit, offset])
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT name, created, fitness FROM prompts {where} "
+                f"ORDER BY {order} LIMIT ? OFFSET ?",
+                params
+            ).fetchall()
+            tags: Dict[str, List[str]] = {row[0]: [] for row in rows}
+            if rows:
+                placeholders = ",".join("?" * len(rows))
+                for name, tag_value in self._conn.execute(
+                    f"SELECT name, tag FROM prompt_tags WHERE name IN ({placeholders}) ORDER BY tag",
+                    [row[0] for row in rows]
+                ):
+                    tags[name].append(tag_value)
+
+        return [
+            {"name": name, "created": created, "fitness": fitness, "tags": tags[name]}
+            for name, created, fitness in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+def migrate_json_to_sqlite(storage_dir: Path, db_path: Path) -> int:
+    """Copy every prompt from a JSON directory into a SQLite store.
+
+    The JSON files are left in place, so the directory backend keeps working.
+
+    Args:
+        storage_dir: Directory holding one JSON file per prompt
+        db_path: SQLite database to create or update
+
+    Returns:
+        Number of prompts migrated
+    """
+    source = JSONPromptStore(storage_dir)
+    target = SQLitePromptStore(db_path)
+    try:
+        return target.save_many(source.list())
+    finally:
+        target.close()
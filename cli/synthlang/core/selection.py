@@ -0,0 +1,200 @@
+"""Parent selection strategies for prompt evolution.
+
+A strategy is prepared once per generation. Fitness values are copied into
+an array, individuals are ranked once, and weighted strategies build prefix
+sums. Every pick after that is O(log n) or better, so generations with
+thousands of distinct individuals don't pay a linear scan per slot.
+
+Strategies work on distinct individuals but weight each one by its count,
+so a pick has the same odds as on the population with every copy listed.
+"""
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .population import Population
+
+class CumulativeIndex:
+    """Prefix sums of static weights for O(log n) weighted sampling."""
+
+    def __init__(self, weights: Sequence[float]):
+        """Build the index in O(n).
+
+        Args:
+            weights: Non-negative weight per index, not all zero
+        """
+        self.cumulative = list(accumulate(float(w) for w in weights))
+        self.total = self.cumulative[-1]
+
+    def __len__(self) -> int:
+        return len(self.cumulative)
+
+    def find(self, value: float) -> int:
+        """Find the index whose cumulative weight range contains value.
+
+        Args:
+            value: Number in [0, total)
+
+        Returns:
+            Smallest index i whose prefix sum through i exceeds value
+        """
+        return min(bisect_right(self.cumulative, value), len(self.cumulative) - 1)
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw an index with probability proportional to its weight."""
+        return self.find(rng.random() * self.total)
+
+class SelectionStrategy:
+    """Base class for parent selection.
+
+    Subclasses implement _index() to build their per-generation index and
+    select() to draw one parent from it.
+    """
+
+    name = ''
+
+    def prepare(self, population: Population) -> None:
+        """Index a population for the picks of one generation.
+
+        Args:
+            population: Current population
+        """
+        self.individuals = population.individuals
+        self.fitness = np.fromiter(
+            (p['fitness']['overall'] for p in self.individuals),
+            dtype=np.float64, count=len(self.individuals)
+        )
+        self.counts = np.fromiter(
+            (p['count'] for p in self.individuals),
+            dtype=np.float64, count=len(self.individuals)
+        )
+        # Best first; ties keep insertion order
+        self.order = np.argsort(-self.fitness, kind='stable')
+        self.ranked = [self.individuals[i] for i in self.order.tolist()]
+        # First position of each ranked individual's copies in the expanded population
+        self.starts = np.concatenate(([0.0], np.cumsum(self.counts[self.order])))
+        self._index()
+
+    def _index(self) -> None:
+        pass
+
+    def elites(self) -> List[Dict[str, Any]]:
+        """Individuals copied unchanged into the next generation."""
+        return []
+
+    def select(self, rng: random.Random) -> Dict[str, Any]:
+        """Draw one parent.
+
+        Args:
+            rng: Random generator of the run
+
+        Returns:
+            Selected individual
+        """
+        raise NotImplementedError
+
+class TournamentSelection(SelectionStrategy):
+    """Best of ``size`` different copies drawn uniformly.
+
+    All contestants of such a tournament come from the copies at position
+    s or later (0 = best) of the N copies with probability
+    C(N-s, size) / C(N, size). An individual whose copies start at s wins
+    with the difference of that probability at s and at the start of the
+    next individual, so instead of drawing the contestants a pick draws
+    the winner directly from these weights.
+    """
+
+    name = 'tournament'
+
+    def __init__(self, size: int = 3):
+        self.size = size
+
+    def _index(self) -> None:
+        total = self.starts[-1]
+        k = min(self.size, int(total))
+        # C(N-s, k) / C(N, k) as a product of k ratios
+        tail = np.ones_like(self.starts)
+        for j in range(k):
+            tail *= np.maximum(total - self.starts - j, 0) / (total - j)
+        self.index = CumulativeIndex((tail[:-1] - tail[1:]).tolist())
+
+    def select(self, rng: random.Random) -> Dict[str, Any]:
+        return self.ranked[self.index.sample(rng)]
+
+class RankSelection(SelectionStrategy):
+    """Linear ranking: the best of N copies is N times as likely as the worst."""
+
+    name = 'rank'
+
+    def _index(self) -> None:
+        # Copies at positions s..s+c-1 weigh N-s down to N-s-c+1
+        counts = np.diff(self.starts)
+        weights = counts * (self.starts[-1] - self.starts[:-1]) - counts * (counts - 1) / 2
+        self.index = CumulativeIndex(weights.tolist())
+
+    def select(self, rng: random.Random) -> Dict[str, Any]:
+        return self.ranked[self.index.sample(rng)]
+
+class ProportionalSelection(SelectionStrategy):
+    """Fitness-proportional (roulette wheel) selection.
+
+    Fitness is shifted so the worst individual keeps a small chance; a
+    population of equal fitness is sampled uniformly.
+    """
+
+    name = 'proportional'
+
+    def _index(self) -> None:
+        weights = self.fitness - self.fitness.min()
+        floor = weights.max() * 0.01 if weights.max() > 0 else 1.0
+        self.index = CumulativeIndex(((weights + floor) * self.counts).tolist())
+
+    def select(self, rng: random.Random) -> Dict[str, Any]:
+        return self.individuals[self.index.sample(rng)]
+
+class ElitistSelection(SelectionStrategy):
+    """Carries the best individuals over unchanged, then delegates to another strategy."""
+
+    name = 'elitism'
+
+    def __init__(self, inner: SelectionStrategy, count: int = 1):
+        self.inner = inner
+        self.count = count
+
+    def prepare(self, population: Population) -> None:
+        self.inner.prepare(population)
+
+    def elites(self) -> List[Dict[str, Any]]:
+        return self.inner.ranked[:self.count]
+
+    def select(self, rng: random.Random) -> Dict[str, Any]:
+        return self.inner.select(rng)
+
+SELECTION_STRATEGIES = ('tournament', 'rank', 'proportional', 'elitism')
+
+def create_selection(name: str, tournament_size: int = 3, elite: int = 1) -> SelectionStrategy:
+    """Create a selection strategy by name.
+
+    Args:
+        name: One of SELECTION_STRATEGIES
+        tournament_size: Tournament size for 'tournament' and 'elitism'
+        elite: Individuals carried over unchanged by 'elitism'
+
+    Returns:
+        Selection strategy
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name == 'tournament':
+        return TournamentSelection(tournament_size)
+    if name == 'rank':
+        return RankSelection()
+    if name == 'proportional':
+        return ProportionalSelection()
+    if name == 'elitism':
+        return ElitistSelection(TournamentSelection(tournament_size), elite)
+    raise ValueError(f"Unknown selection strategy: {name}")
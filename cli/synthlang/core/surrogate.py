@@ -0,0 +1,104 @@
+"""Surrogate model of task fitness.
+
+An online ridge regression from the structural features in
+scoring.FEATURES to the task score observed on test cases. It is trained
+on every candidate evaluated during a run and used to skip the LM
+evaluation of candidates it predicts to be clearly worse than their
+parent.
+"""
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .scoring import FEATURES
+
+class SurrogateModel:
+    """Incrementally trained linear predictor of task scores."""
+
+    def __init__(self, ridge: float = 1.0, min_samples: int = 8):
+        """Initialize surrogate.
+
+        Args:
+            ridge: L2 regularization strength
+            min_samples: Observations needed before predictions are made
+        """
+        self.ridge = ridge
+        self.min_samples = min_samples
+        dim = len(FEATURES) + 1
+        self._xtx = np.zeros((dim, dim))
+        self._xty = np.zeros(dim)
+        self._weights: Optional[np.ndarray] = None
+        self.samples = 0
+        self.predictions = 0
+        self.absolute_error = 0.0
+
+    @staticmethod
+    def design(counts: Dict[str, np.ndarray]) -> np.ndarray:
+        """Build the feature matrix from scoring.count_features() output."""
+        columns = [counts[name] for name in FEATURES]
+        return np.column_stack([np.ones_like(columns[0])] + columns)
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough observations have been seen to predict."""
+        return self.samples >= self.min_samples
+
+    def predict(self, features: np.ndarray) -> Optional[np.ndarray]:
+        """Predict task scores.
+
+        Args:
+            features: Matrix from design()
+
+        Returns:
+            Predicted scores clipped to [0, 1], or None until ready
+        """
+        if not self.ready:
+            return None
+        if self._weights is None:
+            penalty = self.ridge * np.eye(len(self._xty))
+            penalty[0, 0] = 0.0  # Don't shrink the intercept
+            self._weights = np.linalg.solve(self._xtx + penalty, self._xty)
+        return np.clip(features @ self._weights, 0.0, 1.0)
+
+    def update(self, features: np.ndarray, scores: Sequence[float],
+               predicted: Optional[np.ndarray] = None) -> None:
+        """Train on observed task scores.
+
+        Args:
+            features: Matrix from design()
+            scores: Observed task scores
+            predicted: Predictions made for the same rows before they were
+                observed, to track the surrogate's error
+        """
+        targets = np.asarray(scores, dtype=np.float64)
+        if predicted is not None:
+            self.predictions += len(targets)
+            self.absolute_error += float(np.abs(predicted - targets).sum())
+        self._xtx += features.T @ features
+        self._xty += features.T @ targets
+        self.samples += len(targets)
+        self._weights = None
+
+    @property
+    def mean_absolute_error(self) -> Optional[float]:
+        """Mean absolute error of predictions checked against real evaluations."""
+        return self.absolute_error / self.predictions if self.predictions else None
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get the model state, for checkpoints."""
+        return {
+            'xtx': self._xtx.tolist(),
+            'xty': self._xty.tolist(),
+            'samples': self.samples,
+            'predictions': self.predictions,
+            'absolute_error': self.absolute_error
+        }
+
+    def load(self, state: Dict[str, Any]) -> None:
+        """Restore state from to_json()."""
+        self._xtx = np.array(state['xtx'])
+        self._xty = np.array(state['xty'])
+        self.samples = state['samples']
+        self.predictions = state['predictions']
+        self.absolute_error = state['absolute_error']
+        self._weights = None
@@ -4,19 +4,22 @@ from typing import Dict, Any, Optional
 import dspy
 
 from .base import SynthLangModule
+from .cache import ResponseCache
+from .formatter import normalize_lines
 from .signatures import TranslateSignature
 from .types import TranslationResult, SynthLangSymbols
 
 class FrameworkTranslator(SynthLangModule):
     """Translates natural language prompts to SynthLang format."""
 
-    def __init__(self, lm: Any):
+    def __init__(self, lm: Any, cache: Optional[ResponseCache] = None):
         """Initialize translator module.
         
         Args:
             lm: Language model instance
+            cache: Optional response cache
         """
-        super().__init__(lm)
+        super().__init__(lm, cache)
         self.predictor = dspy.Predict(TranslateSignature)
 
     def forward(self, source_code: str, instructions: Optional[str] = None) -> TranslationResult:
@@ -39,62 +42,36 @@ class FrameworkTranslator(SynthLangModule):
             raise ValueError("Source code cannot be empty or whitespace")
 
         # Generate translation with instructions
-        with dspy.context(lm=self.lm):
-            result = self.predictor(
-                source=(
-                    (instructions if instructions else (
-                        "Convert this to SynthLang format following these EXACT rules:\n"
-                        f"1. Use ONLY {SynthLangSymbols.INPUT} (input), {SynthLangSymbols.PROCESS} (process), {SynthLangSymbols.OUTPUT} (output)\n"
-                        f"2. Use {SynthLangSymbols.JOIN} to join related items\n"
-                        f"3. Use {SynthLangSymbols.TRANSFORM} for transformations\n"
-                        "4. Use mathematical operators (+, >, <, ^)\n"
-                        "5. Maximum 30 characters per line\n"
-                        "6. Break complex tasks into steps\n\n"
-                        "Example format:\n"
-                        f"{SynthLangSymbols.INPUT} data{SynthLangSymbols.JOIN}source\n"
-                        f"{SynthLangSymbols.PROCESS} sentiment>0 {SynthLangSymbols.TRANSFORM} pos\n"
-                        f"{SynthLangSymbols.OUTPUT} result + trends\n\n"
-                    )) + "\nConvert this text:\n\n" + source_code
-                )
+        result = self._predict(
+            self.predictor,
+            source=(
+                (instructions if instructions else (
+                    "Convert this to SynthLang format following these EXACT rules:\n"
+                    f"1. Use ONLY {SynthLangSymbols.INPUT} (input), {SynthLangSymbols.PROCESS} (process), {SynthLangSymbols.OUTPUT} (output)\n"
+                    f"2. Use {SynthLangSymbols.JOIN} to join related items\n"
+                    f"3. Use {SynthLangSymbols.TRANSFORM} for transformations\n"
+                    "4. Use mathematical operators (+, >, <, ^)\n"
+                    "5. Maximum 30 characters per line\n"
+                    "6. Break complex tasks into steps\n\n"
+                    "Example format:\n"
+                    f"{SynthLangSymbols.INPUT} data{SynthLangSymbols.JOIN}source\n"
+                    f"{SynthLangSymbols.PROCESS} sentiment>0 {SynthLangSymbols.TRANSFORM} pos\n"
+                    f"{SynthLangSymbols.OUTPUT} result + trends\n\n"
+                )) + "\nConvert this text:\n\n" + source_code
             )
+        )
 
-            # Post-process to ensure format compliance
-            target_lines = []
-            for line in str(result.target).strip().split('\n'):
-                # Skip empty lines
-                if not line.strip():
-                    continue
-                    
-                # Remove any function calls, quotes, or arrows
-                line = line.replace('->', '=>')
-                line = line.replace('"', '').replace("'", '')
-                
-                # Ensure proper symbol usage
-                if not any(sym in line for sym in [SynthLangSymbols.INPUT, SynthLangSymbols.PROCESS, SynthLangSymbols.OUTPUT]):
-                    continue
-                    
-                # Enforce line length limit
-                if len(line) > 30:
-                    # Try to break into multiple lines
-                    parts = line.split(f' {SynthLangSymbols.TRANSFORM} ')
-                    if len(parts) > 1:
-                        for i, part in enumerate(parts):
-                            if i == 0:
-                                target_lines.append(f"{part} {SynthLangSymbols.TRANSFORM}")
-                            else:
-                                target_lines.append(f"  {part}")
-                    continue
-                    
-                target_lines.append(line)
+        # Post-process to ensure format compliance
+        target_lines = normalize_lines(str(result.target))
 
-            # For this specific input, ensure proper translation
-            if "customer feedback" in source_code.lower():
-                target_lines = [
-                    f"{SynthLangSymbols.INPUT} feedback{SynthLangSymbols.JOIN}sources",
-                    f"{SynthLangSymbols.PROCESS} sentiment>0 {SynthLangSymbols.TRANSFORM} pos",
-                    f"{SynthLangSymbols.PROCESS} sentiment<0 {SynthLangSymbols.TRANSFORM} neg",
-                    f"{SynthLangSymbols.OUTPUT} insights + trends"
-                ]
+        # For this specific input, ensure proper translation
+        if "customer feedback" in source_code.lower():
+            target_lines = [
+                f"{SynthLangSymbols.INPUT} feedback{SynthLangSymbols.JOIN}sources",
+                f"{SynthLangSymbols.PROCESS} sentiment>0 {SynthLangSymbols.TRANSFORM} pos",
+                f"{SynthLangSymbols.PROCESS} sentiment<0 {SynthLangSymbols.TRANSFORM} neg",
+                f"{SynthLangSymbols.OUTPUT} insights + trends"
+            ]
 
         return {
             "source": source_code,
@@ -105,3 +82,17 @@ class FrameworkTranslator(SynthLangModule):
     def translate(self, source_code: str, instructions: Optional[str] = None) -> TranslationResult:
         """Translate prompt using forward method."""
         return self.forward(source_code, instructions)
+
+    async def atranslate(self, source_code: str, instructions: Optional[str] = None,
+                         timeout: Optional[float] = None) -> TranslationResult:
+        """Translate prompt without blocking the event loop.
+        
+        Args:
+            source_code: Natural language prompt to translate
+            instructions: Optional custom translation instructions
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Same result as translate()
+        """
+        return await self._arun(self.forward, source_code, instructions, timeout=timeout)
@@ -1,5 +1,5 @@
 """Type definitions for SynthLang modules."""
-from typing import Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 class TranslationResult(TypedDict):
     """Result from framework translation."""
@@ -20,6 +20,24 @@ class OptimizationResult(TypedDict):
     metrics: Dict[str, float]
     original: str
 
+class BatchItemResult(TypedDict):
+    """Outcome of a single item in a batch run."""
+    index: int
+    input: Any
+    result: Any
+    error: Optional[str]
+    attempts: int
+    latency: float
+
+class BatchReport(TypedDict):
+    """Result from a bounded-concurrency batch run."""
+    items: List[BatchItemResult]
+    succeeded: int
+    failed: int
+    elapsed: float
+    throughput: float
+    mean_latency: float
+
 class SynthLangSymbols:
     """SynthLang syntax symbols."""
     INPUT = "↹"
@@ -0,0 +1,337 @@
+"""Long-running SynthLang daemon and its client.
+
+The daemon keeps warm module instances and a single language model so that
+scripts calling the CLI repeatedly don't pay process startup, config loading
+and module construction on every call. It speaks JSON over HTTP, on a TCP
+port or a Unix socket.
+"""
+import http.client
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from synthlang.core.batch import BatchRunner
+
+DEFAULT_PORT = 8765
+
+class ServiceError(Exception):
+    """Error returned by the daemon for a bad request."""
+
+class SynthLangService:
+    """Warm SynthLang modules shared by all daemon requests."""
+
+    def __init__(self, lm: Any, cache: Any = None, max_concurrency: int = 8,
+                 prompt_storage_dir: Optional[str] = None):
+        """Initialize service.
+
+        Args:
+            lm: Language model instance shared by all modules
+            cache: Optional response cache
+            max_concurrency: Maximum number of LM calls in flight across all requests
+            prompt_storage_dir: Optional directory for prompt storage
+        """
+        from synthlang.core import (
+            FrameworkTranslator,
+            PromptManager,
+            PromptOptimizer,
+            SystemPromptGenerator
+        )
+
+        self.lm = lm
+        self.cache = cache
+        self.translator = FrameworkTranslator(lm=lm, cache=cache)
+        self.generator = SystemPromptGenerator(lm=lm, cache=cache)
+        self.optimizer = PromptOptimizer(lm=lm, cache=cache)
+        self.prompt_manager = PromptManager(storage_dir=prompt_storage_dir)
+        self.classifiers: Dict[Tuple[str, ...], Any] = {}
+        self.runner = BatchRunner(workers=max_concurrency)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self.operations: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'translate': self._translate,
+            'generate': self._generate,
+            'optimize': self._optimize,
+            'classify': self._classify,
+            'prompts/list': self._list_prompts,
+            'prompts/load': self._load_prompt
+        }
+        # Keys each operation reads; batch items missing one fail without a retry
+        self.required: Dict[str, Tuple[str, ...]] = {
+            'translate': ('source',),
+            'generate': ('task',),
+            'optimize': ('prompt',),
+            'classify': ('labels', 'text'),
+            'prompts/list': (),
+            'prompts/load': ('name',)
+        }
+
+    def _classifier(self, labels: List[str]) -> Any:
+        """Get a warm classifier for a label set.
+
+        Classifiers are built on request threads, where DSPy refuses
+        dspy.configure(); the modules made in __init__ already configured
+        the shared model.
+        """
+        from synthlang.core import PromptClassifier
+
+        key = tuple(labels)
+        with self._lock:
+            if key not in self.classifiers:
+                self.classifiers[key] = PromptClassifier(
+                    lm=self.lm, labels=list(key), cache=self.cache, configure=False
+                )
+            return self.classifiers[key]
+
+    def _limited(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run an LM-bound call under the global concurrency limit."""
+        with self._slots:
+            return fn(*args)
+
+    def _translate(self, item: Dict[str, Any]) -> Any:
+        return self._limited(self.translator.translate, item['source'], item.get('instructions'))
+
+    def _generate(self, item: Dict[str, Any]) -> Any:
+        return self._limited(self.generator.generate, item['task'])
+
+    def _optimize(self, item: Dict[str, Any]) -> Any:
+        return self._limited(self.optimizer.optimize, item['prompt'])
+
+    def _classify(self, item: Dict[str, Any]) -> Any:
+        classifier = self._classifier(item['labels'])
+        return self._limited(classifier.classify, item['text'])
+
+    def _list_prompts(self, item: Dict[str, Any]) -> Any:
+        return self.prompt_manager.list_metadata(**item)
+
+    def _load_prompt(self, item: Dict[str, Any]) -> Any:
+        return self.prompt_manager.load(item['name'])
+
+    def _invalid(self, operation: str, item: Any) -> Optional[str]:
+        """Describe why a batch item can't be run, or None if it can."""
+        if not isinstance(item, dict):
+            return f"TypeError: Batch items must be objects, got {type(item).__name__}"
+        missing = [key for key in self.required[operation] if key not in item]
+        if missing:
+            return f"KeyError: {missing[0]!r}"
+        return None
+
+    def handle(self, operation: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a request.
+
+        A payload with an ``items`` list is treated as a batch: every item is
+        processed concurrently and results come back in item order. Items
+        that aren't objects or lack a required key fail straight away
+        instead of being retried.
+
+        Args:
+            operation: Operation name, e.g. 'translate'
+            payload: Operation arguments, or {'items': [...]} for a batch
+
+        Returns:
+            {'result': ...} for single requests, or {'results': [...]}
+            with per-item result or error for batches
+
+        Raises:
+            ServiceError: If the operation is unknown or arguments are missing
+        """
+        if operation not in self.operations:
+            raise ServiceError(f"Unknown operation: {operation}")
+        fn = self.operations[operation]
+
+        if 'items' in payload:
+            items = payload['items']
+            errors = [self._invalid(operation, item) for item in items]
+            report = self.runner.run(fn, [item for item, error in zip(items, errors) if error is None])
+            outcomes = iter(report['items'])
+            results = []
+            for error in errors:
+                if error is None:
+                    item = next(outcomes)
+                    error = item['error']
+                results.append({'result': item['result']} if error is None else {'error': error})
+            return {'results': results, 'elapsed': report['elapsed']}
+
+        try:
+            return {'result': fn(payload)}
+        except (KeyError, TypeError) as e:
+            raise ServiceError(f"Invalid arguments for {operation}: {str(e)}")
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler dispatching /v1/<operation> to the service."""
+
+    service: SynthLangService
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no host address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(200, {'status': 'ok', 'operations': sorted(self.service.operations)})
+        else:
+            self._send(404, {'error': f"Not found: {self.path}"})
+
+    def do_POST(self) -> None:
+        if not self.path.startswith("/v1/"):
+            self._send(404, {'error': f"Not found: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            self._send(200, self.service.handle(self.path[len("/v1/"):], payload))
+        except (ServiceError, json.JSONDecodeError) as e:
+            self._send(400, {'error': str(e)})
+        except FileNotFoundError as e:
+            self._send(404, {'error': str(e)})
+        except Exception as e:
+            self._send(500, {'error': f"{type(e).__name__}: {str(e)}"})
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server listening on a Unix socket."""
+    daemon_threads = True
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink a Unix socket at path if nothing is listening on it."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"A daemon is already listening on {path}")
+
+def create_server(service: SynthLangService, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                  socket_path: Optional[str] = None) -> socketserver.BaseServer:
+    """Create an HTTP server for a service.
+
+    Args:
+        service: Service handling requests
+        host: Host to bind when listening on TCP
+        port: Port to bind when listening on TCP (0 picks a free port)
+        socket_path: Unix socket path; takes precedence over host/port. A
+            socket left behind by a daemon that is no longer running is
+            replaced.
+
+    Returns:
+        Server ready for serve_forever()
+
+    Raises:
+        OSError: If the address is in use, or socket_path exists and is
+            not a stale socket
+    """
+    handler = type("SynthLangRequestHandler", (_RequestHandler,), {'service': service})
+    if socket_path:
+        _remove_stale_socket(socket_path)
+        return _UnixHTTPServer(socket_path, handler)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+class DaemonClient:
+    """Client forwarding SynthLang operations to a running daemon.
+
+    Mirrors the translate/generate/optimize methods of the core modules so
+    it can stand in for them in the CLI.
+    """
+
+    def __init__(self, url: str, timeout: Optional[float] = 600):
+        """Initialize client.
+
+        Args:
+            url: Daemon address, e.g. http://127.0.0.1:8765 or unix:///tmp/synthlang.sock
+            timeout: Request timeout in seconds
+        """
+        self.url = url
+        self.timeout = timeout
+        parsed = urlparse(url)
+        if parsed.scheme == "unix":
+            self._connect = lambda: _UnixHTTPConnection(parsed.path, timeout=timeout)
+        elif parsed.scheme == "http":
+            self._connect = lambda: http.client.HTTPConnection(
+                parsed.hostname or "127.0.0.1", parsed.port or DEFAULT_PORT, timeout=timeout
+            )
+        else:
+            raise ValueError(f"Unsupported daemon URL: {url}")
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a request to the daemon.
+
+        Raises:
+            ServiceError: If the daemon reports an error
+            ConnectionError: If the daemon can't be reached
+        """
+        conn = self._connect()
+        try:
+            body = json.dumps(payload).encode('utf-8') if payload is not None else None
+            conn.request(method, path, body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            data = json.loads(response.read() or b"{}")
+        except OSError as e:
+            raise ConnectionError(f"SynthLang daemon not reachable at {self.url}: {str(e)}")
+        finally:
+            conn.close()
+        if response.status != 200:
+            raise ServiceError(data.get('error', f"HTTP {response.status}"))
+        return data
+
+    def call(self, operation: str, **kwargs: Any) -> Any:
+        """Run a single operation on the daemon."""
+        return self.request("POST", f"/v1/{operation}", kwargs)['result']
+
+    def call_batch(self, operation: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run a batch of operations on the daemon in one request."""
+        return self.request("POST", f"/v1/{operation}", {'items': items})['results']
+
+    def health(self) -> Dict[str, Any]:
+        """Check that the daemon is up."""
+        return self.request("GET", "/health")
+
+    def translate(self, source: str, instructions: Optional[str] = None) -> Dict[str, Any]:
+        return self.call("translate", source=source, instructions=instructions)
+
+    def generate(self, task: str) -> Dict[str, Any]:
+        return self.call("generate", task=task)
+
+    def optimize(self, prompt: str) -> Dict[str, Any]:
+        return self.call("optimize", prompt=prompt)
+
+    def classify(self, text: str, labels: List[str]) -> Dict[str, Any]:
+        return self.call("classify", text=text, labels=labels)
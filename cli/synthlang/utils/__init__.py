@@ -1,5 +1,6 @@
 """Utility functions for SynthLang CLI."""
 from synthlang.utils.env import load_env_file
+from synthlang.utils.records import read_records
 from synthlang.utils.logger import (
     setup_logger,
     get_logger,
@@ -10,6 +11,7 @@ from synthlang.utils.logger import (
 
 __all__ = [
     "load_env_file",
+    "read_records",
     "setup_logger",
     "get_logger",
     "set_log_level",
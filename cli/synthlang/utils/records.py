@@ -0,0 +1,94 @@
+"""Readers for batch input files."""
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+# Fields checked, in order, for the text of a JSONL or CSV record
+TEXT_FIELDS = ("source", "text", "prompt", "input")
+
+class InvalidRecord:
+    """Placeholder for an input line that couldn't be parsed."""
+
+    def __init__(self, line: int, error: str):
+        self.line = line
+        self.error = error
+
+    def __str__(self) -> str:
+        return f"Invalid record on line {self.line}: {self.error}"
+
+def _pick_text(record: dict) -> Optional[str]:
+    """Pick the text field of a structured record."""
+    for field in TEXT_FIELDS:
+        if record.get(field):
+            return str(record[field])
+    for value in record.values():
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+def _iter_stream(stream: IO[str], fmt: str) -> Iterator[Union[str, InvalidRecord]]:
+    """Yield texts from an open stream in the given format."""
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            text = _pick_text(row)
+            if text:
+                yield text
+        return
+
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if fmt == "jsonl":
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield InvalidRecord(line_no, str(e))
+                continue
+            text = _pick_text(record) if isinstance(record, dict) else str(record)
+            if text:
+                yield text
+        else:
+            yield line
+
+def detect_format(path: str) -> str:
+    """Detect the record format from a file name (stdin reads as text).
+
+    Args:
+        path: Input path ('-' for stdin)
+
+    Returns:
+        One of 'jsonl', 'csv' or 'text'
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    return "text"
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Union[str, InvalidRecord]]:
+    """Lazily read input texts from a file or stdin.
+
+    JSONL and CSV records use the first non-empty field out of
+    source, text, prompt and input. Plain-text files yield one text
+    per non-blank line. A JSONL line that isn't valid JSON yields an
+    InvalidRecord in its place, so one bad line neither aborts the
+    read nor shifts the position of the records after it.
+
+    Args:
+        path: Input file path, or '-' to read from stdin
+        fmt: Record format; detected from the file name when omitted
+
+    Yields:
+        Input texts, or InvalidRecord placeholders, in file order
+    """
+    fmt = fmt or detect_format(path)
+    if path == "-":
+        yield from _iter_stream(sys.stdin, fmt)
+        return
+
+    with open(path, newline="" if fmt == "csv" else None, encoding="utf-8") as f:
+        yield from _iter_stream(f, fmt)
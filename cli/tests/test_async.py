@@ -0,0 +1,70 @@
+"""Tests for the async module API."""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.evolver import PromptEvolver
+from synthlang.core.translator import FrameworkTranslator
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+
+def test_atranslate_multiplexes_calls():
+    """Test concurrent atranslate calls share post-processing and overlap."""
+    translator = FrameworkTranslator(lm=Mock())
+
+    def predict(source):
+        time.sleep(0.05)
+        return SimpleNamespace(target='"↹ data" -> out\nno symbols here')
+
+    translator.predictor = Mock(side_effect=predict)
+
+    async def run():
+        return await asyncio.gather(*(translator.atranslate(f"text {i}") for i in range(10)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    assert time.perf_counter() - start < 0.4
+    assert [r["target"] for r in results] == ["↹ data => out"] * 10
+
+def test_atranslate_timeout():
+    """Test a slow call raises TimeoutError instead of blocking the loop."""
+    translator = FrameworkTranslator(lm=Mock())
+    translator.predictor = Mock(side_effect=lambda source: time.sleep(0.3) or SimpleNamespace(target="↹ x"))
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(translator.atranslate("text", timeout=0.05))
+
+def test_aevolve_cancellation_stops_evolution():
+    """Test cancelling aevolve stops the background run between generations."""
+    evolver = PromptEvolver(lm=Mock(), mutation_rate=0.0)
+    generations = []
+    done = threading.Event()
+    original = evolver.evolve
+
+    def slow_select(rng):
+        time.sleep(0.01)
+        return evolver.selection.individuals[0]
+
+    def tracked(*args):
+        result = original(*args)
+        generations.append(result['generations'])
+        done.set()
+        return result
+
+    evolver.selection.select = slow_select
+    evolver.evolve = tracked
+
+    async def run():
+        task = asyncio.ensure_future(evolver.aevolve(SEED, n_generations=100))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert done.wait(2)
+    assert generations[0] < 100
@@ -0,0 +1,91 @@
+"""Tests for bounded-concurrency batch execution."""
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.batch import BatchRunner
+from synthlang.core.finetune import PromptFinetuner
+
+def test_batch_runner_preserves_order():
+    """Test results come back in input order regardless of completion order."""
+    runner = BatchRunner(workers=4, max_retries=0)
+
+    def slow_square(x):
+        # Later items finish first
+        time.sleep(0.01 * (5 - x))
+        return x * x
+
+    report = runner.run(slow_square, range(5))
+    assert [item['result'] for item in report['items']] == [0, 1, 4, 9, 16]
+    assert [item['index'] for item in report['items']] == list(range(5))
+    assert report['succeeded'] == 5
+    assert report['failed'] == 0
+    assert report['throughput'] > 0
+    assert all(item['latency'] >= 0 for item in report['items'])
+
+def test_batch_runner_bounds_concurrency():
+    """Test no more than `workers` calls run at once."""
+    runner = BatchRunner(workers=3, max_retries=0)
+    lock = threading.Lock()
+    active = {'now': 0, 'peak': 0}
+
+    def track(x):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        time.sleep(0.01)
+        with lock:
+            active['now'] -= 1
+        return x
+
+    runner.run(track, range(20))
+    assert active['peak'] <= 3
+
+def test_batch_runner_retries_without_stopping_batch():
+    """Test failing items are retried and recorded without aborting."""
+    runner = BatchRunner(workers=2, max_retries=2, retry_delay=0)
+    calls = {}
+
+    def flaky(x):
+        calls[x] = calls.get(x, 0) + 1
+        if x == 1 and calls[x] < 3:
+            raise RuntimeError("transient")
+        if x == 2:
+            raise RuntimeError("permanent")
+        return x
+
+    report = runner.run(flaky, [0, 1, 2, 3])
+    items = report['items']
+    assert items[1]['result'] == 1
+    assert items[1]['attempts'] == 3
+    assert items[2]['error'] == "RuntimeError: permanent"
+    assert items[2]['attempts'] == 3
+    assert items[3]['result'] == 3
+    assert report['failed'] == 1
+    assert report['succeeded'] == 3
+
+def test_batch_runner_rejects_invalid_workers():
+    """Test worker count validation."""
+    with pytest.raises(ValueError):
+        BatchRunner(workers=0)
+
+def test_finetuner_batch_classify():
+    """Test batch classification keeps order and reports failures."""
+    finetuner = PromptFinetuner(lm=Mock(), labels=["a", "b"])
+
+    def classify(text):
+        if text == "bad":
+            raise ValueError("boom")
+        return {"input": text, "label": "a", "reasoning": "", "explanation": ""}
+
+    finetuner.classify = classify
+    finetuner._prepare_classifier = Mock()
+
+    results = finetuner.batch_classify(["x", "bad", "y"], workers=2, max_retries=0)
+    assert [r["input"] for r in results] == ["x", "bad", "y"]
+    assert results[0]["label"] == "a"
+    assert results[1]["label"] is None
+    assert "boom" in results[1]["error"]
+    assert all("latency" in r for r in results)
@@ -0,0 +1,91 @@
+"""Tests for LM response caching."""
+import time
+from unittest.mock import Mock
+
+import dspy
+import pytest
+
+from synthlang.core.cache import ResponseCache
+from synthlang.core.translator import FrameworkTranslator
+
+@pytest.fixture
+def response_cache(tmp_path):
+    """Response cache backed by a temporary file."""
+    cache = ResponseCache(path=str(tmp_path / "responses.db"), ttl=60, max_entries=3)
+    yield cache
+    cache.close()
+
+def test_response_cache_roundtrip(response_cache):
+    """Test stored responses replay and hits/misses are counted."""
+    key = ResponseCache.make_key("gpt-4o-mini", "Sig:abc", {"source": "x"}, 0.0)
+    assert response_cache.get(key) is None
+
+    response_cache.put(key, {"target": "↹ x"})
+    assert response_cache.get(key) == {"target": "↹ x"}
+
+    stats = response_cache.stats()
+    assert stats['entries'] == 1
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+def test_response_cache_key_depends_on_request():
+    """Test model, inputs and temperature all change the key."""
+    base = ResponseCache.make_key("m", "Sig", {"source": "x"}, 0.0)
+    assert base == ResponseCache.make_key("m", "Sig", {"source": "x"}, 0.0)
+    assert base != ResponseCache.make_key("other", "Sig", {"source": "x"}, 0.0)
+    assert base != ResponseCache.make_key("m", "Sig", {"source": "y"}, 0.0)
+    assert base != ResponseCache.make_key("m", "Sig", {"source": "x"}, 0.7)
+
+def test_response_cache_ttl(response_cache):
+    """Test expired entries are treated as misses."""
+    response_cache.put("k", {"v": 1})
+    response_cache.ttl = -1
+    assert response_cache.get("k") is None
+    assert response_cache.stats()['entries'] == 0
+
+def test_response_cache_evicts_least_recently_used(response_cache):
+    """Test the cache stays within max_entries."""
+    for i in range(3):
+        response_cache.put(f"k{i}", {"v": i})
+        time.sleep(0.01)
+    response_cache.get("k0")
+    response_cache.put("k3", {"v": 3})
+
+    assert response_cache.stats()['entries'] == 3
+    assert response_cache.get("k1") is None
+    assert response_cache.get("k0") == {"v": 0}
+
+def test_response_cache_lookups_defer_writes(tmp_path):
+    """Test hits don't write until flushed and counts survive reopening."""
+    path = str(tmp_path / "responses.db")
+    cache = ResponseCache(path=path, ttl=60, max_entries=3)
+    cache.put("k", {"v": 1})
+    changes = cache._conn.total_changes
+    for _ in range(5):
+        assert cache.get("k") == {"v": 1}
+    assert cache.get("missing") is None
+    assert cache._conn.total_changes == changes
+    cache.close()
+
+    reopened = ResponseCache(path=path, ttl=60, max_entries=3)
+    stats = reopened.stats()
+    assert (stats['entries'], stats['hits'], stats['misses']) == (1, 5, 1)
+    reopened.close()
+
+def test_module_replays_cached_response(response_cache):
+    """Test a repeated translation is served without calling the model."""
+    lm = Mock()
+    lm.model = "gpt-4o-mini"
+    lm.kwargs = {"temperature": 0.0}
+    translator = FrameworkTranslator(lm=lm, cache=response_cache)
+    translator.predictor = Mock(return_value=dspy.Prediction(target="↹ data•source", explanation="x"))
+
+    first = translator.translate("analyze data")
+    second = translator.translate("analyze data")
+
+    assert first == second
+    translator.predictor.assert_called_once()
+
+    response_cache.clear()
+    translator.translate("analyze data")
+    assert translator.predictor.call_count == 2
@@ -132,3 +132,137 @@ def test_cli_help(runner):
         result = runner.invoke(main, [cmd, "--help"])
         assert result.exit_code == 0
         assert "Usage:" in result.output
+
+def test_cli_translate_batch_resume(runner, env_vars, tmp_path, monkeypatch):
+    """Test batch translation streams JSONL and resumes after a crash."""
+    calls = []
+
+    class FakeTranslator:
+        def __init__(self, lm, cache=None):
+            pass
+
+        def translate(self, source, instructions=None):
+            calls.append(source)
+            if source == "crash":
+                raise RuntimeError("network blip")
+            return {"source": source, "target": f"↹ {source}", "explanation": "ok"}
+
+    monkeypatch.setattr("synthlang.core.FrameworkTranslator", FakeTranslator)
+    monkeypatch.setenv("SYNTHLANG_NO_CACHE", "1")
+
+    input_file = tmp_path / "prompts.jsonl"
+    input_file.write_text("\n".join(
+        json.dumps({"source": s}) for s in ["alpha", "crash", "gamma"]
+    ))
+    output = tmp_path / "out.jsonl"
+
+    result = runner.invoke(main, [
+        "translate", "--framework", "synthlang",
+        "--input-file", str(input_file), "--output", str(output), "--workers", "2"
+    ])
+    assert result.exit_code == 0
+    records = [json.loads(l) for l in output.read_text().splitlines()]
+    assert sorted(r["index"] for r in records) == [0, 1, 2]
+    assert [r for r in records if r["index"] == 1][0]["error"]
+
+    # Resuming only retries the record that failed
+    calls.clear()
+    result = runner.invoke(main, [
+        "translate", "--framework", "synthlang",
+        "--input-file", str(input_file), "--output", str(output), "--resume"
+    ])
+    assert result.exit_code == 0
+    assert set(calls) == {"crash"}
+
+def test_cli_translate_batch_records_malformed_lines(runner, env_vars, tmp_path, monkeypatch):
+    """Test a malformed JSONL line becomes an error record and resuming finishes."""
+    class FakeTranslator:
+        def __init__(self, lm, cache=None):
+            pass
+
+        def translate(self, source, instructions=None):
+            return {"source": source, "target": f"↹ {source}", "explanation": "ok"}
+
+    monkeypatch.setattr("synthlang.core.FrameworkTranslator", FakeTranslator)
+    monkeypatch.setenv("SYNTHLANG_NO_CACHE", "1")
+    input_file = tmp_path / "prompts.jsonl"
+    input_file.write_text(json.dumps({"source": "alpha"}) + '\n{"source": \n' + json.dumps({"source": "gamma"}))
+    output = tmp_path / "out.jsonl"
+
+    for args in ([], ["--resume"]):
+        result = runner.invoke(main, [
+            "translate", "--framework", "synthlang", "--input-file", str(input_file),
+            "--output", str(output), *args
+        ])
+        assert result.exit_code == 0, result.output
+    records = [json.loads(l) for l in output.read_text().splitlines() if l.strip()]
+    assert {r["index"]: r.get("target") for r in records if "error" not in r} == {0: "↹ alpha", 2: "↹ gamma"}
+    assert [r["index"] for r in records if "error" in r] == [1, 1]
+
+def test_cli_translate_batch_reads_jsonl_from_stdin(runner, env_vars, tmp_path, monkeypatch):
+    """Test --format parses stdin records instead of reading them as plain text."""
+    class FakeTranslator:
+        def __init__(self, lm, cache=None):
+            pass
+
+        def translate(self, source, instructions=None):
+            return {"source": source, "target": f"↹ {source}", "explanation": "ok"}
+
+    monkeypatch.setattr("synthlang.core.FrameworkTranslator", FakeTranslator)
+    monkeypatch.setenv("SYNTHLANG_NO_CACHE", "1")
+    output = tmp_path / "out.jsonl"
+
+    result = runner.invoke(main, [
+        "translate", "--framework", "synthlang", "--input-file", "-", "--format", "jsonl",
+        "--output", str(output)
+    ], input=json.dumps({"source": "alpha"}) + "\n")
+    assert result.exit_code == 0
+    records = [json.loads(l) for l in output.read_text().splitlines()]
+    assert [r["target"] for r in records] == ["↹ alpha"]
+
+def test_cli_classify_batch_matches_api_records(runner, env_vars, tmp_path, monkeypatch):
+    """Test classify batch writes the same records as PromptClassifier.batch_classify."""
+    from synthlang.core.finetune import PromptFinetuner
+
+    def classify(self, text):
+        if text == "broken":
+            raise RuntimeError("rate limited")
+        return {"input": text, "label": "a", "reasoning": "", "explanation": "ok"}
+
+    monkeypatch.setattr(PromptFinetuner, "classify", classify)
+    monkeypatch.setenv("SYNTHLANG_NO_CACHE", "1")
+    input_file = tmp_path / "texts.txt"
+    input_file.write_text("fine\nbroken\n")
+    output = tmp_path / "labels.json"
+
+    result = runner.invoke(main, [
+        "classify", "batch", "--input-file", str(input_file), "--labels", "a,b",
+        "--retries", "0", "--output", str(output)
+    ])
+    assert result.exit_code == 0, result.output
+    records = json.loads(output.read_text())
+    assert [r["label"] for r in records] == ["a", None]
+    assert set(records[1]) == {"input", "label", "reasoning", "explanation", "error", "latency"}
+    assert "Failed: 1" in result.output
+
+def test_cli_score(runner, tmp_path):
+    """Test prompts are ranked offline and written as JSONL."""
+    input_file = tmp_path / "library.jsonl"
+    input_file.write_text("\n".join(json.dumps({"prompt": p}) for p in [
+        "plain text",
+        "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends",
+    ]))
+    output = tmp_path / "ranked.jsonl"
+
+    result = runner.invoke(main, ["score", "--input-file", str(input_file), "--output", str(output)])
+    assert result.exit_code == 0
+    assert "Scored 2 prompts" in result.output
+    records = [json.loads(l) for l in output.read_text().splitlines()]
+    assert [r["index"] for r in records] == [1, 0]
+    assert records[0]["rank"] == 1 and records[0]["prompt"].startswith("↹ data")
+
+def test_cli_evolve_rejects_zero_checkpoint_interval(runner):
+    """Test --checkpoint-every must be at least 1."""
+    result = runner.invoke(main, ["evolve", "--seed", "↹ x", "--checkpoint-every", "0"])
+    assert result.exit_code == 2
+    assert "--checkpoint-every" in result.output
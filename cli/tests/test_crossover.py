@@ -0,0 +1,51 @@
+"""Tests for LM-free crossover."""
+import random
+from unittest.mock import Mock
+
+from synthlang.core.crossover import crossover, sections
+from synthlang.core.evolver import PromptEvolver
+from synthlang.core.population import Population
+
+FIRST = "↹ data•source\n⊕ filter>5 =>\n  subset\n⊕ rank\nΣ report + trends"
+SECOND = "↹ user•query\n⊕ embed\n⊕ search => top•k\nΣ answer"
+
+def test_sections_keep_continuations():
+    """Test statements are grouped by symbol with their continuation lines."""
+    assert sections(FIRST + "\nnot synthlang") == {
+        'input': ["↹ data•source"],
+        'process': ["⊕ filter>5 =>\n  subset", "⊕ rank"],
+        'output': ["Σ report + trends"]
+    }
+
+def test_crossover_recombines_statements():
+    """Test children merge inputs, splice steps and take one parent's outputs."""
+    rng = random.Random(3)
+    parts_first, parts_second = sections(FIRST), sections(SECOND)
+    for _ in range(20):
+        child = sections(crossover(FIRST, SECOND, rng))
+        assert child['input'] == ["↹ data•source", "↹ user•query"]
+        assert child['process']
+        assert set(child['process']) <= set(parts_first['process'] + parts_second['process'])
+        assert child['output'] in (parts_first['output'], parts_second['output'])
+
+    assert crossover(FIRST, SECOND, random.Random(1)) == crossover(FIRST, SECOND, random.Random(1))
+
+def test_evolve_with_crossover_only_makes_no_mutation_calls():
+    """Test a crossover rate of 1 produces every variant without the LM."""
+    evolver = PromptEvolver(lm=Mock(), population_size=6, mutation_rate=1.0,
+                            crossover_rate=1.0, random_seed=0)
+    evolver._generate_variants = Mock(return_value=[])
+
+    # Start from a population of two unrelated prompts
+    population = Population()
+    for prompt in (FIRST, SECOND):
+        population.add(prompt, evolver._calculate_fitness(prompt))
+    stats = {'total_variants': 0, 'mutation_calls': 0, 'successful_mutations': 0,
+             'tournament_winners': 0, 'lineage': []}
+    state = evolver._checkpoint_state(FIRST, 3, 0, population, stats)
+
+    result = evolver.evolve(FIRST, n_generations=3, resume_state=state)
+    assert not evolver._generate_variants.called
+    assert result['mutation_calls'] == 0
+    assert result['crossovers'] > 0
+    assert result['total_variants'] > 0
@@ -0,0 +1,228 @@
+"""Tests for prompt evolution."""
+import random
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.cache import FitnessCache
+from synthlang.core.checkpoint import load_checkpoint
+from synthlang.core.evolver import PromptEvolver
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+
+@pytest.fixture
+def test_cases():
+    """Small task-fitness suite."""
+    return [{"input": f"case {i}", "expected": f"out {i}"} for i in range(6)]
+
+def test_task_score_runs_cases_concurrently(test_cases):
+    """Test task fitness fans test cases out and reuses one evaluator."""
+    evolver = PromptEvolver(lm=Mock(), fitness_type='task', test_cases=test_cases,
+                            max_concurrency=6)
+    lock = threading.Lock()
+    active = {'now': 0, 'peak': 0}
+
+    def evaluate(prompt, test_input, expected):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        time.sleep(0.02)
+        with lock:
+            active['now'] -= 1
+        return SimpleNamespace(matches="yes" if test_input.endswith(("0", "1", "2")) else "no")
+
+    evolver.evaluator = Mock(side_effect=evaluate)
+    fitness = evolver._calculate_fitness(SEED)
+
+    assert fitness['task_score'] == pytest.approx(0.5)
+    assert fitness['overall'] == pytest.approx(0.5)
+    assert evolver.evaluator.call_count == len(test_cases)
+    assert active['peak'] > 1
+
+def test_task_score_counts_failed_cases_as_misses(test_cases):
+    """Test an erroring test case doesn't abort fitness evaluation."""
+    evolver = PromptEvolver(lm=Mock(), fitness_type='task', test_cases=test_cases[:2])
+    evolver.eval_runner.retry_delay = 0
+
+    def evaluate(prompt, test_input, expected):
+        if test_input == "case 1":
+            raise RuntimeError("rate limited")
+        return SimpleNamespace(matches="yes")
+
+    evolver.evaluator = Mock(side_effect=evaluate)
+    assert evolver._calculate_fitness(SEED)['task_score'] == pytest.approx(0.5)
+
+def test_errored_scores_are_not_cached(tmp_path, test_cases):
+    """Test a score with failed evaluations is recomputed instead of reused."""
+    path = tmp_path / "fitness.db"
+    first = PromptEvolver(lm=Mock(model="m"), fitness_type='task', test_cases=test_cases,
+                          fitness_cache=FitnessCache(path=str(path)))
+    first.eval_runner.retry_delay = 0
+    first.evaluator = Mock(side_effect=RuntimeError("429 rate limited"))
+    assert first._calculate_fitness(SEED)['task_score'] == pytest.approx(0.0)
+
+    second = PromptEvolver(lm=Mock(model="m"), fitness_type='task', test_cases=test_cases,
+                           fitness_cache=FitnessCache(path=str(path)))
+    second.evaluator = Mock(return_value=SimpleNamespace(matches="yes"))
+    assert second._calculate_fitness(SEED)['task_score'] == pytest.approx(1.0)
+    assert second.evaluator.call_count == len(test_cases)
+
+def test_fitness_cache_skips_recomputation(test_cases):
+    """Test identical prompts are only scored once."""
+    evolver = PromptEvolver(lm=Mock(), fitness_type='task', test_cases=test_cases)
+    evolver.evaluator = Mock(return_value=SimpleNamespace(matches="yes"))
+
+    first = evolver._calculate_fitness(SEED)
+    # Whitespace differences normalize to the same cache key
+    second = evolver._calculate_fitness("  " + SEED.replace("\n", "\n\n") + "  ")
+
+    assert first == second
+    assert evolver.evaluator.call_count == len(test_cases)
+    assert evolver.fitness_cache.hits == 1
+    assert evolver.fitness_cache.misses == 1
+
+def test_fitness_cache_persists_across_runs(tmp_path, test_cases):
+    """Test the on-disk fitness store is reused by a new evolver."""
+    path = tmp_path / "fitness.db"
+    first = PromptEvolver(lm=Mock(model="m"), fitness_type='task', test_cases=test_cases,
+                          fitness_cache=FitnessCache(path=str(path)))
+    first.evaluator = Mock(return_value=SimpleNamespace(matches="yes"))
+    first._calculate_fitness(SEED)
+
+    second = PromptEvolver(lm=Mock(model="m"), fitness_type='task', test_cases=test_cases,
+                           fitness_cache=FitnessCache(path=str(path)))
+    second.evaluator = Mock()
+    assert second._calculate_fitness(SEED)['task_score'] == pytest.approx(1.0)
+    second.evaluator.assert_not_called()
+
+    # A different fitness configuration must not reuse the entry
+    third = PromptEvolver(lm=Mock(model="m"), fitness_type='task', test_cases=test_cases[:1],
+                          fitness_cache=FitnessCache(path=str(path)))
+    third.evaluator = Mock(return_value=SimpleNamespace(matches="no"))
+    assert third._calculate_fitness(SEED)['task_score'] == pytest.approx(0.0)
+
+def test_evolve_reports_cache_stats():
+    """Test evolve reports fitness cache hits and misses."""
+    evolver = PromptEvolver(lm=Mock(), population_size=4, mutation_rate=1.0)
+    variant = SEED + "\nΣ extra"
+    evolver._generate_variants = Mock(side_effect=lambda prompt, count: [variant])
+
+    result = evolver.evolve(SEED, n_generations=2)
+    assert result['cache_misses'] == 2  # Seed and the one distinct variant
+    assert result['cache_hits'] == result['total_variants'] - 1
+
+def test_batched_mutation_one_call_per_parent():
+    """Test each distinct parent gets one mutation call for all its slots."""
+    evolver = PromptEvolver(lm=Mock(), population_size=4, mutation_rate=1.0)
+    evolver.mutator = Mock(return_value=SimpleNamespace(variants=(
+        "Variant 1:\n↹ a•b\nΣ c\n---\n↹ a•b\nΣ c\n---\n" + SEED + "\n---\n↹ x => y\nΣ z"
+    )))
+
+    result = evolver.evolve(SEED, n_generations=1)
+    assert evolver.mutator.call_count == 1
+    assert evolver.mutator.call_args.kwargs['count'] == "4"
+    assert result['mutation_calls'] == 1
+    # Labels are stripped, duplicates and copies of the parent dropped
+    assert result['total_variants'] == 2
+    assert {p['prompt'] for p in result['lineage'][1]['population']} <= {SEED, "↹ a•b\nΣ c", "↹ x => y\nΣ z"}
+
+def test_evolve_is_reproducible_with_seed():
+    """Test concurrent mutation gives the same run for the same seed."""
+    def run():
+        evolver = PromptEvolver(lm=Mock(), population_size=6, mutation_rate=0.7,
+                                workers=4, random_seed=7)
+        lock = threading.Lock()
+        active = {'now': 0, 'peak': 0}
+
+        def mutate(prompt, count):
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            # Finish in a different order each run
+            time.sleep(random.random() * 0.01)
+            with lock:
+                active['now'] -= 1
+            depth = prompt.count("\n")
+            return [prompt + f"\n⊕ step{depth}•{i} => out{i}" for i in range(count)]
+
+        evolver._generate_variants = mutate
+        result = evolver.evolve(SEED, n_generations=3)
+        assert active['peak'] <= 4
+        return [[p['prompt'] for p in gen['population']] for gen in result['lineage']]
+
+    assert run() == run()
+
+def test_evolve_resumes_from_checkpoint(tmp_path):
+    """Test a resumed run matches an uninterrupted one without redoing generations."""
+    def make_evolver():
+        evolver = PromptEvolver(lm=Mock(model="test-model"), population_size=4, mutation_rate=0.8,
+                                random_seed=3)
+        evolver._generate_variants = Mock(side_effect=lambda prompt, count: [
+            prompt + f"\n⊕ s{prompt.count(chr(10))}•{i} => o" for i in range(count)
+        ])
+        return evolver
+
+    full = make_evolver().evolve(SEED, n_generations=4)
+
+    path = str(tmp_path / "run.ckpt")
+    make_evolver().evolve(SEED, n_generations=2, checkpoint_path=path)
+    state = load_checkpoint(path)
+    assert state['generation'] == 2
+
+    resumed_evolver = make_evolver()
+    resumed = resumed_evolver.evolve(SEED, n_generations=4, checkpoint_path=path, resume_state=state)
+    assert resumed['lineage'] == full['lineage']
+    assert resumed['best_prompt'] == full['best_prompt']
+    assert load_checkpoint(path)['generation'] == 4
+
+    mismatched = PromptEvolver(lm=Mock(model="test-model"), population_size=5)
+    with pytest.raises(ValueError, match="different evolution settings"):
+        mismatched.evolve(SEED, resume_state=state)
+
+def test_evolve_stops_early_with_reason(test_cases):
+    """Test convergence criteria end the run early and say why."""
+    def make_evolver(**kwargs):
+        evolver = PromptEvolver(lm=Mock(), population_size=4, mutation_rate=1.0,
+                                random_seed=1, **kwargs)
+        # Variants never beat the seed, so the population collapses onto it
+        evolver._generate_variants = Mock(side_effect=lambda prompt, count: ["↹ x"] * count)
+        return evolver
+
+    assert make_evolver().evolve(SEED, n_generations=5)['stop_reason'] == 'completed'
+
+    stale = make_evolver(patience=2).evolve(SEED, n_generations=10)
+    assert stale['stop_reason'] == 'patience'
+    assert stale['generations'] == 2
+    assert stale['stale_generations'] == 2
+
+    collapsed = make_evolver(min_diversity=0.5).evolve(SEED, n_generations=10)
+    assert collapsed['stop_reason'] == 'diversity'
+    assert collapsed['generations'] == 1
+    assert collapsed['diversity'] == pytest.approx(0.25)
+
+    budget = make_evolver(max_lm_calls=3).evolve(SEED, n_generations=10)
+    assert budget['stop_reason'] == 'max_lm_calls'
+    assert budget['generations'] == 3
+    assert budget['mutation_calls'] == 3
+
+    evolver = make_evolver(fitness_type='task', test_cases=test_cases, max_lm_calls=10)
+    evolver.evaluator = Mock(return_value=SimpleNamespace(matches="no"))
+    counted = evolver.evolve(SEED, n_generations=10)
+    assert counted['stop_reason'] == 'max_lm_calls'
+    assert counted['generations'] == 1
+    assert counted['eval_calls'] == 12  # Seed and one variant, six test cases each
+
+    evolver = make_evolver(max_cost=0.05)
+    evolver.lm.history = []
+
+    def paid_mutation(prompt, count):
+        evolver.lm.history.append({'cost': 0.02})
+        return ["↹ x"] * count
+
+    evolver._generate_variants = paid_mutation
+    spent = evolver.evolve(SEED, n_generations=10)
+    assert spent['stop_reason'] == 'max_cost'
+    assert spent['lm_cost'] == pytest.approx(0.06)
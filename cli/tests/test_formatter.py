@@ -0,0 +1,32 @@
+"""Tests for SynthLang output normalization."""
+from synthlang.core.formatter import normalize, normalize_lines, normalize_many
+from synthlang.core.types import FormatRules
+
+RAW = '''Here is the translation:
+
+↹ "data"•source
+⊕ sentiment>0 -> pos
+⊕ analyze customer feedback => summarize findings
+Σ report + trends'''
+
+def test_normalize_cleans_and_filters_lines():
+    """Test arrows, quotes and non-SynthLang lines are handled."""
+    assert normalize_lines(RAW) == [
+        "↹ data•source",
+        "⊕ sentiment>0 => pos",
+        "⊕ analyze customer feedback =>",
+        "  summarize findings",
+        "Σ report + trends",
+    ]
+
+def test_long_line_without_arrow_is_wrapped():
+    """Test over-long lines without '=>' are wrapped instead of dropped."""
+    lines = normalize_lines("Σ insights + trends + recommendations for the team")
+    assert lines == ["Σ insights + trends +", "  recommendations for the team"]
+    assert all(len(line) <= FormatRules.MAX_LINE_LENGTH for line in lines)
+
+def test_normalize_many_matches_normalize():
+    """Test bulk normalization matches one-at-a-time normalization."""
+    texts = [RAW, "", "no symbols", "↹ x -> y"]
+    assert normalize_many(texts) == [normalize(text) for text in texts]
+    assert normalize_many(texts)[1:] == ["", "", "↹ x => y"]
@@ -0,0 +1,65 @@
+"""Tests for island-model evolution."""
+import sqlite3
+from unittest.mock import Mock
+
+from synthlang.core.evolver import PromptEvolver
+from synthlang.core.islands import IslandEvolver
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report"
+
+def make_lm():
+    """Picklable LM factory for worker processes."""
+    return Mock(model="test-model")
+
+def grow(self, prompt, count):
+    """Deterministic mutation that adds one transform per variant."""
+    return [f"{prompt} => step{i}" for i in range(count)]
+
+def individual(prompt, overall):
+    return {'prompt': prompt, 'fitness': {'overall': overall}}
+
+def test_island_evolve_merges_results(tmp_path, monkeypatch):
+    """Test islands evolve in worker processes and share one fitness cache."""
+    # Worker processes are forked, so they inherit the patched mutation
+    monkeypatch.setattr(PromptEvolver, '_generate_variants', grow)
+    cache_path = tmp_path / "fitness.db"
+    evolver = IslandEvolver(
+        make_lm, n_islands=2, migration_interval=2, processes=2,
+        fitness_cache=str(cache_path), random_seed=7,
+        population_size=3, mutation_rate=1.0, fitness_type='specificity'
+    )
+
+    result = evolver.evolve(SEED, n_generations=4)
+
+    assert result['generations'] == 4
+    assert result['migrations'] == 2
+    assert len(result['islands']) == 2
+    assert result['fitness']['overall'] == max(i['fitness']['overall'] for i in result['islands'])
+    assert result['fitness']['overall'] > 0.5
+    assert [record['generation'] for record in result['lineage']] == [0, 1, 2, 3, 4]
+    assert {p['island'] for p in result['lineage'][4]['population']} == {0, 1}
+    assert len(result['lineage'][4]['population']) == 6
+
+    with sqlite3.connect(str(cache_path)) as conn:
+        (entries,) = conn.execute("SELECT COUNT(*) FROM fitness").fetchone()
+    # Islands may race on the same prompt, but every score lands in one store
+    assert 0 < entries <= result['cache_misses']
+
+    rerun = evolver.evolve(SEED, n_generations=4)
+    assert rerun['best_prompt'] == result['best_prompt']
+    assert rerun['cache_misses'] == 0
+
+def test_migration_replaces_worst_with_neighbour_best():
+    """Test migration sends each island's best prompts around the ring."""
+    evolver = IslandEvolver(make_lm, n_islands=3, migration_size=1)
+    states = [
+        {'population': [individual("a1", 0.9), individual("a2", 0.1), individual("a3", 0.5)]},
+        {'population': [individual("b1", 0.2), individual("b2", 0.8)]},
+        {'population': [individual("c1", 0.7), individual("c2", 0.3)]}
+    ]
+
+    assert evolver._migrate(states) == 3
+
+    assert [p['prompt'] for p in states[0]['population']] == ["a1", "a3", "c1"]
+    assert [p['prompt'] for p in states[1]['population']] == ["b2", "a1"]
+    assert [p['prompt'] for p in states[2]['population']] == ["c1", "b2"]
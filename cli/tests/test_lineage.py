@@ -0,0 +1,54 @@
+"""Tests for streaming lineage storage."""
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.evolver import PromptEvolver
+from synthlang.core.lineage import LineageWriter, read_lineage
+
+A = {'prompt': "↹ a\nΣ b", 'fitness': {'overall': 0.5}}
+B = {'prompt': "↹ c\nΣ d", 'fitness': {'overall': 0.7}}
+
+@pytest.mark.parametrize("name", ["lineage.jsonl", "lineage.jsonl.gz"])
+def test_lineage_roundtrip_interns_prompts(tmp_path, name):
+    """Test prompts are written once and generations read back lazily."""
+    path = tmp_path / name
+    with LineageWriter(str(path)) as writer:
+        writer.write_generation(0, [A])
+        writer.write_generation(1, [A, B, B])
+
+    history = read_lineage(str(path))
+    assert next(history) == {'generation': 0, 'population': [A]}
+    assert next(history) == {'generation': 1, 'population': [A, B, B]}
+
+    if name.endswith(".jsonl"):
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert sum(r['type'] == 'prompt' for r in records) == 2
+
+@pytest.mark.parametrize("name", ["lineage.jsonl", "lineage.jsonl.gz"])
+def test_lineage_resume_discards_later_generations(tmp_path, name):
+    """Test reopening at an offset drops generations after the checkpoint."""
+    path = str(tmp_path / name)
+    writer = LineageWriter(path)
+    offset = writer.write_generation(0, [A])
+    writer.write_generation(1, [B])  # Written after the last checkpoint
+    writer.close()
+
+    with LineageWriter(path, offset=offset) as writer:
+        writer.write_generation(1, [A])
+    assert [g['population'] for g in read_lineage(path)] == [[A], [A]]
+
+def test_evolve_streams_lineage(tmp_path):
+    """Test a streamed run yields the same history as an in-memory run."""
+    def run(lineage=None):
+        evolver = PromptEvolver(lm=Mock(), population_size=3, mutation_rate=0.8, random_seed=1)
+        evolver._generate_variants = lambda prompt, count: [
+            prompt + f"\n⊕ s{prompt.count(chr(10))}•{i} => o" for i in range(count)
+        ]
+        return evolver.evolve("↹ data•source\nΣ report", n_generations=3, lineage=lineage)
+
+    in_memory = run()
+    with LineageWriter(str(tmp_path / "run.jsonl.gz")) as writer:
+        streamed = run(writer)
+        assert list(streamed['lineage']) == in_memory['lineage']
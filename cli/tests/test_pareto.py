@@ -0,0 +1,88 @@
+"""Tests for Pareto evolution."""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from synthlang.core.pareto import ParetoEvolver, crowding_distance, non_dominated_sort, token_count
+
+def brute_force_fronts(points):
+    remaining = set(range(len(points)))
+    fronts = []
+    while remaining:
+        front = {
+            i for i in remaining
+            if not any(np.all(points[j] <= points[i]) and np.any(points[j] < points[i])
+                       for j in remaining)
+        }
+        fronts.append(front)
+        remaining -= front
+    return fronts
+
+@pytest.mark.parametrize("objectives", [2, 3])
+def test_non_dominated_sort_matches_brute_force(objectives):
+    """Test the fast sort finds the same fronts as pairwise comparison, ties included."""
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        points = rng.randint(0, 6, size=(40, objectives)).astype(float)
+        fronts = non_dominated_sort(points)
+        assert [set(f) for f in fronts] == brute_force_fronts(points)
+
+def test_crowding_distance_favours_sparse_points():
+    """Test boundary points are kept and isolated points rank above crowded ones."""
+    points = np.array([[0.0, 4.0], [1.0, 3.0], [1.1, 2.9], [4.0, 0.0]])
+    distance = crowding_distance(points)
+
+    assert np.isinf(distance[0]) and np.isinf(distance[3])
+    assert distance[2] > distance[1]
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+SHORT = "↹ data\nΣ report"
+LONG = "↹ data•source\n⊕ filter>5 => subset\n⊕ rank => top\n⊕ group => themes\nΣ report + trends"
+WORSE = "↹ data•source\n⊕ filter>5 => subset\n⊕ sort => list\n⊕ pad => noise\nΣ report + trends"
+TEST_CASES = [{"input": str(i), "expected": "ok"} for i in range(10)]
+PASS_RATE = {SHORT: 3, SEED: 6, LONG: 10, WORSE: 5}
+
+def evaluate(prompt, test_input, expected):
+    passes = int(test_input) < PASS_RATE[prompt]
+    return SimpleNamespace(matches="yes" if passes else "no")
+
+def test_evolve_returns_non_dominated_front():
+    """Test the front trades task score against length and drops dominated prompts."""
+    evolver = ParetoEvolver(lm=Mock(), population_size=4, mutation_rate=1.0, fitness_type='task',
+                            test_cases=TEST_CASES, random_seed=0)
+    evolver.evaluator = Mock(side_effect=evaluate)
+    evolver._generate_variants = Mock(return_value=[SHORT, LONG, WORSE])
+
+    result = evolver.evolve(SEED, n_generations=2)
+
+    assert [entry['prompt'] for entry in result['front']] == [SHORT, SEED, LONG]
+    assert [entry['tokens'] for entry in result['front']] == [token_count(p) for p in (SHORT, SEED, LONG)]
+    assert result['best_prompt'] == LONG
+    assert result['fitness']['task_score'] == 1.0
+    assert result['objectives'] == ['quality', 'tokens']
+    assert result['successful_mutations'] == 3
+    assert result['stop_reason'] == 'completed'
+
+def test_latency_objective_is_measured_per_prompt():
+    """Test latency joins the objectives and is reported on the front."""
+    evolver = ParetoEvolver(lm=Mock(), objectives=('quality', 'tokens', 'latency'), population_size=4,
+                            mutation_rate=1.0, fitness_type='task', test_cases=TEST_CASES,
+                            random_seed=0)
+    evolver.evaluator = Mock(side_effect=evaluate)
+    evolver._generate_variants = Mock(return_value=[SHORT, LONG])
+
+    result = evolver.evolve(SEED, n_generations=1)
+
+    assert all(entry['latency'] > 0 for entry in result['front'])
+
+def test_rejects_bad_objectives_and_checkpoints():
+    """Test a single objective and checkpointing are refused."""
+    with pytest.raises(ValueError):
+        ParetoEvolver(lm=Mock(), objectives=('quality',))
+    with pytest.raises(ValueError):
+        ParetoEvolver(lm=Mock(), objectives=('quality', 'speed'))
+    evolver = ParetoEvolver(lm=Mock())
+    with pytest.raises(ValueError):
+        evolver.evolve("↹ x\nΣ y", checkpoint_path="run.ckpt")
@@ -0,0 +1,37 @@
+"""Tests for the SynthLang parser."""
+from synthlang.core.parser import features, parse, validate
+
+PROMPT = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+
+def test_parse_builds_ast_with_spans():
+    """Test statements, joins, operators and transforms are parsed with spans."""
+    program = parse(PROMPT)
+    assert not program.errors
+    assert [s.kind for s in program.statements] == ['input', 'process', 'output']
+
+    term = program.statements[0].stages[0].terms[0]
+    assert term.parts == ['data', 'source']
+    assert PROMPT[term.start:term.end] == 'data•source'
+
+    process = program.statements[1]
+    assert process.transforms == 1
+    assert [op.op for op in process.stages[0].operators] == ['>']
+    assert PROMPT[process.stages[1].start:process.stages[1].end] == 'subset'
+
+def test_features_do_not_count_transform_as_operator():
+    """Test '=>' counts as a transform and not as the '>' operator."""
+    assert features(parse("↹ a => b")) == {
+        'input': 1.0, 'process': 0.0, 'output': 0.0,
+        'joins': 0.0, 'transforms': 1.0, 'operators': 0.0
+    }
+
+def test_validate_reports_problems():
+    """Test malformed lines, long lines and missing sections are reported."""
+    assert validate(PROMPT) == []
+    assert validate("↹ a\n⊕ analyze customer feedback =>\n  summarize findings\nΣ b") == []
+
+    problems = validate("Here you go:\n↹ a••b\n⊕ x + y + z + much longer text here")
+    assert "line 1: line does not start with a SynthLang symbol" in problems
+    assert "line 2: join without a right-hand term" in problems
+    assert "line 3: 35 characters exceeds 30" in problems
+    assert "missing output statement" in problems
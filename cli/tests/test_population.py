@@ -0,0 +1,63 @@
+"""Tests for population deduplication and near-duplicate detection."""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.evolver import PromptEvolver
+from synthlang.core.population import MinHashIndex, Population
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+
+def test_population_tracks_multiplicity():
+    """Test normalized duplicates raise multiplicity instead of adding copies."""
+    population = Population()
+    population.add(SEED, {'overall': 0.5})
+    population.add("  ↹ data•source\n\n⊕ filter>5  => subset\nΣ report + trends", {'overall': 0.5})
+    population.add("↹ x\nΣ y", {'overall': 0.9}, count=2)
+
+    assert len(population) == 2
+    assert population.size == 4
+    assert population.diversity == pytest.approx(0.5)
+    assert population.best()['prompt'] == "↹ x\nΣ y"
+    assert [p['prompt'] for p in population.expand()] == [SEED, SEED, "↹ x\nΣ y", "↹ x\nΣ y"]
+    assert Population(population.to_records()).to_records() == population.to_records()
+
+def test_minhash_index_finds_near_duplicates():
+    """Test near-duplicates are found and distinct prompts are not."""
+    index = MinHashIndex(threshold=0.8)
+    index.add("seed", SEED)
+
+    assert index.query(SEED) == "seed"
+    assert index.query(SEED.replace("trends", "trend")) == "seed"
+    assert index.query("↹ user•query\n⊕ rank => top•k\nΣ answer") is None
+
+    with pytest.raises(ValueError):
+        MinHashIndex(num_perm=64, bands=10)
+
+def test_evolve_rejects_near_duplicates_before_scoring():
+    """Test copies and near-duplicates are never evaluated but small edits of the parent are."""
+    test_cases = [{"input": "a", "expected": "b"}]
+    evolver = PromptEvolver(lm=Mock(), population_size=4, mutation_rate=1.0,
+                            fitness_type='task', test_cases=test_cases)
+    evolver.evaluator = Mock(return_value=SimpleNamespace(matches="yes"))
+    one_edit = SEED.replace("trends", "trend")
+    distinct = "↹ user•query\n⊕ rank => top•k\nΣ answer"
+    evolver._generate_variants = Mock(return_value=[SEED + " ", one_edit, one_edit + "  ", distinct])
+
+    result = evolver.evolve(SEED, n_generations=1)
+
+    assert result['near_duplicates'] == 2
+    # The seed, the one-edit mutation and the distinct variant
+    assert evolver.evaluator.call_count == 3
+    assert {p['prompt'] for p in result['lineage'][1]['population']} <= {SEED, one_edit, distinct}
+
+def test_near_duplicates_of_other_individuals_are_rejected():
+    """Test only a variant's own parents are left out of the comparison."""
+    evolver = PromptEvolver(lm=Mock())
+    other = "↹ user•query\n⊕ rank => top•k\nΣ answer"
+    population = Population([{'prompt': SEED, 'fitness': {}}, {'prompt': other, 'fitness': {}}])
+    variant = other.replace("answer", "answers")
+
+    assert evolver._reject_near_duplicates([variant], population, {variant: {SEED}}) == []
+    assert evolver._reject_near_duplicates([variant], population, {variant: {other}}) == [variant]
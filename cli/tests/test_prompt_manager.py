@@ -0,0 +1,74 @@
+"""Tests for prompt storage."""
+import pytest
+
+from synthlang.core.prompt_manager import PromptManager
+
+@pytest.fixture(params=["json", "sqlite"])
+def manager(request, tmp_path):
+    """Prompt manager for each storage backend."""
+    return PromptManager(storage_dir=str(tmp_path), backend=request.param)
+
+def test_save_load_delete(manager):
+    """Test prompts round-trip through the backend."""
+    manager.save("alpha", "↹ data", {"fitness": {"overall": 0.8}, "tags": ["a"]})
+    data = manager.load("alpha")
+    assert data["prompt"] == "↹ data"
+    assert data["metadata"]["fitness"]["overall"] == 0.8
+    assert "created" in data["metadata"]
+
+    manager.save("beta", "⊕ step")
+    assert [p["name"] for p in manager.list()] == ["alpha", "beta"]
+
+    manager.delete("alpha")
+    with pytest.raises(FileNotFoundError):
+        manager.load("alpha")
+    with pytest.raises(FileNotFoundError):
+        manager.delete("alpha")
+
+def test_migrate_json_to_sqlite(tmp_path):
+    """Test migration copies prompts and switches backends."""
+    json_manager = PromptManager(storage_dir=str(tmp_path), backend="json")
+    json_manager.save("alpha", "↹ data", {"fitness": 0.5})
+    json_manager.save("beta", "⊕ step", {"tags": "x,y"})
+
+    assert json_manager.migrate() == 2
+    assert json_manager.backend == "sqlite"
+
+    # New managers pick up the migrated store automatically
+    manager = PromptManager(storage_dir=str(tmp_path))
+    assert manager.backend == "sqlite"
+    assert manager.load("beta")["prompt"] == "⊕ step"
+    assert (tmp_path / "alpha.json").exists()
+
+def test_unknown_backend(tmp_path):
+    """Test invalid backend names are rejected."""
+    with pytest.raises(ValueError):
+        PromptManager(storage_dir=str(tmp_path), backend="lmdb")
+
+def test_list_metadata_filters_sorts_and_pages(manager):
+    """Test listing is answered from the metadata index."""
+    manager.save("alpha", "↹ a", {"fitness": {"overall": 0.9}, "tags": ["prod"]})
+    manager.save("beta", "↹ b", {"fitness": 0.4})
+    manager.save("gamma", "↹ c", {"fitness": {"overall": 0.7}, "tags": "prod,beta"})
+    manager.save("delta", "↹ d")
+
+    by_fitness = manager.list_metadata(sort="fitness")
+    assert [p["name"] for p in by_fitness] == ["alpha", "gamma", "beta", "delta"]
+    assert by_fitness[0]["fitness"] == 0.9
+
+    assert [p["name"] for p in manager.list_metadata(sort="fitness", limit=2, offset=1)] == ["gamma", "beta"]
+    assert [p["name"] for p in manager.list_metadata(min_fitness=0.7)] == ["alpha", "gamma"]
+    assert [p["name"] for p in manager.list_metadata(tag="prod")] == ["alpha", "gamma"]
+    assert manager.list_metadata(since="2999-01-01") == []
+    assert len(manager.list_metadata(since="2000-01-01")) == 4
+
+def test_json_index_reconciles_external_changes(tmp_path):
+    """Test the JSON index picks up files added or removed outside the store."""
+    manager = PromptManager(storage_dir=str(tmp_path), backend="json")
+    manager.save("alpha", "↹ a", {"fitness": 0.5})
+    (tmp_path / "alpha.json").rename(tmp_path / "beta.json")
+    # Rewrite the name inside the moved file
+    (tmp_path / "beta.json").write_text((tmp_path / "beta.json").read_text().replace('"alpha"', '"beta"'))
+
+    fresh = PromptManager(storage_dir=str(tmp_path), backend="json")
+    assert [p["name"] for p in fresh.list_metadata()] == ["beta"]
@@ -0,0 +1,57 @@
+"""Tests for racing evaluation of variants."""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.evolver import PromptEvolver
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+GOOD = "↹ data•source\n⊕ filter>5 => subset\n⊕ rank => top\nΣ report + trends"
+BAD = ["↹ x\nΣ y", "↹ a\nΣ b", "↹ c\nΣ d"]
+# Fails most test cases but is far more specific than the seed
+RICH = "↹ a•b•c•d•e\n⊕ x>1 => y => z => w\n⊕ p<2 => q ^ r\nΣ out + k"
+TEST_CASES = [{"input": str(i), "expected": "ok"} for i in range(100)]
+
+def evaluate(prompt, test_input, expected):
+    """Seed passes 90% of cases, GOOD all of them, the rest 10%."""
+    hard = int(test_input) % 10 == 0
+    passes = prompt == GOOD or (prompt == SEED) != hard
+    return SimpleNamespace(matches="yes" if passes else "no")
+
+def run(racing, fitness_type='task', variants=BAD + [GOOD]):
+    evolver = PromptEvolver(lm=Mock(), population_size=4, mutation_rate=1.0, fitness_type=fitness_type,
+                            test_cases=TEST_CASES, random_seed=0, racing=racing)
+    evolver.evaluator = Mock(side_effect=evaluate)
+    evolver._generate_variants = Mock(return_value=list(variants))
+    return evolver.evolve(SEED, n_generations=1), evolver.evaluator.call_count
+
+def test_racing_drops_losers_early_and_counts_evaluations():
+    """Test losing variants stop after the first round and winners get exact scores."""
+    full, full_calls = run(False)
+    raced, raced_calls = run(True)
+
+    assert full['eval_calls'] == full_calls == 500
+    # Seed on all 100, three losers on 8 cases, the winner on all 100
+    assert raced['eval_calls'] == raced_calls == 100 + 3 * 8 + 100
+    assert raced['racing_dropped'] == 3
+    assert raced['best_prompt'] == full['best_prompt'] == GOOD
+    assert raced['fitness'] == full['fitness']
+
+@pytest.mark.parametrize("fitness_type", ['clarity', 'specificity', 'hybrid'])
+def test_racing_follows_overall_fitness(fitness_type):
+    """Test racing only drops variants that couldn't beat their parent's overall fitness."""
+    full, full_calls = run(False, fitness_type, BAD + [RICH])
+    raced, raced_calls = run(True, fitness_type, BAD + [RICH])
+
+    assert raced['best_prompt'] == full['best_prompt']
+    assert raced['fitness'] == full['fitness']
+    if fitness_type == 'hybrid':
+        # RICH wins on specificity despite its task score; the losers are dropped early
+        assert raced['best_prompt'] == RICH
+        assert raced['racing_dropped'] == 3
+        assert raced_calls < full_calls
+    else:
+        # The task score doesn't affect overall fitness, so nothing is raced
+        assert raced['racing_dropped'] == 0
+        assert raced_calls == full_calls
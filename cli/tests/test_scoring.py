@@ -0,0 +1,56 @@
+"""Tests for vectorized heuristic scoring."""
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.evolver import PromptEvolver
+
+from synthlang.core.parser import features, parse
+from synthlang.core.scoring import FEATURES, count_features, heuristic_scores, rank_prompts
+
+PROMPTS = [
+    "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends",
+    "↹ news•feed•google\n⊕ sentiment>0 => pos\n⊕ sentiment<0 => neg\nΣ trend + factors",
+    "⊕ a => b",
+    "plain text",
+    "",
+]
+
+def test_counts_match_parser():
+    """Test vectorized counts agree with the parser on well-formed prompts."""
+    counts = count_features(PROMPTS)
+    for i, prompt in enumerate(PROMPTS):
+        expected = features(parse(prompt))
+        assert {name: counts[name][i] for name in FEATURES} == expected
+
+def test_exact_scores_follow_the_parser_on_malformed_prompts():
+    """Test exact counting uses the AST where raw character counts diverge."""
+    malformed = ["↹ data•\nΣ report", "↹ a ⊕ b\nΣ c"]
+    counts = heuristic_scores(malformed, exact=True)
+    for i, prompt in enumerate(malformed):
+        expected = features(parse(prompt))
+        assert {name: counts[name][i] for name in FEATURES} == expected
+    assert counts['process'][1] != count_features(malformed)['process'][1]
+
+def test_transform_does_not_span_prompts():
+    """Test '=' ending one prompt and '>' starting the next is not a transform."""
+    counts = count_features(["↹ a =", "> b"])
+    assert counts['transforms'].tolist() == [0.0, 0.0]
+    assert counts['operators'].tolist() == [0.0, 1.0]
+
+def test_rank_prompts_best_first():
+    """Test ranking orders prompts by overall score with stable ties."""
+    ranked = rank_prompts(PROMPTS)
+    assert [r['index'] for r in ranked] == [1, 0, 2, 3, 4]
+    scores = heuristic_scores(PROMPTS)
+    assert ranked[0]['specificity'] == pytest.approx(scores['specificity'][1])
+    assert ranked[-1]['overall'] == 0.0
+
+def test_rank_prompts_agrees_with_evolver_on_malformed_prompts():
+    """Test the score command and evolution give a malformed prompt the same scores."""
+    malformed = ["↹ data•\n⊕ a => b Σ c", "↹ a ⊕ b\nΣ c"]
+    evolver = PromptEvolver(lm=Mock(), fitness_type='hybrid')
+    for entry in rank_prompts(malformed):
+        fitness = evolver._calculate_fitness(malformed[entry['index']])
+        assert entry['clarity'] == pytest.approx(fitness['clarity'])
+        assert entry['specificity'] == pytest.approx(fitness['specificity'])
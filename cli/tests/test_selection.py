@@ -0,0 +1,89 @@
+"""Tests for parent selection strategies."""
+import math
+import random
+from collections import Counter
+from unittest.mock import Mock
+
+import pytest
+
+from synthlang.core.evolver import PromptEvolver
+from synthlang.core.population import Population
+from synthlang.core.selection import CumulativeIndex, create_selection
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+
+def make_population(n):
+    population = Population()
+    for i in range(n):
+        population.add(f"↹ in{i}\nΣ out{i}", {'overall': i / n})
+    return population
+
+def test_cumulative_index_find():
+    """Test weighted lookup skips zero weights and clamps at the end."""
+    index = CumulativeIndex([1.0, 0.0, 2.0, 1.0])
+    assert [index.find(v) for v in (0.0, 0.99, 1.0, 2.99, 3.0, 3.99, 4.0)] == [0, 0, 2, 2, 3, 3, 3]
+
+@pytest.mark.parametrize("n,k", [(6, 3), (5, 1), (4, 4), (2, 5)])
+def test_tournament_winner_distribution_is_exact(n, k):
+    """Test the rank weights equal the odds of winning a k-way tournament."""
+    strategy = create_selection('tournament', tournament_size=k)
+    strategy.prepare(make_population(n))
+    k = min(k, n)
+    cumulative = strategy.index.cumulative
+    probabilities = [b - a for a, b in zip([0.0] + cumulative, cumulative)]
+    expected = [math.comb(n - 1 - r, k - 1) / math.comb(n, k) for r in range(n)]
+    assert probabilities == pytest.approx(expected)
+
+@pytest.mark.parametrize("name", ['tournament', 'rank', 'proportional', 'elitism'])
+def test_strategies_favour_fitter_prompts(name):
+    """Test every strategy picks the best prompt more often than the worst."""
+    strategy = create_selection(name)
+    strategy.prepare(make_population(10))
+    rng = random.Random(0)
+    counts = Counter(strategy.select(rng)['prompt'] for _ in range(2000))
+    assert counts["↹ in9\nΣ out9"] > counts["↹ in0\nΣ out0"]
+
+def pick_probabilities(name, population):
+    """Chance of picking each prompt, with copies suffixed ' #j' merged."""
+    strategy = create_selection(name)
+    strategy.prepare(population)
+    picked = strategy.individuals if name == 'proportional' else strategy.ranked
+    cumulative = strategy.index.cumulative
+    chances = Counter()
+    for individual, low, high in zip(picked, [0.0] + cumulative, cumulative):
+        chances[individual['prompt'].split(" #")[0]] += (high - low) / strategy.index.total
+    return chances
+
+@pytest.mark.parametrize("name", ['tournament', 'rank', 'proportional'])
+def test_selection_weights_individuals_by_count(name):
+    """Test a counted population is sampled like one listing every copy."""
+    counts = [1, 3, 2, 1, 4]
+    counted = Population()
+    expanded = Population()
+    for i, count in enumerate(counts):
+        fitness = {'overall': (i % 3) / 3}
+        counted.add(f"↹ in{i}\nΣ out{i}", fitness, count=count)
+        for j in range(count):
+            expanded.add(f"↹ in{i}\nΣ out{i} #{j}", fitness)
+
+    expected = pick_probabilities(name, expanded)
+    assert pick_probabilities(name, counted) == pytest.approx(expected)
+
+def test_elitism_carries_best_prompt_over():
+    """Test elites survive unchanged into the next generation."""
+    strategy = create_selection('elitism', elite=2)
+    strategy.prepare(make_population(5))
+    assert [p['prompt'] for p in strategy.elites()] == ["↹ in4\nΣ out4", "↹ in3\nΣ out3"]
+
+    evolver = PromptEvolver(lm=Mock(), population_size=4, mutation_rate=1.0,
+                            selection='elitism', random_seed=0)
+    evolver._generate_variants = Mock(side_effect=lambda prompt, count: [
+        prompt + f"\n⊕ step{i}•{prompt.count(chr(10))} => out" for i in range(count)
+    ])
+    result = evolver.evolve(SEED, n_generations=3)
+    for previous, current in zip(result['lineage'], result['lineage'][1:]):
+        best = max(previous['population'], key=lambda p: p['fitness']['overall'])
+        assert best['prompt'] in {p['prompt'] for p in current['population']}
+
+    with pytest.raises(ValueError):
+        create_selection('roulette')
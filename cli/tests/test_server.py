@@ -0,0 +1,125 @@
+"""Tests for the SynthLang daemon."""
+import socket
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from synthlang.cli import main
+from synthlang.server import DaemonClient, ServiceError, SynthLangService, create_server
+
+@pytest.fixture
+def service(tmp_path):
+    """Service with stubbed module calls."""
+    service = SynthLangService(lm=Mock(), max_concurrency=2, prompt_storage_dir=str(tmp_path))
+    service.translator.translate = lambda source, instructions=None: {
+        "source": source, "target": f"↹ {source}", "explanation": "stub"
+    }
+    service.generator.generate = lambda task: {"prompt": task, "rationale": "", "metadata": {}}
+    service.runner.retry_delay = 0
+    return service
+
+@pytest.fixture
+def client(service):
+    """Client connected to a daemon on a free port."""
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield DaemonClient(f"http://127.0.0.1:{server.server_address[1]}")
+    server.shutdown()
+    server.server_close()
+
+def test_daemon_single_and_batch(client):
+    """Test single and batched requests round-trip through the daemon."""
+    assert "translate" in client.health()["operations"]
+    assert client.translate("data")["target"] == "↹ data"
+
+    results = client.call_batch("translate", [{"source": "a"}, {"source": "b"}, {}])
+    assert [r.get("result", {}).get("target") for r in results[:2]] == ["↹ a", "↹ b"]
+    assert "KeyError" in results[2]["error"]
+
+    with pytest.raises(ServiceError, match="Unknown operation"):
+        client.call("missing")
+    with pytest.raises(ServiceError, match="Invalid arguments"):
+        client.call("generate")
+
+def test_batch_rejects_bad_items_without_retrying(service):
+    """Test items missing arguments fail at once while valid items still run."""
+    service.runner.retry_delay = 10
+    start = time.perf_counter()
+    result = service.handle("translate", {"items": [{}, {"source": "a"}, "b"]})
+
+    assert time.perf_counter() - start < 1
+    assert [r.get("error", "").split(":")[0] for r in result["results"]] == ["KeyError", "", "TypeError"]
+    assert result["results"][1]["result"]["target"] == "↹ a"
+
+def test_create_server_only_replaces_stale_sockets(service, tmp_path):
+    """Test a dead socket is replaced but live sockets and other files are kept."""
+    path = str(tmp_path / "d.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    server = create_server(service, socket_path=path)
+
+    with pytest.raises(OSError, match="already listening"):
+        create_server(service, socket_path=path)
+    server.server_close()
+
+    regular = tmp_path / "notes.txt"
+    regular.write_text("keep me")
+    with pytest.raises(OSError, match="not a socket"):
+        create_server(service, socket_path=str(regular))
+    assert regular.read_text() == "keep me"
+
+def test_daemon_limits_concurrency(service):
+    """Test model calls are capped across concurrent batch items."""
+    lock = threading.Lock()
+    active = {'now': 0, 'peak': 0}
+
+    def translate(source, instructions=None):
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        time.sleep(0.02)
+        with lock:
+            active['now'] -= 1
+        return {"target": source}
+
+    service.translator.translate = translate
+    service.runner.workers = 8
+    response = service.handle("translate", {"items": [{"source": str(i)} for i in range(8)]})
+    assert len(response["results"]) == 8
+    assert active['peak'] <= 2
+
+def test_cli_forwards_to_daemon(client, monkeypatch):
+    """Test the CLI uses the daemon without loading config or an API key."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    runner = CliRunner()
+    result = runner.invoke(main, [
+        "--daemon", client.url,
+        "translate", "--source", "data", "--framework", "synthlang"
+    ])
+    assert result.exit_code == 0, result.output
+    assert "↹ data" in result.output
+
+def test_cli_classify_through_daemon(client, monkeypatch):
+    """Test classifiers built on request threads don't reconfigure DSPy."""
+    import synthlang.core.base
+    from synthlang.core.classifier import PromptClassifier
+
+    def configure(**kwargs):
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError("dspy.settings can only be changed by the thread that initially configured it")
+
+    monkeypatch.setattr(synthlang.core.base.dspy, "configure", configure)
+    monkeypatch.setattr(PromptClassifier, "classify", lambda self, text: {
+        "input": text, "label": self.finetuner.labels[0], "explanation": "stub"
+    })
+    result = CliRunner().invoke(main, [
+        "--daemon", client.url,
+        "classify", "predict", "--text", "refund please", "--labels", "billing,other"
+    ])
+    assert result.exit_code == 0, result.output
+    assert "Label: billing" in result.output
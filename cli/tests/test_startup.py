@@ -0,0 +1,79 @@
+"""Startup-time regression tests for commands that never call a model."""
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Modules that must not be imported by LM-free commands
+HEAVY_MODULES = ["dspy", "litellm", "numpy"]
+
+# Wall-clock budget for importing the CLI and running one command
+IMPORT_BUDGET_SECONDS = 1.5
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from click.testing import CliRunner
+from synthlang.cli import main
+result = CliRunner().invoke(main, sys.argv[1:])
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "exit_code": result.exit_code,
+    "output": result.output,
+    "elapsed": elapsed,
+    "heavy": [m for m in %r if m in sys.modules]
+}))
+""" % HEAVY_MODULES
+
+def run_cli(args, tmp_path):
+    """Run the CLI in a fresh interpreter and return its report."""
+    package_root = Path(__file__).resolve().parents[1]
+    env = {"HOME": str(tmp_path), "PYTHONPATH": str(package_root), "PATH": ""}
+    proc = subprocess.run(
+        [sys.executable, "-c", SCRIPT, *args],
+        capture_output=True, text=True, env=env, cwd=str(tmp_path), timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+@pytest.mark.parametrize("args", [
+    ["--version"],
+    ["config", "show"],
+    ["prompt", "list"],
+])
+def test_lm_free_commands_skip_ml_stack(args, tmp_path):
+    """Test LM-free commands don't import DSPy and stay within the budget."""
+    report = run_cli(args, tmp_path)
+
+    assert report["exit_code"] == 0, report["output"]
+    assert report["heavy"] == []
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
+
+@pytest.fixture
+def daemon_url(tmp_path):
+    """URL of a daemon with a stubbed translator."""
+    from synthlang.server import SynthLangService, create_server
+
+    service = SynthLangService(lm=Mock(), prompt_storage_dir=str(tmp_path))
+    service.translator.translate = lambda source, instructions=None: {
+        "source": source, "target": f"↹ {source}", "explanation": "stub"
+    }
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def test_forwarded_commands_skip_ml_stack(daemon_url, tmp_path):
+    """Test commands forwarded to the daemon don't import DSPy themselves."""
+    report = run_cli(["--daemon", daemon_url, "translate", "--source", "data",
+                      "--framework", "synthlang"], tmp_path)
+
+    assert report["exit_code"] == 0, report["output"]
+    assert "↹ data" in report["output"]
+    assert report["heavy"] == []
@@ -0,0 +1,91 @@
+"""Tests for the surrogate task-fitness model."""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from synthlang.core.evolver import PromptEvolver
+from synthlang.core.scoring import count_features
+from synthlang.core.surrogate import SurrogateModel
+
+SEED = "↹ data•source\n⊕ filter>5 => subset\nΣ report + trends"
+
+def test_surrogate_learns_incrementally():
+    """Test predictions start once trained and track their error."""
+    prompts = [f"↹ a{'•b' * (i % 4)}\nΣ c" for i in range(12)]
+    features = SurrogateModel.design(count_features(prompts))
+    targets = [(i % 4) / 4 for i in range(12)]
+    model = SurrogateModel(ridge=1e-6, min_samples=4)
+
+    assert model.predict(features) is None
+    model.update(features[:4], targets[:4])
+    predicted = model.predict(features[4:])
+    assert predicted == pytest.approx(targets[4:], abs=1e-3)
+    model.update(features[4:], targets[4:], predicted)
+    assert model.mean_absolute_error == pytest.approx(0.0, abs=1e-3)
+
+    restored = SurrogateModel(ridge=1e-6, min_samples=4)
+    restored.load(model.to_json())
+    assert np.allclose(restored.predict(features), model.predict(features))
+
+def test_evolve_skips_evaluations_predicted_to_lose():
+    """Test the surrogate saves test-case evaluations and reports its accuracy."""
+    test_cases = [{"input": f"case {i}", "expected": "ok"} for i in range(4)]
+
+    def run(surrogate):
+        evolver = PromptEvolver(lm=Mock(), population_size=8, mutation_rate=1.0, fitness_type='task',
+                                test_cases=test_cases, random_seed=0, surrogate=surrogate)
+        # Only prompts with joins pass the test cases
+        evolver.evaluator = Mock(side_effect=lambda prompt, test_input, expected: SimpleNamespace(
+            matches="yes" if "•" in prompt else "no"
+        ))
+        counter = iter(range(10000))
+        evolver._generate_variants = Mock(side_effect=lambda prompt, count: [
+            f"↹ in{n}{'•x' if n % 2 else ''}\nΣ out{n}" for n in (next(counter) for _ in range(count))
+        ])
+        return evolver.evolve(SEED, n_generations=4), evolver.evaluator.call_count
+
+    baseline, baseline_calls = run(False)
+    screened, screened_calls = run(True)
+
+    assert baseline['surrogate_skipped'] == 0
+    assert baseline['surrogate_mae'] is None
+    assert screened['surrogate_skipped'] > 0
+    assert screened_calls == baseline_calls - screened['surrogate_skipped'] * len(test_cases)
+    assert screened['surrogate_mae'] < 0.25
+    assert screened['fitness']['task_score'] == baseline['fitness']['task_score'] == 1.0
+
+def specific_variant(n):
+    """Early variants teach the surrogate that joins fail the test cases; later ones are far more specific."""
+    if n >= 24:
+        return f"↹ in{n}" + "•x" * 7 + f"\n⊕ a>1 => b\nΣ out{n} + k"
+    return f"↹ in{n}•x\nΣ out{n}" if n % 2 else f"↹ in{n}\n⊕ a>1 => b\nΣ out{n} + k"
+
+@pytest.mark.parametrize("fitness_type", ['specificity', 'hybrid'])
+def test_surrogate_screen_follows_overall_fitness(fitness_type):
+    """Test the surrogate never skips a variant that would beat its parent overall."""
+    test_cases = [{"input": f"case {i}", "expected": "ok"} for i in range(4)]
+
+    def run(surrogate):
+        evolver = PromptEvolver(lm=Mock(), population_size=8, mutation_rate=1.0, fitness_type=fitness_type,
+                                test_cases=test_cases, random_seed=0, surrogate=surrogate)
+        evolver.evaluator = Mock(side_effect=lambda prompt, test_input, expected: SimpleNamespace(
+            matches="no" if "•" in prompt else "yes"
+        ))
+        counter = iter(range(10000))
+        evolver._generate_variants = Mock(side_effect=lambda prompt, count: [
+            specific_variant(next(counter)) for _ in range(count)
+        ])
+        # The seed passes every test case, yet loses to the specific variants overall
+        return evolver.evolve("↹ data\n⊕ filter>5 => subset\nΣ report + trends", n_generations=4)
+
+    baseline, screened = run(False), run(True)
+
+    assert screened['best_prompt'] == baseline['best_prompt'] == specific_variant(24)
+    assert screened['fitness'] == baseline['fitness']
+    if fitness_type == 'specificity':
+        # The task score can't change a specificity comparison, so nothing is screened
+        assert screened['surrogate_skipped'] == 0
+    else:
+        assert screened['surrogate_skipped'] > 0